@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_PAGE_SIZE = 0x1000
+DEFAULT_CACHE_SIZE = 4 * 1024 * 1024
+
+
+class PageCache:
+    """A bounded least recently used (LRU) cache of fixed size pages.
+
+    Reads are split into pages of ``page_size`` bytes, which are loaded with ``load`` on a miss. Once more than
+    ``size`` bytes worth of pages are cached, the least recently used pages are evicted. Reads spanning more than
+    half of the cache are passed to ``load`` directly, so they don't evict everything else.
+
+    Args:
+        load: A callable that reads ``size`` bytes at the given offset, e.g. ``load(offset, size)``.
+        page_size: The size of a single page.
+        size: The maximum number of bytes to cache.
+    """
+
+    def __init__(
+        self, load: Callable[[int, int], bytes], page_size: int = DEFAULT_PAGE_SIZE, size: int = DEFAULT_CACHE_SIZE
+    ):
+        if page_size <= 0:
+            raise ValueError(f"Invalid page size: {page_size:#x}")
+
+        self.load = load
+        self.page_size = page_size
+        self.max_pages = max(1, size // page_size)
+
+        self.hits = 0
+        self.misses = 0
+
+        self._pages: OrderedDict[int, bytes] = OrderedDict()
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"<PageCache page_size={self.page_size:#x} pages={len(self)}/{self.max_pages} hits={self.hits} misses={self.misses}>"  # noqa: E501
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def read(self, offset: int, size: int) -> bytes:
+        """Read ``size`` bytes at the given offset, using cached pages where possible.
+
+        Args:
+            offset: The offset to read from.
+            size: The number of bytes to read.
+        """
+        if size <= 0:
+            return b""
+
+        page_size = self.page_size
+        first = offset // page_size
+        last = (offset + size - 1) // page_size
+        start = offset - (first * page_size)
+
+        if first == last:
+            return self._page(first)[start : start + size]
+
+        if last - first + 1 > max(1, self.max_pages // 2):
+            return self.load(offset, size)
+
+        data = b"".join(self._page(index) for index in range(first, last + 1))
+        return data[start : start + size]
+
+    def clear(self) -> None:
+        """Remove all cached pages and reset the counters."""
+        with self._lock:
+            self._pages.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _page(self, index: int) -> bytes:
+        """Return the page with the given index, loading it if it's not cached."""
+        with self._lock:
+            if (data := self._pages.get(index)) is not None:
+                self._pages.move_to_end(index)
+                self.hits += 1
+                return data
+
+        # Load outside of the lock, worst case another thread loads the same page concurrently
+        data = self.load(index * self.page_size, self.page_size)
+
+        with self._lock:
+            self.misses += 1
+            self._pages[index] = data
+            self._pages.move_to_end(index)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+
+        return data
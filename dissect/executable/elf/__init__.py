@@ -1,5 +1,8 @@
 from dissect.executable.elf.elf import (
     ELF,
+    DynamicTable,
+    GnuHashTable,
+    HashTable,
     Section,
     SectionTable,
     Segment,
@@ -11,6 +14,9 @@ from dissect.executable.elf.elf import (
 
 __all__ = [
     "ELF",
+    "DynamicTable",
+    "GnuHashTable",
+    "HashTable",
     "Section",
     "SectionTable",
     "Segment",
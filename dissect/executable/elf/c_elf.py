@@ -216,13 +216,24 @@ enum Elf_Type : uint16 {
 #define DT_DEBUG        21
 #define DT_TEXTREL      22
 #define DT_JMPREL       23
+#define DT_BIND_NOW     24
+#define DT_INIT_ARRAY   25
+#define DT_FINI_ARRAY   26
+#define DT_INIT_ARRAYSZ 27
+#define DT_FINI_ARRAYSZ 28
+#define DT_RUNPATH      29
+#define DT_FLAGS        30
 #define DT_ENCODING     32
+#define DT_PREINIT_ARRAY 32
+#define DT_PREINIT_ARRAYSZ 33
+#define DT_SYMTAB_SHNDX 34
 #define OLD_DT_LOOS     0x60000000
 #define DT_LOOS         0x6000000d
 #define DT_HIOS         0x6ffff000
 #define DT_VALRNGLO     0x6ffffd00
 #define DT_VALRNGHI     0x6ffffdff
 #define DT_ADDRRNGLO    0x6ffffe00
+#define DT_GNU_HASH     0x6ffffef5
 #define DT_ADDRRNGHI    0x6ffffeff
 #define DT_VERSYM       0x6ffffff0
 #define DT_RELACOUNT    0x6ffffff9
@@ -282,7 +293,8 @@ enum SHT : uint32 {
     REL                 = 9,   /* Relocation (no addend) */
     SHLIB               = 10,
     DYNSYM              = 11,
-    NUM                 = 12
+    NUM                 = 12,
+    GNU_HASH            = 0x6ffffff6   /* GNU-style hash table */
 };
 
 /* sh_flags */
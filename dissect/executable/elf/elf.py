@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import io
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
 from functools import cached_property, lru_cache
 from operator import itemgetter
-from typing import TYPE_CHECKING, BinaryIO, Generic, TypeVar
+from typing import TYPE_CHECKING, BinaryIO, Generic, NamedTuple, TypeVar
 
 from dissect.executable.elf.c_elf import (
+    PT,
     SHN,
     SHT,
     STB,
@@ -16,20 +23,37 @@ from dissect.executable.elf.c_elf import (
     c_elf_32,
     c_elf_64,
 )
-from dissect.executable.exception import InvalidSignatureError
+from dissect.executable.entropy import DEFAULT_WINDOW_SIZE, ENTROPY_CHUNK_SIZE, entropy, entropy_curve
+from dissect.executable.exception import Error, InvalidSignatureError
+from dissect.executable.source import Source
+from dissect.executable.strings import ASCII, DEFAULT_MIN_LENGTH, UTF16LE, String, strings
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+    from types import TracebackType
 
     from dissect.cstruct import cstruct
+    from typing_extensions import Self
+
+
+NUL = re.compile(b"\x00")
+STRING_CACHE_SIZE = 256
 
 
 class ELF:
-    def __init__(self, fh: BinaryIO):
-        self.fh = fh
+    def __init__(self, fh: BinaryIO | Source):
+        self.source = Source.wrap(fh)
+        self.fh = self.source.fh
 
-        fh.seek(0)
-        self.e_ident = fh.read(0x10)
+        self.e_ident = self.source.read_at(0, 0x10)
 
         if self.e_ident[:4] != c_common_elf.ELFMAG:
             raise InvalidSignatureError(
@@ -45,8 +69,7 @@ class ELF:
         is_little = self.e_ident[c_common_elf.EI_DATA] == c_common_elf.ELFDATA2LSB
         self.c_elf.endian = "<" if is_little else ">"
 
-        fh.seek(0)
-        self.header = self.c_elf.Ehdr(fh)
+        self.header = self.c_elf.Ehdr(self.source.read_at(0, len(self.c_elf.Ehdr)))
 
         self.segments = SegmentTable.from_elf(self)
         self.sections = SectionTable.from_elf(self)
@@ -55,6 +78,34 @@ class ELF:
     def __repr__(self) -> str:
         return str(self.header)
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    @classmethod
+    def from_path(cls, path: str | Path, mmap: bool = False) -> ELF:
+        """Open an ELF file by path.
+
+        Args:
+            path: The path of the ELF file.
+            mmap: Whether to memory map the file. Section and segment data is then served directly
+                  from the mapping without copying.
+        """
+        source = Source.from_path(path, mmap=mmap)
+        try:
+            return cls(source)
+        except Exception:
+            source.close()
+            raise
+
+    def close(self) -> None:
+        """Close the underlying file, if it was opened by :meth:`from_path`."""
+        self.source.close()
+
     def dump(self) -> bytes:
         output_data = [
             self.segments.dump_table(),
@@ -82,6 +133,84 @@ class ELF:
 
         return b"".join(result)
 
+    def strings(
+        self, min_length: int = DEFAULT_MIN_LENGTH, encodings: Iterable[str] = (ASCII, UTF16LE), raw: bool = False
+    ) -> Iterator[String]:
+        """Lazily extract printable ASCII and UTF-16LE strings, tagged with the section containing them.
+
+        By default the data of every section that is present in the file is scanned. With ``raw`` the whole file is
+        scanned instead. The address of every string is its file offset.
+
+        Args:
+            min_length: The minimum number of characters of a string.
+            encodings: The encodings to extract, ``"ascii"`` and/or ``"utf-16-le"``.
+            raw: Whether to scan the whole file instead of the sections.
+        """
+        sections = sorted(
+            (section for section in self.sections if section.type != SHT.NOBITS and section.size),
+            key=lambda section: section.offset,
+        )
+
+        if not raw:
+            for section in sections:
+                yield from section.strings(min_length, encodings)
+            return
+
+        starts = [section.offset for section in sections]
+        for string in strings(self.source.open(), min_length, encodings):
+            idx = bisect_right(starts, string.address) - 1
+            if idx >= 0 and string.address < sections[idx].offset + sections[idx].size:
+                string = string._replace(section=sections[idx])
+            yield string
+
+    def dynamic_symbol(self, name: str) -> Symbol | None:
+        """Return the defined dynamic symbol with the given name, if any.
+
+        The GNU or SysV hash table is used if available, so only the few symbols in the matching hash chain are
+        decoded. Otherwise the dynamic symbol table is indexed by name.
+
+        Args:
+            name: The name of the symbol to look up.
+        """
+        if (table := self._hash_table) is not None:
+            return table.lookup(name)
+
+        for table in self.sections.by_type(SHT.DYNSYM):
+            for symbol in table.lookup(name):
+                if symbol.shndx != SHN.UNDEF:
+                    return symbol
+        return None
+
+    @cached_property
+    def dynamic_table(self) -> DynamicTable | None:
+        """The dynamic table, from the ``.dynamic`` section or the ``PT_DYNAMIC`` segment if there are no sections."""
+        if sections := self.sections.by_type(SHT.DYNAMIC):
+            section = sections[0]
+            strings = section.link if isinstance(section.link, StringTable) else None
+            return DynamicTable(self, section.data, strings)
+
+        if segments := self.segments.by_type(PT.DYNAMIC):
+            return DynamicTable(self, segments[0].data)
+
+        return None
+
+    def vaddr_to_offset(self, address: int) -> int | None:
+        """Translate a virtual address to a file offset using the loadable segments, if it's backed by the file.
+
+        Args:
+            address: The virtual address to translate.
+        """
+        for segment in self.segments.by_type(PT.LOAD):
+            if segment.virtual_address <= address < segment.virtual_address + segment.size:
+                return segment.offset + address - segment.virtual_address
+        return None
+
+    @cached_property
+    def _hash_table(self) -> GnuHashTable | HashTable | None:
+        # Prefer the GNU hash table, which has a bloom filter to quickly reject names that are not present
+        tables = self.sections.by_type(SHT.GNU_HASH) or self.sections.by_type(SHT.HASH)
+        return tables[0] if tables else None
+
     @property
     def dynamic(self) -> bool:
         return self.header.e_type == Elf_Type.ET_DYN
@@ -112,12 +241,19 @@ class Table(Generic[T]):
 
 
 class Section:
-    def __init__(self, fh: BinaryIO, idx: int | None = None, c_elf: cstruct = c_elf_64):
-        self.fh = fh
+    def __init__(
+        self,
+        fh: BinaryIO | Source,
+        idx: int | None = None,
+        c_elf: cstruct = c_elf_64,
+        header: c_elf_64.Shdr | c_elf_32.Shdr | None = None,
+    ):
+        self.source = Source.wrap(fh)
+        self.fh = self.source.fh
         self.idx = idx
 
         self.c_elf = c_elf
-        self.header = self.c_elf.Shdr(self.fh)
+        self.header = header if header is not None else self.c_elf.Shdr(self.fh)
         self.type = self.header.sh_type
         self.entry_size = self.header.sh_entsize
         self.alignment = self.header.sh_addralign
@@ -143,7 +279,8 @@ class Section:
 
     @classmethod
     def from_section_table(cls, table: SectionTable, idx: int) -> Section:
-        result = cls(table.fh, idx=idx, c_elf=table.c_elf)
+        header = table.c_elf.Shdr(table.source.read_at(table.offset + table.size * idx, len(table.c_elf.Shdr)))
+        result = cls(table.source, idx=idx, c_elf=table.c_elf, header=header)
         result._set_link(table)
 
         if sh_strtab := (result if idx == table._sh_strtab_idx else table._sh_strtab):
@@ -163,15 +300,47 @@ class Section:
         return self._link
 
     @cached_property
-    def data(self) -> bytes:
-        self.fh.seek(self.offset)
-        return self.fh.read(self.size)
+    def data(self) -> bytes | memoryview:
+        if self.source.mapped:
+            return self.source.view(self.offset, self.size)
+        return self.source.read_at(self.offset, self.size)
+
+    def strings(
+        self, min_length: int = DEFAULT_MIN_LENGTH, encodings: Iterable[str] = (ASCII, UTF16LE)
+    ) -> Iterator[String]:
+        """Lazily extract printable ASCII and UTF-16LE strings from the section data, addressed by their file offset.
+
+        Args:
+            min_length: The minimum number of characters of a string.
+            encodings: The encodings to extract, ``"ascii"`` and/or ``"utf-16-le"``.
+        """
+        return strings(self.source.open(self.offset, self.size), min_length, encodings, self.offset, self)
+
+    def entropy(self, chunk_size: int = ENTROPY_CHUNK_SIZE) -> float:
+        """Calculate the Shannon entropy of the section data, in bits per byte.
+
+        Args:
+            chunk_size: The number of bytes to process at a time.
+        """
+        return entropy(self.source.open(self.offset, self.size), chunk_size)
+
+    def entropy_curve(
+        self, window: int = DEFAULT_WINDOW_SIZE, step: int | None = None, chunk_size: int = ENTROPY_CHUNK_SIZE
+    ) -> np.ndarray | array:
+        """Calculate the Shannon entropy of a sliding window over the section data.
+
+        Args:
+            window: The size of every window.
+            step: The distance between the start of consecutive windows. Defaults to ``window``.
+            chunk_size: The number of bytes to process at a time.
+        """
+        return entropy_curve(self.source.open(self.offset, self.size), window, step, chunk_size)
 
 
 class SectionTable(Table[Section]):
     def __init__(
         self,
-        fh: BinaryIO,
+        fh: BinaryIO | Source,
         offset: int,
         num: int,
         size: int,
@@ -179,7 +348,8 @@ class SectionTable(Table[Section]):
         c_elf: cstruct = c_elf_64,
     ):
         super().__init__(num)
-        self.fh = fh
+        self.source = Source.wrap(fh)
+        self.fh = self.source.fh
         self.offset = offset
         self.size = size
         self.c_elf = c_elf
@@ -194,22 +364,24 @@ class SectionTable(Table[Section]):
         return f"<SectionTable offset=0x{self.offset:x} size=0x{self.size:x}>"
 
     def _create_item(self, idx: int) -> Section:
-        self.fh.seek(self.offset + self.size * idx)
-        _, section_type = self.c_elf.uint32[2](self.fh.read(8))
-        self.fh.seek(-8, io.SEEK_CUR)
+        _, section_type = self.c_elf.uint32[2](self.source.read_at(self.offset + self.size * idx, 8))
 
         return_class = Section
         if section_type == SHT.STRTAB:
             return_class = StringTable
         if section_type in [SHT.DYNSYM, SHT.SYMTAB]:
             return_class = SymbolTable
+        if section_type == SHT.HASH:
+            return_class = HashTable
+        if section_type == SHT.GNU_HASH:
+            return_class = GnuHashTable
 
         return return_class.from_section_table(self, idx)
 
     @classmethod
     def from_elf(cls, elf: ELF) -> SectionTable:
         return cls(
-            elf.fh,
+            elf.source,
             elf.header.e_shoff,
             elf.header.e_shnum,
             elf.header.e_shentsize,
@@ -239,12 +411,19 @@ class SectionTable(Table[Section]):
 
 
 class Segment:
-    def __init__(self, fh: BinaryIO, idx: int | None = None, c_elf: cstruct = c_elf_64):
-        self.fh = fh
+    def __init__(
+        self,
+        fh: BinaryIO | Source,
+        idx: int | None = None,
+        c_elf: cstruct = c_elf_64,
+        header: c_elf_64.Phdr | c_elf_32.Phdr | None = None,
+    ):
+        self.source = Source.wrap(fh)
+        self.fh = self.source.fh
         self.idx = idx
         self.c_elf = c_elf
 
-        self.header = c_elf.Phdr(fh)
+        self.header = header if header is not None else c_elf.Phdr(self.fh)
         self.type = self.header.p_type
         self.flags = self.header.p_flags
         self.virtual_address = self.header.p_vaddr
@@ -262,8 +441,8 @@ class Segment:
 
     @classmethod
     def from_segment_table(cls, table: SegmentTable, idx: int | None = None) -> Segment:
-        fh = table.fh
-        return cls(fh, idx, table.c_elf)
+        header = table.c_elf.Phdr(table.source.read_at(table.offset + table.size * idx, len(table.c_elf.Phdr)))
+        return cls(table.source, idx, table.c_elf, header)
 
     @property
     def end(self) -> int:
@@ -273,12 +452,38 @@ class Segment:
         return self.offset <= section.offset < self.end
 
     @property
-    def data(self) -> bytes:
+    def data(self) -> bytes | memoryview:
         if not self._data:
-            self.fh.seek(self.offset)
-            self._data = self.fh.read(self.size)
+            if self.source.mapped:
+                self._data = self.source.view(self.offset, self.size)
+            else:
+                self._data = self.source.read_at(self.offset, self.size)
         return self._data
 
+    def entropy(self, chunk_size: int = ENTROPY_CHUNK_SIZE) -> float:
+        """Calculate the Shannon entropy of the segment data, in bits per byte.
+
+        Args:
+            chunk_size: The number of bytes to process at a time.
+        """
+        return entropy(self._stream(), chunk_size)
+
+    def entropy_curve(
+        self, window: int = DEFAULT_WINDOW_SIZE, step: int | None = None, chunk_size: int = ENTROPY_CHUNK_SIZE
+    ) -> np.ndarray | array:
+        """Calculate the Shannon entropy of a sliding window over the segment data.
+
+        Args:
+            window: The size of every window.
+            step: The distance between the start of consecutive windows. Defaults to ``window``.
+            chunk_size: The number of bytes to process at a time.
+        """
+        return entropy_curve(self._stream(), window, step, chunk_size)
+
+    def _stream(self) -> BinaryIO:
+        # Patched data only exists in memory, otherwise stream it from the file instead of reading it in full
+        return io.BytesIO(self._data) if self.patched else self.source.open(self.offset, self.size)
+
     def _alignment_padding(self, data_length: int) -> bytes:
         padding = 0
         if self.header.p_align > 1:
@@ -292,9 +497,10 @@ class Segment:
 
 
 class SegmentTable(Table[Segment]):
-    def __init__(self, fh: BinaryIO, offset: int, entries: int, size: int, c_elf: cstruct = c_elf_64):
+    def __init__(self, fh: BinaryIO | Source, offset: int, entries: int, size: int, c_elf: cstruct = c_elf_64):
         super().__init__(entries)
-        self.fh = fh
+        self.source = Source.wrap(fh)
+        self.fh = self.source.fh
         self.offset = offset
         self.size = size
         self.c_elf = c_elf
@@ -303,7 +509,6 @@ class SegmentTable(Table[Segment]):
         return f"<SegmentTable offset=0x{self.offset:x} size=0x{self.size:x}>"
 
     def _create_item(self, idx: int) -> Segment:
-        self.fh.seek(self.offset + self.size * idx)
         return Segment.from_segment_table(self, idx)
 
     @classmethod
@@ -312,7 +517,7 @@ class SegmentTable(Table[Segment]):
         offset = header.e_phoff
         entries = header.e_phnum
         size = header.e_phentsize
-        return cls(fh=elf.fh, offset=offset, entries=entries, size=size, c_elf=elf.c_elf)
+        return cls(fh=elf.source, offset=offset, entries=entries, size=size, c_elf=elf.c_elf)
 
     def related_segments(self, section: Section) -> list[Segment]:
         return self.find(lambda x: x.is_related(section))
@@ -333,65 +538,196 @@ class SegmentTable(Table[Segment]):
 
 
 class StringTable(Section):
-    def __init__(self, fh: BinaryIO, idx: int | None = None, c_elf: cstruct = c_elf_64):
-        super().__init__(fh, idx, c_elf)
+    """A table of NUL terminated strings, indexed by offset.
+
+    Strings are located with ``bytes.find`` (or a regular expression search on memory mapped data) starting at the
+    requested offset, so the remainder of the table is never copied. For tables that are looked up in full, such as
+    the string table of a large symbol table, :meth:`split` indexes all strings in one pass.
+
+    Args:
+        cache_size: The maximum number of strings to cache, or ``None`` to cache all strings.
+    """
+
+    def __init__(
+        self,
+        fh: BinaryIO | Source,
+        idx: int | None = None,
+        c_elf: cstruct = c_elf_64,
+        header: c_elf_64.Shdr | c_elf_32.Shdr | None = None,
+        cache_size: int | None = STRING_CACHE_SIZE,
+    ):
+        super().__init__(fh, idx, c_elf, header)
 
-        self._get_string = lru_cache(256)(self._get_string)
+        self._strings: dict[int, bytes] | None = None
+        self.set_cache_size(cache_size)
 
     def __getitem__(self, offset: int) -> str:
         return self._get_string(offset)
 
-    def _get_string(self, index: int) -> str:
+    def set_cache_size(self, cache_size: int | None) -> None:
+        """Set the maximum number of strings to cache, discarding the current cache.
+
+        Args:
+            cache_size: The maximum number of strings to cache, ``None`` to cache all strings or ``0`` to disable
+                        caching.
+        """
+        self._get_string = lru_cache(cache_size)(self._decode_string)
+
+    def split(self) -> None:
+        """Split the whole table into strings at once, so lookups of the start of a string no longer search the data.
+
+        Offsets pointing into the middle of a string (e.g. a shared suffix) are still resolved by searching.
+        """
+        if self._strings is not None:
+            return
+
+        strings = {}
+        offset = 0
+        for value in bytes(self.data).split(b"\x00"):
+            strings[offset] = value
+            offset += len(value) + 1
+        self._strings = strings
+
+    def _decode_string(self, index: int) -> str:
         if index > self.size or index == SHN.UNDEF:
             return None
-        return self.c_elf.char[None](self.data[index:]).decode("utf8")
+
+        if self._strings is not None and (value := self._strings.get(index)) is not None:
+            return value.decode("utf8")
+
+        data = self.data
+        if isinstance(data, bytes):
+            end = data.find(b"\x00", index)
+        else:
+            end = match.start() if (match := NUL.search(data, index)) else -1
+
+        return str(data[index : end if end != -1 else len(data)], "utf8")
+
+
+# The symbol types that are indexed by address
+ADDRESS_SYMBOL_TYPES = (STT.FUNC, STT.OBJECT)
+
+# The fields of a symbol as (name, struct format), in the order they are stored in 32-bit and 64-bit ELF files
+SYM_FIELDS_32 = (
+    ("st_name", "I"),
+    ("st_value", "I"),
+    ("st_size", "I"),
+    ("st_info", "B"),
+    ("st_other", "B"),
+    ("st_shndx", "H"),
+)
+SYM_FIELDS_64 = (
+    ("st_name", "I"),
+    ("st_info", "B"),
+    ("st_other", "B"),
+    ("st_shndx", "H"),
+    ("st_value", "Q"),
+    ("st_size", "Q"),
+)
+
+
+class SymbolColumns(NamedTuple):
+    """The fields of all symbols in a symbol table, stored column-wise.
+
+    Every column is a NumPy array if NumPy is available, or an :class:`array.array` otherwise.
+    """
+
+    name: np.ndarray | array
+    value: np.ndarray | array
+    size: np.ndarray | array
+    info: np.ndarray | array
+    other: np.ndarray | array
+    shndx: np.ndarray | array
 
 
 class Symbol:
     def __init__(self, fh: BinaryIO, idx: int | None = None, c_elf: cstruct = c_elf_64):
-        self.symbol = c_elf.Sym(fh)
+        symbol = c_elf.Sym(fh)
+        self._init(
+            idx,
+            c_elf,
+            symbol.st_name,
+            symbol.st_value,
+            symbol.st_size,
+            symbol.st_info[0],
+            symbol.st_other[0],
+            symbol.st_shndx,
+        )
+        self._symbol = symbol
+
+    def _init(
+        self, idx: int | None, c_elf: cstruct, st_name: int, st_value: int, size: int, info: int, other: int, shndx: int
+    ) -> None:
         self.idx = idx
         self.c_elf = c_elf
+        self.size = size
 
-        endianness = "little" if c_elf.endian == "<" else "big"
-
-        info = int.from_bytes(self.symbol.st_info, endianness)
-        self.bind = STB(info >> 4)
-        self.type = STT(info & 0xF)
-        self.size = self.symbol.st_size
-
-        other = int.from_bytes(self.symbol.st_other, endianness)
-        self.visibility = STV(other & 0x3)
+        self._st_name = st_name
+        self._st_value = st_value
+        self._st_shndx = shndx
+        self._info = info
+        self._other = other
 
         self._name = None
+        self._symbol = None
 
     def __repr__(self) -> str:
         return (
             f"<Symbol idx={self.idx} value=0x{self.value:x} size={self.size} type={self.type} bind={self.bind}"
-            f" visibility={self.visibility} shndex={self.symbol.st_shndx} name={self.name}>"
+            f" visibility={self.visibility} shndex={self._st_shndx} name={self.name}>"
         )
 
     def _set_name(self, table: StringTable) -> None:
-        self._name = table[self.symbol.st_name]
+        self._name = table[self._st_name]
 
     @classmethod
     def from_symbol_table(cls, table: SymbolTable, idx: int) -> Symbol:
-        offset = idx * table.entry_size
-        data = table.data[offset : offset + table.entry_size]
-        output = cls(io.BytesIO(data), idx, table.c_elf)
+        """Create a view of a symbol from the decoded columns of the symbol table."""
+        output = cls.__new__(cls)
+        output._init(idx, table.c_elf, *table._entry(idx))
         output._set_name(table.link)
         return output
 
+    @property
+    def symbol(self) -> c_elf_64.Sym | c_elf_32.Sym:
+        """The symbol structure, only constructed when accessed."""
+        if self._symbol is None:
+            self._symbol = self.c_elf.Sym(
+                st_name=self._st_name,
+                st_value=self._st_value,
+                st_size=self.size,
+                st_info=bytes([self._info]),
+                st_other=bytes([self._other]),
+                st_shndx=self._st_shndx,
+            )
+        return self._symbol
+
+    @property
+    def bind(self) -> STB:
+        return STB(self._info >> 4)
+
+    @property
+    def type(self) -> STT:
+        return STT(self._info & 0xF)
+
+    @property
+    def visibility(self) -> STV:
+        return STV(self._other & 0x3)
+
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def shndx(self) -> int:
+        return self._st_shndx
+
     @property
     def value(self) -> int:
-        return 0 if self.symbol.st_shndx == SHN.UNDEF else self.symbol.st_value
+        return 0 if self._st_shndx == SHN.UNDEF else self._st_value
 
     def value_based_on_shndx(self, table: SectionTable) -> int:
-        symloc = self.symbol.st_shndx
+        symloc = self._st_shndx
         value = self.value
         if symloc not in [SHN.UNDEF, SHN.ABS]:
             value += table[symloc].offset
@@ -399,12 +735,526 @@ class Symbol:
 
 
 class SymbolTable(Section, Table[Symbol]):
-    def __init__(self, fh: BinaryIO, idx: int | None = None, c_elf: cstruct = c_elf_64):
+    def __init__(
+        self,
+        fh: BinaryIO | Source,
+        idx: int | None = None,
+        c_elf: cstruct = c_elf_64,
+        header: c_elf_64.Shdr | c_elf_32.Shdr | None = None,
+    ):
         # Initializes Section info
-        Section.__init__(self, fh, idx, c_elf)
+        Section.__init__(self, fh, idx, c_elf, header)
         count = self.size // self.entry_size
         # Initializes Table info
         Table.__init__(self, count)
 
     def _create_item(self, idx: int) -> Symbol:
         return Symbol.from_symbol_table(self, idx)
+
+    @cached_property
+    def columns(self) -> SymbolColumns:
+        """All symbols of the table, decoded in a single pass into columns.
+
+        This avoids constructing a :class:`Symbol` for every entry when processing large symbol tables.
+        """
+        fields, layout = self._layout
+        count = min(self.num, len(self.data) // self.entry_size)
+        data = memoryview(self.data)[: count * self.entry_size]
+
+        if HAS_NUMPY:
+            offsets = [self.c_elf.Sym.fields[name].offset for name, _ in fields]
+            records = np.frombuffer(
+                data,
+                dtype=np.dtype(
+                    {
+                        "names": [name for name, _ in fields],
+                        "formats": [self.c_elf.endian + fmt for _, fmt in fields],
+                        "offsets": offsets,
+                        "itemsize": self.entry_size,
+                    }
+                ),
+                count=count,
+            )
+            values = {name: records[name].astype(np.dtype(fmt)) for name, fmt in fields}
+        else:
+            rows = zip(*layout.iter_unpack(data), strict=True) if count else [()] * len(fields)
+            values = {name: array(fmt, column) for (name, fmt), column in zip(fields, rows, strict=True)}
+
+        return SymbolColumns(
+            values["st_name"],
+            values["st_value"],
+            values["st_size"],
+            values["st_info"],
+            values["st_other"],
+            values["st_shndx"],
+        )
+
+    @cached_property
+    def _layout(self) -> tuple[tuple[tuple[str, str], ...], struct.Struct]:
+        """The fields of a symbol and a structure to unpack a complete entry, including any padding."""
+        fields = SYM_FIELDS_64 if _is_64bit(self.c_elf) else SYM_FIELDS_32
+        layout = struct.Struct(self.c_elf.endian + "".join(fmt for _, fmt in fields))
+        if self.entry_size < layout.size:
+            raise Error(f"Invalid symbol table entry size: {self.entry_size:#x}")
+
+        # Skip any padding at the end of every entry
+        return fields, struct.Struct(layout.format + "x" * (self.entry_size - layout.size))
+
+    def _entry(self, idx: int) -> tuple[int, int, int, int, int, int]:
+        """Return the name, value, size, info, other and section index of a symbol.
+
+        Once the columns are decoded they are used, otherwise only the requested entry is unpacked.
+        """
+        if (columns := self.__dict__.get("columns")) is not None:
+            return tuple(int(column[idx]) for column in columns)
+
+        fields, layout = self._layout
+        values = dict(
+            zip((name for name, _ in fields), layout.unpack_from(self.data, idx * self.entry_size), strict=False)
+        )
+        return (
+            values["st_name"],
+            values["st_value"],
+            values["st_size"],
+            values["st_info"],
+            values["st_other"],
+            values["st_shndx"],
+        )
+
+    def lookup(self, name: str) -> list[Symbol]:
+        """Return all symbols with the given name.
+
+        The names of all symbols are indexed on first use, after which every lookup is a single dictionary access.
+
+        Args:
+            name: The name of the symbols to look up.
+        """
+        return [self[idx] for idx in self._names.get(name, ())]
+
+    def symbolize(self, address: int) -> Symbol | None:
+        """Return the function or object symbol containing the given address, if any.
+
+        Only defined symbols of type ``STT_FUNC`` and ``STT_OBJECT`` are considered, covering the range
+        ``[st_value, st_value + st_size)``. A symbol without a size only covers its own address. If symbols are
+        nested or overlap, the innermost symbol containing the address (the one with the highest start address, and
+        the lowest end address for equal starts) is returned. The lookup takes a logarithmic number of steps, also
+        when the address is past many symbols nested inside a larger one.
+
+        Args:
+            address: The address to look up.
+        """
+        idx = self._containing(bisect_right(self._index[0], address) - 1, address)
+        return self[self._index[2][idx]] if idx is not None else None
+
+    def symbolize_many(self, addresses: Iterable[int]) -> list[Symbol | None]:
+        """Return the function or object symbols containing the given addresses, see :meth:`symbolize`.
+
+        If NumPy is available and ``addresses`` is a NumPy array, the lookup is vectorized.
+
+        Args:
+            addresses: The addresses to look up.
+        """
+        if not (HAS_NUMPY and isinstance(addresses, np.ndarray)):
+            return [self.symbolize(address) for address in addresses]
+
+        starts, ends, order, ancestors = self._arrays
+        if not len(starts):
+            return [None] * len(addresses)
+
+        addresses = addresses.astype(np.uint64, copy=False)
+
+        idx = np.searchsorted(starts, addresses, side="right").astype(np.int64) - 1
+        found = idx >= 0
+        idx[~found] = 0
+
+        # Addresses past the end of the nearest symbol may still be inside an enclosing symbol
+        missed = found & (addresses >= ends[idx])
+        pos, values = idx[missed], addresses[missed]
+        for level in ancestors[::-1]:
+            pos = np.where(ends[level[pos]] <= values, level[pos], pos)
+        pos = ancestors[0][pos]
+        idx[missed] = pos
+        found[missed] = values < ends[pos]
+
+        result = [None] * len(addresses)
+        for i, pos in zip(np.flatnonzero(found).tolist(), order[idx[found]].tolist(), strict=True):
+            result[i] = self[pos]
+        return result
+
+    def _containing(self, idx: int, address: int) -> int | None:
+        """Return the position of the nearest symbol at or before the given position that contains the address."""
+        if idx < 0:
+            return None
+
+        ends = self._index[1]
+        if address < ends[idx]:
+            return idx
+
+        # Climb to the furthest enclosing candidate that still ends at or before the address, its parent is the answer
+        ancestors = self._ancestors
+        for level in reversed(ancestors):
+            if ends[level[idx]] <= address:
+                idx = level[idx]
+
+        idx = ancestors[0][idx]
+        return idx if address < ends[idx] else None
+
+    @cached_property
+    def _names(self) -> dict[str, list[int]]:
+        """The indices of the symbols, keyed by name."""
+        names = defaultdict(list)
+        if (table := self.link) is not None:
+            if isinstance(table, StringTable):
+                # Every name is resolved, so index the whole string table at once
+                table.split()
+            for idx, offset in enumerate(self.columns.name.tolist()):
+                if offset:
+                    names[table[offset]].append(idx)
+        return dict(names)
+
+    @cached_property
+    def _index(self) -> tuple[array, array, array]:
+        """The function and object symbols in ascending order of their start address.
+
+        Returns the start and end addresses and the symbol indices.
+        """
+        columns = self.columns
+        types = [int(symbol_type) for symbol_type in ADDRESS_SYMBOL_TYPES]
+
+        # Of symbols with the same start address, the innermost (lowest end address) is sorted last
+        entries = sorted(
+            (value, -(value + max(size, 1)), idx)
+            for idx, (value, size, info, shndx) in enumerate(
+                zip(
+                    columns.value.tolist(),
+                    columns.size.tolist(),
+                    columns.info.tolist(),
+                    columns.shndx.tolist(),
+                    strict=True,
+                )
+            )
+            if info & 0xF in types and shndx != SHN.UNDEF
+        )
+
+        return (
+            array("Q", (start for start, _, _ in entries)),
+            array("Q", (-end for _, end, _ in entries)),
+            array("Q", (idx for _, _, idx in entries)),
+        )
+
+    @cached_property
+    def _ancestors(self) -> list[array]:
+        """Binary lifting tables over the enclosing candidates of the symbols in the address index.
+
+        The candidate of a symbol is the nearest preceding symbol that ends after it, as only such a symbol can
+        contain an address past the end of the symbol. The end addresses strictly increase along a chain of
+        candidates, so the first candidate containing an address is found in a logarithmic number of steps, no
+        matter how many symbols are nested inside a large symbol. Level ``k`` holds the ``2 ** k``-th candidate of
+        every symbol, a symbol without a candidate refers to itself.
+        """
+        ends = self._index[1]
+
+        parents = array("Q")
+        stack = []
+        for idx, end in enumerate(ends):
+            while stack and ends[stack[-1]] <= end:
+                stack.pop()
+            parents.append(stack[-1] if stack else idx)
+            stack.append(idx)
+
+        # Only as many levels as needed to climb the longest chain are built, which is usually just a few. Once a
+        # level reaches the end of every chain, the levels below it already climb far enough and it can be dropped.
+        levels = [parents]
+        while (level := array("Q", (levels[-1][idx] for idx in levels[-1]))) != levels[-1]:
+            levels.append(level)
+        if len(levels) > 1:
+            levels.pop()
+        return levels
+
+    @cached_property
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """The address index and its binary lifting tables as NumPy arrays."""
+        starts, ends, order = self._index
+        return (
+            np.array(starts, dtype=np.uint64),
+            np.array(ends, dtype=np.uint64),
+            np.array(order, dtype=np.int64),
+            np.array(self._ancestors, dtype=np.int64).reshape(-1, len(starts)),
+        )
+
+
+class HashTable(Section):
+    """A SysV hash table (``SHT_HASH``), used to look up dynamic symbols by name.
+
+    The table links to the dynamic symbol table it indexes.
+    """
+
+    @cached_property
+    def _words(self) -> array:
+        # The hash table consists of 32-bit words, except on a few 64-bit architectures (e.g. s390x and Alpha)
+        return _array("Q" if self.entry_size == 8 else "I", self.data, self.c_elf.endian)
+
+    def lookup(self, name: str) -> Symbol | None:
+        """Return the defined symbol with the given name, if any.
+
+        Args:
+            name: The name of the symbol to look up.
+        """
+        words = self._words
+        if len(words) < 2 or not (nbucket := words[0]) or (symbols := self.link) is None:
+            return None
+
+        nchain = words[1]
+        chains = 2 + nbucket
+        if chains + nchain > len(words):
+            return None
+
+        idx = words[2 + sysv_hash(name.encode()) % nbucket]
+        # The chain is bounded by the number of symbols, which protects against cycles in corrupt tables
+        for _ in range(nchain):
+            if idx == 0 or idx >= min(nchain, symbols.num):
+                break
+
+            symbol = symbols[idx]
+            if symbol.shndx != SHN.UNDEF and symbol.name == name:
+                return symbol
+            idx = words[chains + idx]
+
+        return None
+
+
+class GnuHashTable(Section):
+    """A GNU hash table (``SHT_GNU_HASH``), used to look up defined dynamic symbols by name.
+
+    Names that are not present are usually rejected by the bloom filter, without decoding any symbol. The table links
+    to the dynamic symbol table it indexes.
+    """
+
+    @cached_property
+    def _tables(self) -> tuple[int, int, array, array, array]:
+        """The symbol offset, the bloom shift and the bloom filter, bucket and chain words."""
+        data = self.data
+        if len(data) < 16:
+            return 0, 0, array("Q"), array("I"), array("I")
+
+        nbuckets, symoffset, bloom_size, bloom_shift = struct.unpack_from(f"{self.c_elf.endian}4I", data)
+
+        # The bloom filter consists of words of the native size of the ELF class
+        typecode = "Q" if _is_64bit(self.c_elf) else "I"
+        buckets = 16 + bloom_size * struct.calcsize(typecode)
+        chains = buckets + nbuckets * 4
+
+        return (
+            symoffset,
+            bloom_shift,
+            _array(typecode, data[16:buckets], self.c_elf.endian),
+            _array("I", data[buckets:chains], self.c_elf.endian),
+            _array("I", data[chains:], self.c_elf.endian),
+        )
+
+    def lookup(self, name: str) -> Symbol | None:
+        """Return the defined symbol with the given name, if any.
+
+        Args:
+            name: The name of the symbol to look up.
+        """
+        symoffset, bloom_shift, bloom, buckets, chains = self._tables
+        if not bloom or not buckets or (symbols := self.link) is None:
+            return None
+
+        hash_ = gnu_hash(name.encode())
+
+        bits = bloom.itemsize * 8
+        word = bloom[(hash_ // bits) % len(bloom)]
+        mask = (1 << (hash_ % bits)) | (1 << ((hash_ >> bloom_shift) % bits))
+        if word & mask != mask:
+            return None
+
+        idx = buckets[hash_ % len(buckets)]
+        if idx < symoffset:
+            return None
+
+        while idx - symoffset < len(chains) and idx < symbols.num:
+            # The lowest bit of the chain value marks the end of the chain, the other bits are the hash of the name
+            value = chains[idx - symoffset]
+            if (value | 1) == (hash_ | 1) and (symbol := symbols[idx]).name == name:
+                return symbol
+            if value & 1:
+                break
+            idx += 1
+
+        return None
+
+
+class DynamicTable:
+    """The dynamic table of an ELF file, which holds the information needed for dynamic linking.
+
+    All entries are decoded in bulk into a tag and a value column, up to the terminating ``DT_NULL`` entry. String
+    values such as ``DT_NEEDED`` are only resolved when accessed, through the linked ``.dynstr`` section or, when the
+    section headers are stripped, through the ``DT_STRTAB`` address mapped by the loadable segments.
+
+    Args:
+        elf: The ELF file the dynamic table belongs to.
+        data: The raw dynamic table.
+        strings: The string table of the dynamic table. Defaults to the one at ``DT_STRTAB``.
+    """
+
+    def __init__(self, elf: ELF, data: bytes | memoryview, strings: StringTable | None = None):
+        self.elf = elf
+        self._strings = strings
+
+        entries = _array("Q" if _is_64bit(elf.c_elf) else "I", data, elf.c_elf.endian)
+        tags = entries[0::2][: len(entries) // 2]
+        count = tags.index(c_common_elf.DT_NULL) if c_common_elf.DT_NULL in tags else len(tags)
+
+        self.tags = tags[:count]
+        self.values = entries[1::2][:count]
+
+    def __repr__(self) -> str:
+        return f"<DynamicTable entries={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Yield the ``(tag, value)`` of every entry."""
+        return zip(self.tags, self.values, strict=True)
+
+    def get(self, tag: int) -> int | None:
+        """Return the value of the first entry with the given tag, if any.
+
+        Args:
+            tag: The ``DT_*`` tag of the entry.
+        """
+        return self.values[self.tags.index(tag)] if tag in self.tags else None
+
+    def get_all(self, tag: int) -> list[int]:
+        """Return the values of all entries with the given tag.
+
+        Args:
+            tag: The ``DT_*`` tag of the entries.
+        """
+        return [value for entry_tag, value in self if entry_tag == tag]
+
+    def string(self, offset: int) -> str | None:
+        """Return the string at the given offset in the dynamic string table, if available.
+
+        Args:
+            offset: The offset of the string.
+        """
+        if (strings := self.strings) is None:
+            return None
+        return strings[offset]
+
+    @property
+    def strings(self) -> StringTable | None:
+        """The dynamic string table."""
+        if self._strings is None:
+            address = self.get(c_common_elf.DT_STRTAB)
+            size = self.get(c_common_elf.DT_STRSZ)
+            if address is None or size is None or (offset := self.elf.vaddr_to_offset(address)) is None:
+                return None
+
+            header = self.elf.c_elf.Shdr(sh_type=SHT.STRTAB, sh_addr=address, sh_offset=offset, sh_size=size)
+            self._strings = StringTable(self.elf.source, c_elf=self.elf.c_elf, header=header)
+        return self._strings
+
+    @cached_property
+    def needed(self) -> list[str]:
+        """The names of the libraries this file depends on (``DT_NEEDED``)."""
+        return [self.string(offset) for offset in self.get_all(c_common_elf.DT_NEEDED)]
+
+    @cached_property
+    def soname(self) -> str | None:
+        """The shared object name (``DT_SONAME``)."""
+        return self.string(offset) if (offset := self.get(c_common_elf.DT_SONAME)) is not None else None
+
+    @cached_property
+    def rpath(self) -> list[str]:
+        """The library search paths (``DT_RPATH``)."""
+        return self._paths(c_common_elf.DT_RPATH)
+
+    @cached_property
+    def runpath(self) -> list[str]:
+        """The library search paths (``DT_RUNPATH``)."""
+        return self._paths(c_common_elf.DT_RUNPATH)
+
+    @property
+    def init(self) -> int | None:
+        """The address of the initialization function (``DT_INIT``)."""
+        return self.get(c_common_elf.DT_INIT)
+
+    @property
+    def fini(self) -> int | None:
+        """The address of the termination function (``DT_FINI``)."""
+        return self.get(c_common_elf.DT_FINI)
+
+    @cached_property
+    def init_array(self) -> list[int]:
+        """The addresses of the initialization functions (``DT_INIT_ARRAY``)."""
+        return self._pointers(c_common_elf.DT_INIT_ARRAY, c_common_elf.DT_INIT_ARRAYSZ)
+
+    @cached_property
+    def fini_array(self) -> list[int]:
+        """The addresses of the termination functions (``DT_FINI_ARRAY``)."""
+        return self._pointers(c_common_elf.DT_FINI_ARRAY, c_common_elf.DT_FINI_ARRAYSZ)
+
+    @cached_property
+    def preinit_array(self) -> list[int]:
+        """The addresses of the pre-initialization functions (``DT_PREINIT_ARRAY``)."""
+        return self._pointers(c_common_elf.DT_PREINIT_ARRAY, c_common_elf.DT_PREINIT_ARRAYSZ)
+
+    @property
+    def flags(self) -> int:
+        """The flags of the object (``DT_FLAGS``)."""
+        return self.get(c_common_elf.DT_FLAGS) or 0
+
+    @property
+    def flags_1(self) -> int:
+        """The additional flags of the object (``DT_FLAGS_1``)."""
+        return self.get(c_common_elf.DT_FLAGS_1) or 0
+
+    def _paths(self, tag: int) -> list[str]:
+        return [path for offset in self.get_all(tag) if (value := self.string(offset)) for path in value.split(":")]
+
+    def _pointers(self, tag: int, size_tag: int) -> list[int]:
+        address = self.get(tag)
+        size = self.get(size_tag)
+        if address is None or not size or (offset := self.elf.vaddr_to_offset(address)) is None:
+            return []
+
+        # The pointers are read as stored in the file, relocations are not applied
+        typecode = "Q" if _is_64bit(self.elf.c_elf) else "I"
+        return _array(typecode, self.elf.source.read_at(offset, size), self.elf.c_elf.endian).tolist()
+
+
+def sysv_hash(name: bytes) -> int:
+    """Calculate the SysV ELF hash of a symbol name."""
+    hash_ = 0
+    for byte in name:
+        hash_ = (hash_ << 4) + byte
+        if high := hash_ & 0xF0000000:
+            hash_ ^= high >> 24
+        hash_ &= ~high & 0xFFFFFFFF
+    return hash_
+
+
+def gnu_hash(name: bytes) -> int:
+    """Calculate the GNU ELF hash (DJB2) of a symbol name."""
+    hash_ = 5381
+    for byte in name:
+        hash_ = (hash_ * 33 + byte) & 0xFFFFFFFF
+    return hash_
+
+
+def _array(typecode: str, data: bytes | memoryview, endian: str) -> array:
+    """Decode the data as an array of integers of the given endianness."""
+    result = array(typecode)
+    result.frombytes(data[: len(data) - len(data) % result.itemsize])
+    if (endian == "<") != (sys.byteorder == "little"):
+        result.byteswap()
+    return result
+
+
+def _is_64bit(c_elf: cstruct) -> bool:
+    return len(c_elf.Sym) == len(c_elf_64.Sym)
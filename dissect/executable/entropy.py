@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections import Counter
+from typing import TYPE_CHECKING, BinaryIO
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+ENTROPY_CHUNK_SIZE = 1024 * 1024
+DEFAULT_WINDOW_SIZE = 256
+
+
+def histogram(data: bytes | memoryview | BinaryIO, chunk_size: int = ENTROPY_CHUNK_SIZE) -> list[int]:
+    """Count the occurrences of every byte value.
+
+    Args:
+        data: The data to count, either a buffer or a file-like object that is read in chunks.
+        chunk_size: The number of bytes to process at a time.
+
+    Returns:
+        A list of 256 counts, indexed by byte value.
+    """
+    if HAS_NUMPY:
+        counts = np.zeros(256, dtype=np.int64)
+        for chunk in _chunks(data, chunk_size):
+            counts += np.bincount(np.frombuffer(chunk, dtype=np.uint8), minlength=256)
+        return counts.tolist()
+
+    counter = Counter()
+    for chunk in _chunks(data, chunk_size):
+        counter.update(bytes(chunk))
+    return [counter[value] for value in range(256)]
+
+
+def entropy(data: bytes | memoryview | BinaryIO, chunk_size: int = ENTROPY_CHUNK_SIZE) -> float:
+    """Calculate the Shannon entropy of the data, in bits per byte.
+
+    The byte histogram is built in a single pass, so large regions can be streamed without reading them in full.
+
+    Args:
+        data: The data to calculate the entropy of, either a buffer or a file-like object that is read in chunks.
+        chunk_size: The number of bytes to process at a time.
+
+    Returns:
+        The entropy, between ``0.0`` and ``8.0``. Empty data has an entropy of ``0.0``.
+    """
+    counts = histogram(data, chunk_size)
+    total = sum(counts)
+    if not total:
+        return 0.0
+    return max(0.0, math.log2(total) - sum(count * math.log2(count) for count in counts if count) / total)
+
+
+def entropy_curve(
+    data: bytes | memoryview | BinaryIO,
+    window: int = DEFAULT_WINDOW_SIZE,
+    step: int | None = None,
+    chunk_size: int = ENTROPY_CHUNK_SIZE,
+) -> np.ndarray | array:
+    """Calculate the Shannon entropy of a sliding window over the data, in bits per byte.
+
+    The data is processed in chunks, with the part of the last window that does not fit in a chunk carried over to
+    the next. A trailing window that is smaller than ``window`` is not included.
+
+    Args:
+        data: The data to calculate the entropy curve of, either a buffer or a file-like object.
+        window: The size of every window.
+        step: The distance between the start of consecutive windows. Defaults to ``window``.
+        chunk_size: The number of bytes to process at a time.
+
+    Returns:
+        The entropy of every window, as a NumPy ``float64`` array if NumPy is available, or an ``array("d")``
+        otherwise.
+    """
+    step = window if step is None else step
+    if window <= 0 or step <= 0:
+        raise ValueError(f"Invalid window size or step: {window}, {step}")
+
+    result = []
+    carry = b""
+    for chunk in _chunks(data, max(chunk_size, window)):
+        buf = carry + chunk if carry else chunk
+        if (count := (len(buf) - window) // step + 1) > 0:
+            result.append(_window_entropy(buf, window, step, count, chunk_size))
+        carry = bytes(buf[count * step :]) if count > 0 else bytes(buf)
+
+    if HAS_NUMPY:
+        return np.concatenate(result) if result else np.zeros(0, dtype=np.float64)
+    return array("d", (value for values in result for value in values))
+
+
+def _window_entropy(buf: bytes | memoryview, window: int, step: int, count: int, chunk_size: int) -> np.ndarray | list:
+    """Calculate the entropy of ``count`` windows in the buffer."""
+    if not HAS_NUMPY:
+        result = []
+        for idx in range(count):
+            counts = Counter(bytes(buf[idx * step : idx * step + window])).values()
+            result.append(max(0.0, math.log2(window) - sum(c * math.log2(c) for c in counts) / window))
+        return result
+
+    values = np.frombuffer(buf, dtype=np.uint8)
+    if step == window:
+        windows = values[: count * window].reshape(count, window)
+    else:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)[::step][:count]
+
+    # Histogram a batch of windows at a time with a single bincount, by giving every window its own range of bins
+    result = np.empty(count, dtype=np.float64)
+    batch = max(1, chunk_size // window)
+    for start in range(0, count, batch):
+        rows = windows[start : start + batch]
+        bins = (np.arange(len(rows), dtype=np.int64)[:, None] << 8) + rows
+        counts = np.bincount(bins.ravel(), minlength=len(rows) << 8).reshape(len(rows), 256)
+
+        logs = np.log2(counts, out=np.zeros(counts.shape, dtype=np.float64), where=counts > 0)
+        result[start : start + len(rows)] = math.log2(window) - (counts * logs).sum(axis=1) / window
+
+    return np.maximum(result, 0.0)
+
+
+def _chunks(data: bytes | memoryview | BinaryIO, chunk_size: int) -> Iterator[bytes | memoryview]:
+    """Yield the data in chunks of at most ``chunk_size`` bytes."""
+    if hasattr(data, "read"):
+        while chunk := data.read(chunk_size):
+            yield chunk
+        return
+
+    view = memoryview(data).cast("B")
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset : offset + chunk_size]
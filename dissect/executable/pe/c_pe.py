@@ -1781,6 +1781,31 @@ typedef struct _IMAGE_RUNTIME_FUNCTION_ENTRY {
     };
 } IMAGE_RUNTIME_FUNCTION_ENTRY, *PIMAGE_RUNTIME_FUNCTION_ENTRY;
 
+//
+// x64 unwind information
+//
+
+flag UNW_FLAG : UCHAR {
+    NHANDLER                = 0x0,
+    EHANDLER                = 0x1,
+    UHANDLER                = 0x2,
+    CHAININFO               = 0x4,
+};
+
+enum UWOP : UCHAR {
+    PUSH_NONVOL             = 0,
+    ALLOC_LARGE             = 1,
+    ALLOC_SMALL             = 2,
+    SET_FPREG               = 3,
+    SAVE_NONVOL             = 4,
+    SAVE_NONVOL_FAR         = 5,
+    EPILOG                  = 6,                // previously UWOP_SAVE_XMM
+    SPARE_CODE              = 7,                // previously UWOP_SAVE_XMM_FAR
+    SAVE_XMM128             = 8,
+    SAVE_XMM128_FAR         = 9,
+    PUSH_MACHFRAME          = 10,
+};
+
 //
 // Sofware enclave information
 //
@@ -2513,6 +2513,25 @@ class _c_pe(__cs__.cstruct):
 
     IMAGE_RUNTIME_FUNCTION_ENTRY: TypeAlias = _IMAGE_RUNTIME_FUNCTION_ENTRY
     PIMAGE_RUNTIME_FUNCTION_ENTRY: TypeAlias = __cs__.Pointer[_c_pe._IMAGE_RUNTIME_FUNCTION_ENTRY]
+    class UNW_FLAG(__cs__.Flag):
+        NHANDLER = ...
+        EHANDLER = ...
+        UHANDLER = ...
+        CHAININFO = ...
+
+    class UWOP(__cs__.Enum):
+        PUSH_NONVOL = ...
+        ALLOC_LARGE = ...
+        ALLOC_SMALL = ...
+        SET_FPREG = ...
+        SAVE_NONVOL = ...
+        SAVE_NONVOL_FAR = ...
+        EPILOG = ...
+        SPARE_CODE = ...
+        SAVE_XMM128 = ...
+        SAVE_XMM128_FAR = ...
+        PUSH_MACHFRAME = ...
+
     class _IMAGE_ENCLAVE_CONFIG32(__cs__.Structure):
         Size: _c_pe.uint32
         MinimumRequiredConfigSize: _c_pe.uint32
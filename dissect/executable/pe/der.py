@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from dissect.executable.exception import Error
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+TAG_INTEGER = 0x02
+TAG_OCTET_STRING = 0x04
+TAG_OID = 0x06
+TAG_UTF8_STRING = 0x0C
+TAG_PRINTABLE_STRING = 0x13
+TAG_T61_STRING = 0x14
+TAG_IA5_STRING = 0x16
+TAG_UTC_TIME = 0x17
+TAG_GENERALIZED_TIME = 0x18
+TAG_UNIVERSAL_STRING = 0x1C
+TAG_BMP_STRING = 0x1E
+TAG_SEQUENCE = 0x30
+TAG_SET = 0x31
+
+# Common attribute types in distinguished names
+NAME_ATTRIBUTES = {
+    "2.5.4.3": "CN",
+    "2.5.4.5": "serialNumber",
+    "2.5.4.6": "C",
+    "2.5.4.7": "L",
+    "2.5.4.8": "ST",
+    "2.5.4.9": "street",
+    "2.5.4.10": "O",
+    "2.5.4.11": "OU",
+    "1.2.840.113549.1.9.1": "emailAddress",
+}
+
+STRING_ENCODINGS = {
+    TAG_UTF8_STRING: "utf-8",
+    TAG_PRINTABLE_STRING: "ascii",
+    TAG_T61_STRING: "latin-1",
+    TAG_IA5_STRING: "ascii",
+    TAG_UNIVERSAL_STRING: "utf-32-be",
+    TAG_BMP_STRING: "utf-16-be",
+}
+
+
+class Element:
+    """A single DER encoded element.
+
+    Only the header of the element is decoded, the contents are decoded on demand. Iterating over a constructed
+    element lazily yields its children, so unrelated parts of a structure are skipped without being decoded.
+
+    Args:
+        buf: The buffer containing the element.
+        offset: The offset of the element in the buffer.
+    """
+
+    __slots__ = ("buf", "end", "offset", "start", "tag")
+
+    def __init__(self, buf: memoryview, offset: int = 0):
+        self.buf = buf
+        self.offset = offset
+
+        if offset + 2 > len(buf):
+            raise Error(f"Truncated DER element at offset {offset:#x}")
+
+        self.tag = buf[offset]
+        pos = offset + 1
+        if self.tag & 0x1F == 0x1F:
+            # High tag number form, skip the remainder of the tag number
+            while pos < len(buf) and buf[pos] & 0x80:
+                pos += 1
+            pos += 1
+
+        if pos >= len(buf):
+            raise Error(f"Truncated DER element at offset {offset:#x}")
+
+        length = buf[pos]
+        pos += 1
+        if length & 0x80:
+            if (count := length & 0x7F) == 0:
+                raise Error(f"Indefinite length DER element at offset {offset:#x}")
+            length = int.from_bytes(buf[pos : pos + count], "big")
+            pos += count
+
+        self.start = pos
+        self.end = pos + length
+        if self.end > len(buf):
+            raise Error(f"Truncated DER element at offset {offset:#x}")
+
+    def __repr__(self) -> str:
+        return f"<Element tag={self.tag:#x} offset={self.offset:#x} length={len(self)}>"
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __iter__(self) -> Iterator[Element]:
+        if not self.constructed:
+            return
+
+        offset = self.start
+        while offset < self.end:
+            element = Element(self.buf[: self.end], offset)
+            yield element
+            offset = element.end
+
+    @property
+    def constructed(self) -> bool:
+        """Whether the element contains other elements."""
+        return bool(self.tag & 0x20)
+
+    @property
+    def value(self) -> memoryview:
+        """The contents of the element."""
+        return self.buf[self.start : self.end]
+
+    @property
+    def raw(self) -> memoryview:
+        """The complete encoding of the element, including the header."""
+        return self.buf[self.offset : self.end]
+
+    def children(self) -> list[Element]:
+        """Return the children of the element."""
+        return list(self)
+
+    def find(self, tag: int) -> Element | None:
+        """Return the first child with the given tag, if any."""
+        for child in self:
+            if child.tag == tag:
+                return child
+        return None
+
+    def oid(self) -> str:
+        """Decode the element as an object identifier."""
+        value = self.value
+        if self.tag != TAG_OID or not value:
+            raise Error(f"DER element at offset {self.offset:#x} is not an object identifier")
+
+        parts = []
+        current = 0
+        for byte in value:
+            current = (current << 7) | (byte & 0x7F)
+            if not byte & 0x80:
+                parts.append(current)
+                current = 0
+
+        if not parts or value[-1] & 0x80:
+            raise Error(f"Truncated DER object identifier at offset {self.offset:#x}")
+
+        first = min(parts[0] // 40, 2)
+        return ".".join(map(str, [first, parts[0] - first * 40, *parts[1:]]))
+
+    def integer(self) -> int:
+        """Decode the element as an integer."""
+        if self.tag != TAG_INTEGER:
+            raise Error(f"DER element at offset {self.offset:#x} is not an integer")
+        return int.from_bytes(self.value, "big", signed=True)
+
+    def string(self) -> str:
+        """Decode the element as a string."""
+        if (encoding := STRING_ENCODINGS.get(self.tag)) is None:
+            raise Error(f"DER element at offset {self.offset:#x} is not a string")
+        return self.value.tobytes().decode(encoding, errors="backslashreplace")
+
+    def time(self) -> datetime.datetime:
+        """Decode the element as a UTC or generalized time."""
+        value = self.value.tobytes().decode("ascii", errors="replace").rstrip("Z")
+
+        if self.tag not in (TAG_UTC_TIME, TAG_GENERALIZED_TIME):
+            raise Error(f"DER element at offset {self.offset:#x} is not a time")
+
+        try:
+            if self.tag == TAG_UTC_TIME:
+                year = int(value[:2])
+                value = f"{1900 + year if year >= 50 else 2000 + year}{value[2:]}"
+
+            value, _, fraction = value.partition(".")
+            result = datetime.datetime.strptime(value.ljust(14, "0"), "%Y%m%d%H%M%S").replace(
+                tzinfo=datetime.timezone.utc
+            )
+            if fraction:
+                result += datetime.timedelta(microseconds=int(fraction[:6].ljust(6, "0")))
+        except ValueError as e:
+            raise Error(f"Invalid DER time at offset {self.offset:#x}: {value}") from e
+
+        return result
+
+    def name(self) -> str:
+        """Decode the element as an X.509 distinguished name, e.g. ``C=US, O=Example, CN=Example``."""
+        parts = []
+        for rdn in self:
+            for attribute in rdn:
+                if len(children := attribute.children()) < 2:
+                    raise Error(f"Invalid DER name attribute at offset {attribute.offset:#x}")
+
+                type_, value = children[:2]
+                oid = type_.oid()
+                parts.append(f"{NAME_ATTRIBUTES.get(oid, oid)}={value.string()}")
+        return ", ".join(parts)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import struct
+import sys
+from array import array
 from dataclasses import dataclass
 from functools import cached_property
 from typing import TYPE_CHECKING
@@ -7,9 +10,23 @@ from typing import TYPE_CHECKING
 from dissect.executable.pe.c_pe import c_pe
 from dissect.executable.pe.directory.base import DataDirectory
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+PAGE_SIZE = 0x1000
+
+_HIGH = c_pe.IMAGE_REL_BASED.HIGH.value
+_LOW = c_pe.IMAGE_REL_BASED.LOW.value
+_HIGHLOW = c_pe.IMAGE_REL_BASED.HIGHLOW.value
+_DIR64 = c_pe.IMAGE_REL_BASED.DIR64.value
+
 
 class BaseRelocationDirectory(DataDirectory):
     """The base relocation directory of a PE file."""
@@ -29,30 +46,122 @@ class BaseRelocationDirectory(DataDirectory):
     @cached_property
     def entries(self) -> list[BaseRelocation]:
         """List of base relocation entries."""
+        return [BaseRelocation(c_pe.IMAGE_REL_BASED(type), rva) for type, rva in self.iter_entries()]
+
+    def iter_entries(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the base relocation entries as ``(type, rva)`` tuples of plain integers.
+
+        Entries of type ``IMAGE_REL_BASED_ABSOLUTE``, which are only used for padding, are skipped.
+        """
+        for page_rva, entries in self.blocks:
+            for entry in entries:
+                if entry >> 12:
+                    yield entry >> 12, page_rva + (entry & 0xFFF)
+
+    @cached_property
+    def arrays(self) -> tuple[np.ndarray, np.ndarray] | tuple[array, array]:
+        """The types and RVAs of all base relocation entries, as two arrays.
+
+        The entries are decoded in a vectorized way if NumPy is available, in which case NumPy arrays are returned.
+        Otherwise ``array.array`` objects are returned. Entries of type ``IMAGE_REL_BASED_ABSOLUTE``, which are only
+        used for padding, are skipped.
+        """
+        if not HAS_NUMPY:
+            types = array("B")
+            rvas = array("I")
+            for type, rva in self.iter_entries():
+                types.append(type)
+                rvas.append(rva)
+            return types, rvas
+
+        if not self.blocks:
+            return np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.uint32)
+
+        entries = np.concatenate([np.frombuffer(entries, dtype=np.uint16) for _, entries in self.blocks])
+        pages = np.repeat(
+            np.array([page_rva for page_rva, _ in self.blocks], dtype=np.uint32),
+            [len(entries) for _, entries in self.blocks],
+        )
+
+        types = (entries >> 12).astype(np.uint8)
+        rvas = pages + (entries & 0xFFF)
+
+        mask = types != 0
+        return types[mask], rvas[mask]
+
+    @cached_property
+    def pages(self) -> dict[int, list[tuple[int, int]]]:
+        """The base relocation entries grouped by the RVA of the page they start in, as ``(type, rva)`` tuples."""
+        result = {}
+        for type, rva in self.iter_entries():
+            result.setdefault(rva & ~(PAGE_SIZE - 1), []).append((type, rva))
+        return result
+
+    def apply(self, buf: bytearray, address: int, delta: int) -> None:
+        """Apply the base relocations to a buffer of the virtual address space, in place.
+
+        Relocations are processed in batch per page. Only ``HIGH``, ``LOW``, ``HIGHLOW`` and ``DIR64`` relocations are
+        supported, other types are ignored. Relocations that do not entirely fit within the buffer are skipped.
+
+        Args:
+            buf: The data to relocate.
+            address: The relative virtual address (RVA) of the data.
+            delta: The difference between the new and the current image base.
+        """
+        end = address + len(buf)
+        for page in range(address & ~(PAGE_SIZE - 1), end, PAGE_SIZE):
+            if entries := self.pages.get(page):
+                _apply_page(buf, address, entries, delta)
+
+    @cached_property
+    def blocks(self) -> list[tuple[int, array]]:
+        """The base relocation blocks as ``(page_rva, entries)`` tuples, with the raw entries of every block."""
         result = []
 
-        offset = self.address
-        while offset < self.address + self.size:
-            self.pe.vfh.seek(offset)
+        header_size = len(c_pe._IMAGE_BASE_RELOCATION)
+        buf = self.pe.read_at(self.address, self.size)
 
-            block = c_pe._IMAGE_BASE_RELOCATION(self.pe.vfh)
-            if block.SizeOfBlock == 0:
+        offset = 0
+        while offset + header_size <= len(buf):
+            block = c_pe._IMAGE_BASE_RELOCATION(buf[offset : offset + header_size])
+            if block.SizeOfBlock < header_size:
                 break
 
-            page_rva = block.VirtualAddress
+            data = buf[offset + header_size : offset + block.SizeOfBlock]
+            entries = array("H", data[: len(data) & ~1])
+            if sys.byteorder == "big":
+                entries.byteswap()
+            result.append((block.VirtualAddress, entries))
 
-            num_entries = (block.SizeOfBlock - len(c_pe._IMAGE_BASE_RELOCATION)) // len(c_pe.USHORT)
-            result.extend(
-                BaseRelocation(c_pe.IMAGE_REL_BASED(entry >> 12), page_rva + (entry & 0xFFF))
-                for entry in c_pe.USHORT[num_entries](self.pe.vfh)
-                if (entry >> 12) != 0  # Skip IMAGE_REL_BASED_ABSOLUTE (0)
-            )
             offset += block.SizeOfBlock
             offset += -offset & 3  # Align to 4 bytes
 
         return result
 
 
+def _apply_page(buf: bytearray, address: int, entries: list[tuple[int, int]], delta: int) -> None:
+    """Apply the base relocations of a single page to a buffer that starts at the given RVA."""
+    size = len(buf)
+    for type, rva in entries:
+        offset = rva - address
+        if offset < 0:
+            continue
+
+        if type == _HIGHLOW and offset + 4 <= size:
+            value = struct.unpack_from("<I", buf, offset)[0]
+            struct.pack_into("<I", buf, offset, (value + delta) & 0xFFFFFFFF)
+        elif type == _DIR64 and offset + 8 <= size:
+            value = struct.unpack_from("<Q", buf, offset)[0]
+            struct.pack_into("<Q", buf, offset, (value + delta) & 0xFFFFFFFFFFFFFFFF)
+        elif type == _HIGH and offset + 2 <= size:
+            # The low 16 bits of the original value are unknown, so the carry of the low half is lost
+            value = struct.unpack_from("<H", buf, offset)[0]
+            struct.pack_into("<H", buf, offset, (((value << 16) + delta) >> 16) & 0xFFFF)
+        elif type == _LOW and offset + 2 <= size:
+            value = struct.unpack_from("<H", buf, offset)[0]
+            struct.pack_into("<H", buf, offset, (value + delta) & 0xFFFF)
+
+
 @dataclass
 class BaseRelocation:
     """A single base relocation entry in the base relocation directory."""
@@ -40,15 +40,15 @@ class BoundImportDirectory(DataDirectory):
         """List of bound imported modules."""
         result = []
 
-        self.pe.vfh.seek(self.address)
-        while self.pe.vfh.tell() < self.address + self.size:
-            descriptor = c_pe.IMAGE_BOUND_IMPORT_DESCRIPTOR(self.pe.vfh)
+        fh = self.pe.open(self.address)
+        while fh.tell() < self.address + self.size:
+            descriptor = c_pe.IMAGE_BOUND_IMPORT_DESCRIPTOR(fh)
             if not descriptor:
                 break
 
             forwarders = []
             for _ in range(descriptor.NumberOfModuleForwarderRefs):
-                forwarder = c_pe.IMAGE_BOUND_FORWARDER_REF(self.pe.vfh)
+                forwarder = c_pe.IMAGE_BOUND_FORWARDER_REF(fh)
                 if not forwarder:
                     break
 
@@ -86,8 +86,8 @@ class BoundImportModule:
 
     @property
     def name(self) -> str:
-        self.directory.pe.vfh.seek(self.directory.address + self.descriptor.OffsetModuleName)
-        return c_pe.CHAR[None](self.directory.pe.vfh).decode()
+        address = self.directory.address + self.descriptor.OffsetModuleName
+        return c_pe.CHAR[None](self.directory.pe.open(address)).decode()
 
 
 class BoundImportForwardReference:
@@ -110,5 +110,5 @@ class BoundImportForwardReference:
 
     @property
     def name(self) -> str:
-        self.directory.pe.vfh.seek(self.directory.address + self.descriptor.OffsetModuleName)
-        return c_pe.CHAR[None](self.directory.pe.vfh).decode()
+        address = self.directory.address + self.descriptor.OffsetModuleName
+        return c_pe.CHAR[None](self.directory.pe.open(address)).decode()
@@ -19,8 +19,7 @@ class ComDescriptorDirectory(DataDirectory):
     @cached_property
     def descriptor(self) -> c_pe.IMAGE_COR20_HEADER:
         """The CLR 2.0 header descriptor."""
-        self.pe.vfh.seek(self.address)
-        return c_pe.IMAGE_COR20_HEADER(self.pe.vfh)
+        return c_pe.IMAGE_COR20_HEADER(self.pe.read_at(self.address, len(c_pe.IMAGE_COR20_HEADER)))
 
     @cached_property
     def metadata(self) -> ComMetadata:
@@ -34,8 +33,7 @@ class ComMetadata(DataDirectory):
     @cached_property
     def metadata(self) -> c_pe.IMAGE_COR20_METADATA:
         """The CLR 2.0 metadata descriptor."""
-        self.pe.vfh.seek(self.address)
-        return c_pe.IMAGE_COR20_METADATA(self.pe.vfh)
+        return c_pe.IMAGE_COR20_METADATA(self.pe.open(self.address))
 
     @property
     def version(self) -> str:
@@ -49,8 +47,7 @@ class ComMetadata(DataDirectory):
 
         offset = self.address + len(self.metadata)
         for _ in range(self.metadata.NumberOfStreams):
-            self.pe.vfh.seek(offset)
-            header = c_pe.IMAGE_COR20_STREAM_HEADER(self.pe.vfh)
+            header = c_pe.IMAGE_COR20_STREAM_HEADER(self.pe.open(offset))
 
             result.append(ComStream(self, header.Offset, header.Size, header.Name.decode()))
 
@@ -75,9 +72,8 @@ class ComStream:
     @property
     def data(self) -> bytes:
         """The data of the stream."""
-        self.metadata.pe.vfh.seek(self.metadata.address + self.offset)
-        return self.metadata.pe.vfh.read(self.size)
+        return self.metadata.pe.read_at(self.metadata.address + self.offset, self.size)
 
     def open(self) -> BinaryIO:
         """Open the stream for reading."""
-        return RangeStream(self.metadata.pe.vfh, self.metadata.address + self.offset, self.size)
+        return RangeStream(self.metadata.pe.open(), self.metadata.address + self.offset, self.size)
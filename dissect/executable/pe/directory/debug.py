@@ -37,8 +37,9 @@ class DebugDirectory(DataDirectory):
         """List of debug entries in the debug directory."""
         result = []
 
-        self.pe.vfh.seek(self.address)
-        for entry in c_pe.IMAGE_DEBUG_DIRECTORY[self.size // len(c_pe.IMAGE_DEBUG_DIRECTORY)](self.pe.vfh):
+        count = self.size // len(c_pe.IMAGE_DEBUG_DIRECTORY)
+        buf = self.pe.read_at(self.address, count * len(c_pe.IMAGE_DEBUG_DIRECTORY))
+        for entry in c_pe.IMAGE_DEBUG_DIRECTORY[count](buf):
             cls = _DEBUG_TYPE_MAP.get(entry.Type, DebugEntry)
             result.append(cls(self.pe, entry))
 
@@ -84,13 +85,9 @@ class DebugEntry:
             if self.pe.virtual:
                 raise ValueError("Cannot access raw data of debug entry because it's not mapped into memory")
 
-            fh = self.pe.fh
-            address = self.entry.PointerToRawData
-        else:
-            fh = self.pe.vfh
-            address = self.entry.AddressOfRawData
+            return self.pe.source.open(self.entry.PointerToRawData, self.size)
 
-        return RangeStream(fh, address, self.size)
+        return RangeStream(self.pe.open(), self.entry.AddressOfRawData, self.size)
 
 
 class CodeViewDebugEntry(DebugEntry):
@@ -7,9 +7,11 @@ from dissect.util.ts import from_unix
 
 from dissect.executable.pe.c_pe import c_pe
 from dissect.executable.pe.directory.base import DataDirectory
+from dissect.executable.pe.directory.imports import ThunkTable, read_thunks
 
 if TYPE_CHECKING:
     import datetime
+    from array import array
     from collections.abc import Iterator
 
     from dissect.executable.pe.pe import PE
@@ -41,9 +43,9 @@ class DelayImportDirectory(DataDirectory):
     @cached_property
     def modules(self) -> list[DelayImportModule]:
         """List of delay imported modules."""
-        self.pe.vfh.seek(self.address)
         return [
-            DelayImportModule(self.pe, descriptor) for descriptor in c_pe.IMAGE_DELAYLOAD_DESCRIPTOR[None](self.pe.vfh)
+            DelayImportModule(self.pe, descriptor)
+            for descriptor in c_pe.IMAGE_DELAYLOAD_DESCRIPTOR[None](self.pe.open(self.address))
         ]
 
     @cached_property
@@ -95,40 +97,31 @@ class DelayImportModule:
     @cached_property
     def name(self) -> str:
         """The name of the delay import module."""
-        self.pe.vfh.seek(self.descriptor.DllNameRVA)
-        return c_pe.CHAR[None](self.pe.vfh).decode()
+        return c_pe.CHAR[None](self.pe.open(self.descriptor.DllNameRVA)).decode()
 
     @cached_property
-    def functions(self) -> list[DelayImportFunction]:
-        """List of delay imported functions from this module."""
-        ctype = c_pe.IMAGE_THUNK_DATA64 if self.pe.is_64bit() else c_pe.IMAGE_THUNK_DATA32
-
-        self.pe.vfh.seek(self.descriptor.ImportNameTableRVA)
-        name_table = ctype[None](self.pe.vfh)
-
-        self.pe.vfh.seek(self.descriptor.ImportAddressTableRVA)
-        address_table = ctype[None](self.pe.vfh)
+    def thunks(self) -> ThunkTable:
+        """The decoded name and address thunks of this module, stored column-wise."""
+        names = read_thunks(self.pe, self.descriptor.ImportNameTableRVA)
+        addresses = read_thunks(self.pe, self.descriptor.ImportAddressTableRVA, len(names))
+        return ThunkTable(self.pe, names, addresses)
 
-        bound_table = []
-        if self.descriptor.BoundImportAddressTableRVA:
-            self.pe.vfh.seek(self.descriptor.BoundImportAddressTableRVA)
-            bound_table = ctype[None](self.pe.vfh)
-        # If we are not bound (e.g. PE file on disk instead of in memory), create an empty table
-        bound_table = bound_table or [None] * len(name_table)
+    @cached_property
+    def bound_addresses(self) -> array | None:
+        """The raw values of the bound import address table, or ``None`` if not bound."""
+        # If we are not bound (e.g. PE file on disk instead of in memory), there is no table
+        return read_thunks(self.pe, self.descriptor.BoundImportAddressTableRVA) or None
 
-        unload_table = []
-        if self.descriptor.UnloadInformationTableRVA:
-            self.pe.vfh.seek(self.descriptor.UnloadInformationTableRVA)
-            unload_table = ctype[None](self.pe.vfh)
-        # If we are not unloading (e.g. PE file on disk instead of in memory), create an empty table
-        unload_table = unload_table or [None] * len(name_table)
+    @cached_property
+    def unload_addresses(self) -> array | None:
+        """The raw values of the unload information table, or ``None`` if not available."""
+        # If we are not unloading (e.g. PE file on disk instead of in memory), there is no table
+        return read_thunks(self.pe, self.descriptor.UnloadInformationTableRVA) or None
 
-        return [
-            DelayImportFunction(self, name_thunk, address_thunk, bound_thunk, unload_thunk)
-            for name_thunk, address_thunk, bound_thunk, unload_thunk in zip(
-                name_table, address_table, bound_table, unload_table, strict=False
-            )
-        ]
+    @cached_property
+    def functions(self) -> list[DelayImportFunction]:
+        """List of delay imported functions from this module."""
+        return [DelayImportFunction(self, idx) for idx in range(len(self.thunks))]
 
     @cached_property
     def _by_name(self) -> dict[str, DelayImportFunction]:
@@ -142,35 +135,59 @@ class DelayImportModule:
 
 
 class DelayImportFunction:
-    """A function delay imported from a module."""
-
-    def __init__(
-        self,
-        module: DelayImportModule,
-        name_thunk: c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64,
-        address_thunk: c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64,
-        bound_thunk: c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64 | None = None,
-        unload_thunk: c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64 | None = None,
-    ):
+    """A function delay imported from a module.
+
+    This is a view on the :class:`~dissect.executable.pe.directory.imports.ThunkTable` of the module it belongs to.
+    """
+
+    def __init__(self, module: DelayImportModule, index: int):
         self.module = module
-        self.name_thunk = name_thunk
-        self.address_thunk = address_thunk
-
-        if name_thunk.u1.Ordinal & (c_pe.IMAGE_ORDINAL_FLAG64 if module.pe.is_64bit() else c_pe.IMAGE_ORDINAL_FLAG32):
-            self.ordinal = name_thunk.u1.Ordinal & 0xFFFF
-            self.name = None
-        else:
-            self.module.pe.vfh.seek(name_thunk.u1.AddressOfData & (c_pe.IMAGE_ORDINAL_FLAG32 - 1))
-            import_by_name = c_pe.IMAGE_IMPORT_BY_NAME(self.module.pe.vfh)
-            self.ordinal = import_by_name.Hint
-            self.name = import_by_name.Name.decode()
-
-        self.address = address_thunk.u1.Function
-        self.bound_address = bound_thunk.u1.Function if bound_thunk else None
-        self.unload_address = unload_thunk.u1.Function if unload_thunk else None
+        self.index = index
 
     def __repr__(self) -> str:
         address = hex(self.address) if self.address is not None else "None"
         bound_address = hex(self.bound_address) if self.bound_address is not None else "None"
         unload_address = hex(self.unload_address) if self.unload_address is not None else "None"
         return f"<DelayImportFunction name={self.name!r} ordinal={self.ordinal} address={address} bound_address={bound_address} unload_address={unload_address}>"  # noqa: E501
+
+    @property
+    def name(self) -> str | None:
+        """The name of the delay imported function, or ``None`` if it's imported by ordinal."""
+        return self.module.thunks.names[self.index]
+
+    @property
+    def ordinal(self) -> int:
+        """The ordinal of the delay imported function, or its hint if it's imported by name."""
+        return self.module.thunks.ordinals[self.index]
+
+    @property
+    def address(self) -> int | None:
+        """The address of the delay import thunk of the function."""
+        addresses = self.module.thunks.addresses
+        return addresses[self.index] if self.index < len(addresses) else None
+
+    @property
+    def bound_address(self) -> int | None:
+        """The bound address of the function, if available."""
+        return _get(self.module.bound_addresses, self.index)
+
+    @property
+    def unload_address(self) -> int | None:
+        """The unload address of the function, if available."""
+        return _get(self.module.unload_addresses, self.index)
+
+    @property
+    def name_thunk(self) -> c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64:
+        """The name thunk of the delay imported function."""
+        return self.module.thunks.thunk(self.module.thunks.lookup, self.index)
+
+    @property
+    def address_thunk(self) -> c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64:
+        """The address thunk of the delay imported function."""
+        return self.module.thunks.thunk(self.module.thunks.addresses, self.index)
+
+
+def _get(table: array | None, index: int) -> int | None:
+    if table is None or index >= len(table):
+        return None
+    return table[index]
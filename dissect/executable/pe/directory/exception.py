@@ -1,19 +1,36 @@
 from __future__ import annotations
 
+import struct
+import sys
+from array import array
+from bisect import bisect_right
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from dissect.executable.pe.c_pe import c_pe
 from dissect.executable.pe.directory.base import DataDirectory
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
+
+RUNTIME_FUNCTION_INDIRECT = 0x1
+
+# The number of unwind code slots that each unwind operation occupies
+UNWIND_OP_SLOTS = (1, 2, 1, 1, 2, 3, 2, 3, 2, 3, 1)
 
 
 class ExceptionDirectory(DataDirectory):
     """The exception directory of a PE file.
 
-    Currently only shows the raw exception entries.
+    Besides the raw exception entries, this provides an index of the runtime functions by address and the x64 unwind
+    information of each runtime function.
     """
 
     def __repr__(self) -> str:
@@ -49,30 +66,27 @@ class ExceptionDirectory(DataDirectory):
         return self.entries[idx]
 
     @cached_property
-    def entries(
+    def ctype(
         self,
-    ) -> list[
+    ) -> type[
         c_pe.IMAGE_RUNTIME_FUNCTION_ENTRY
         | c_pe.IMAGE_ARM_RUNTIME_FUNCTION_ENTRY
         | c_pe.IMAGE_ARM64_RUNTIME_FUNCTION_ENTRY
         | c_pe.IMAGE_ALPHA_RUNTIME_FUNCTION_ENTRY
         | c_pe.IMAGE_ALPHA64_RUNTIME_FUNCTION_ENTRY
-        | c_pe.IMAGE_CE_RUNTIME_FUNCTION_ENTRY
         | c_pe.IMAGE_MIPS_RUNTIME_FUNCTION_ENTRY
     ]:
-        """List of exception entries."""
-        self.pe.vfh.seek(self.address)
-
+        """The structure of the exception entries, depending on the machine type."""
         machine = self.pe.machine
         if machine in (c_pe.IMAGE_FILE_MACHINE.ARM, c_pe.IMAGE_FILE_MACHINE.THUMB, c_pe.IMAGE_FILE_MACHINE.ARMNT):
-            ctype = c_pe.IMAGE_ARM_RUNTIME_FUNCTION_ENTRY
-        elif machine == c_pe.IMAGE_FILE_MACHINE.ARM64:
-            ctype = c_pe.IMAGE_ARM64_RUNTIME_FUNCTION_ENTRY
-        elif machine == c_pe.IMAGE_FILE_MACHINE.ALPHA:
-            ctype = c_pe.IMAGE_ALPHA_RUNTIME_FUNCTION_ENTRY
-        elif machine == c_pe.IMAGE_FILE_MACHINE.ALPHA64:
-            ctype = c_pe.IMAGE_ALPHA64_RUNTIME_FUNCTION_ENTRY
-        elif machine in (
+            return c_pe.IMAGE_ARM_RUNTIME_FUNCTION_ENTRY
+        if machine == c_pe.IMAGE_FILE_MACHINE.ARM64:
+            return c_pe.IMAGE_ARM64_RUNTIME_FUNCTION_ENTRY
+        if machine == c_pe.IMAGE_FILE_MACHINE.ALPHA:
+            return c_pe.IMAGE_ALPHA_RUNTIME_FUNCTION_ENTRY
+        if machine == c_pe.IMAGE_FILE_MACHINE.ALPHA64:
+            return c_pe.IMAGE_ALPHA64_RUNTIME_FUNCTION_ENTRY
+        if machine in (
             c_pe.IMAGE_FILE_MACHINE.R3000,
             c_pe.IMAGE_FILE_MACHINE.R4000,
             c_pe.IMAGE_FILE_MACHINE.R10000,
@@ -81,9 +95,329 @@ class ExceptionDirectory(DataDirectory):
             c_pe.IMAGE_FILE_MACHINE.MIPSFPU,
             c_pe.IMAGE_FILE_MACHINE.MIPSFPU16,
         ):
-            ctype = c_pe.IMAGE_MIPS_RUNTIME_FUNCTION_ENTRY
+            return c_pe.IMAGE_MIPS_RUNTIME_FUNCTION_ENTRY
+
+        # May be wrong for esoteric architectures, but this is the default
+        return c_pe.IMAGE_RUNTIME_FUNCTION_ENTRY
+
+    @cached_property
+    def entries(
+        self,
+    ) -> list[
+        c_pe.IMAGE_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_ARM_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_ARM64_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_ALPHA_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_ALPHA64_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_CE_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_MIPS_RUNTIME_FUNCTION_ENTRY
+    ]:
+        """List of exception entries."""
+        count = self.size // len(self.ctype)
+        return self.ctype[count](self.pe.view(self.address, count * len(self.ctype)))
+
+    @cached_property
+    def functions(self) -> list[RuntimeFunction]:
+        """List of runtime functions, in the order of the exception entries."""
+        return [RuntimeFunction(self, idx) for idx in range(len(self.begin_addresses))]
+
+    @cached_property
+    def begin_addresses(self) -> array:
+        """The begin addresses of all runtime functions."""
+        return self._columns[0]
+
+    @cached_property
+    def end_addresses(self) -> array:
+        """The end addresses (exclusive) of all runtime functions."""
+        return self._columns[1]
+
+    @cached_property
+    def unwind_data(self) -> array:
+        """The raw unwind data of all runtime functions, or ``0`` for architectures without unwind data."""
+        return self._columns[2]
+
+    def function_at(self, address: int) -> RuntimeFunction | None:
+        """Return the runtime function containing the given relative virtual address (RVA), if any.
+
+        Args:
+            address: The RVA to look up.
+        """
+        begins, order = self._index
+        if (idx := bisect_right(begins, address) - 1) < 0:
+            return None
+
+        idx = order[idx] if order is not None else idx
+        if address >= self.end_addresses[idx]:
+            return None
+        return self.functions[idx]
+
+    def functions_at(self, addresses: Iterable[int]) -> list[RuntimeFunction | None]:
+        """Return the runtime functions containing the given relative virtual addresses (RVA).
+
+        If NumPy is available and ``addresses`` is a NumPy array, the lookup is vectorized.
+
+        Args:
+            addresses: The RVAs to look up.
+        """
+        if not (HAS_NUMPY and isinstance(addresses, np.ndarray)):
+            return [self.function_at(address) for address in addresses]
+
+        functions = self.functions
+        if not functions:
+            return [None] * len(addresses)
+
+        begins, ends, order = self._arrays
+        addresses = addresses.astype(np.int64, copy=False)
+
+        idx = np.searchsorted(begins, addresses, side="right") - 1
+        valid = idx >= 0
+        idx[~valid] = 0
+
+        idx = order[idx]
+        valid &= addresses < ends[idx]
+        return [functions[i] if v else None for i, v in zip(idx.tolist(), valid.tolist(), strict=True)]
+
+    def unwind_info(self, address: int) -> UnwindInfo:
+        """Return the x64 unwind information at the given relative virtual address (RVA).
+
+        Unwind information is often shared by many runtime functions, so it's only parsed once per address.
+
+        Args:
+            address: The RVA of the unwind information.
+        """
+        if (info := self._unwind_cache.get(address)) is None:
+            info = self._unwind_cache.setdefault(address, UnwindInfo(self, address))
+        return info
+
+    @cached_property
+    def _unwind_cache(self) -> dict[int, UnwindInfo]:
+        return {}
+
+    @cached_property
+    def _columns(self) -> tuple[array, array, array]:
+        """Decode the begin and end addresses and the unwind data of all exception entries from the raw bytes."""
+        ctype = self.ctype
+        typecode = "Q" if ctype is c_pe.IMAGE_ALPHA64_RUNTIME_FUNCTION_ENTRY else "I"
+
+        count = self.size // len(ctype)
+        raw = array(typecode, self.pe.read_at(self.address, count * len(ctype)))
+        if sys.byteorder == "big":
+            raw.byteswap()
+
+        fields = len(ctype) // raw.itemsize
+        raw = raw[: (len(raw) // fields) * fields]
+        begins = raw[0::fields]
+
+        if ctype in (c_pe.IMAGE_ARM_RUNTIME_FUNCTION_ENTRY, c_pe.IMAGE_ARM64_RUNTIME_FUNCTION_ENTRY):
+            unwind = raw[1::fields]
+            ends = array(
+                "Q", (begin + self._arm_function_length(data) for begin, data in zip(begins, unwind, strict=True))
+            )
+        elif ctype is c_pe.IMAGE_RUNTIME_FUNCTION_ENTRY:
+            ends = raw[1::fields]
+            unwind = raw[2::fields]
         else:
-            # May be wrong for esoteric architectures, but this is the default
-            ctype = c_pe.IMAGE_RUNTIME_FUNCTION_ENTRY
+            ends = raw[1::fields]
+            unwind = array(typecode, bytes(len(begins) * raw.itemsize))
+
+        return begins, ends, unwind
+
+    def _arm_function_length(self, unwind_data: int) -> int:
+        """Return the function length in bytes of an ARM or ARM64 exception entry."""
+        # ARM (Thumb-2) instructions are counted in halfwords, ARM64 instructions in words
+        unit = 4 if self.ctype is c_pe.IMAGE_ARM64_RUNTIME_FUNCTION_ENTRY else 2
+
+        if unwind_data & 0b11:
+            # Packed unwind data
+            return ((unwind_data >> 2) & 0x7FF) * unit
+
+        # Reference to the .xdata record, whose first word contains the function length
+        xdata = int.from_bytes(self.pe.read_at(unwind_data, 4).ljust(4, b"\x00"), "little")
+        return (xdata & 0x3FFFF) * unit
+
+    @cached_property
+    def _index(self) -> tuple[array, list[int] | None]:
+        """The begin addresses in ascending order, and the order of the entries if they are not already sorted."""
+        begins = self.begin_addresses
+        if all(begins[idx] <= begins[idx + 1] for idx in range(len(begins) - 1)):
+            return begins, None
+
+        order = sorted(range(len(begins)), key=begins.__getitem__)
+        return array(begins.typecode, (begins[idx] for idx in order)), order
+
+    @cached_property
+    def _arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The sorted begin addresses, the end addresses and the order of the entries as NumPy arrays."""
+        begins, order = self._index
+        return (
+            np.array(begins, dtype=np.int64),
+            np.array(self.end_addresses, dtype=np.int64),
+            np.arange(len(begins), dtype=np.int64) if order is None else np.array(order, dtype=np.int64),
+        )
+
+
+class RuntimeFunction:
+    """A runtime function in the exception directory.
+
+    This is a view on the columns of the :class:`ExceptionDirectory` it belongs to.
+    """
+
+    __slots__ = ("directory", "index")
+
+    def __init__(self, directory: ExceptionDirectory, index: int):
+        self.directory = directory
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"<RuntimeFunction begin_address={self.begin_address:#x} end_address={self.end_address:#x}>"
+
+    @property
+    def begin_address(self) -> int:
+        """The relative virtual address (RVA) of the start of the function."""
+        return self.directory.begin_addresses[self.index]
+
+    @property
+    def end_address(self) -> int:
+        """The relative virtual address (RVA) of the end of the function (exclusive)."""
+        return self.directory.end_addresses[self.index]
+
+    @property
+    def unwind_data(self) -> int:
+        """The raw unwind data of the function, or ``0`` for architectures without unwind data."""
+        return self.directory.unwind_data[self.index]
+
+    @property
+    def unwind_info(self) -> UnwindInfo | None:
+        """The x64 unwind information of the function, or ``None`` if the function has no x64 unwind information."""
+        if self.directory.pe.machine != c_pe.IMAGE_FILE_MACHINE.AMD64:
+            return None
+
+        address = self.unwind_data
+        if address & RUNTIME_FUNCTION_INDIRECT:
+            # The unwind data refers to another runtime function entry, which holds the actual unwind information
+            address = struct.unpack("<8xI", self.directory.pe.read_at(address & ~RUNTIME_FUNCTION_INDIRECT, 12))[0]
+
+        return self.directory.unwind_info(address)
+
+    @property
+    def entry(
+        self,
+    ) -> (
+        c_pe.IMAGE_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_ARM_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_ARM64_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_ALPHA_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_ALPHA64_RUNTIME_FUNCTION_ENTRY
+        | c_pe.IMAGE_MIPS_RUNTIME_FUNCTION_ENTRY
+    ):
+        """The raw exception entry of the function."""
+        return self.directory.entries[self.index]
+
+
+class UnwindCode(NamedTuple):
+    """A decoded x64 unwind code.
+
+    The ``operand`` is the allocation size or the stack offset of the operation, or ``None`` if the operation has no
+    operand.
+    """
+
+    offset: int
+    op: c_pe.UWOP
+    info: int
+    operand: int | None
+
+
+class UnwindInfo:
+    """The x64 unwind information of one or more runtime functions.
+
+    Args:
+        directory: The exception directory the unwind information belongs to.
+        address: The relative virtual address (RVA) of the unwind information.
+    """
+
+    def __init__(self, directory: ExceptionDirectory, address: int):
+        self.directory = directory
+        self.address = address
+
+        header = directory.pe.read_at(address, 4).ljust(4, b"\x00")
+        self.version = header[0] & 0x7
+        self.flags = c_pe.UNW_FLAG(header[0] >> 3)
+        self.size_of_prolog = header[1]
+        self.frame_register = header[3] & 0xF
+        self.frame_offset = (header[3] >> 4) * 16
+
+        # The unwind codes are padded to an even number of slots
+        count = header[2]
+        codes_size = ((count + 1) & ~1) * 2
+        buf = directory.pe.read_at(address + 4, codes_size + 12).ljust(codes_size + 12, b"\x00")
+        self.codes = _decode_unwind_codes(buf[: count * 2])
+
+        self.handler = None
+        """The RVA of the exception handler, if any."""
+        self.handler_data = None
+        """The RVA of the language specific handler data, if any."""
+        self.chained_function = None
+        """The begin address, end address and unwind information address of the chained runtime function, if any."""
+
+        if self.flags & c_pe.UNW_FLAG.CHAININFO:
+            self.chained_function = struct.unpack_from("<3I", buf, codes_size)
+        elif self.flags & (c_pe.UNW_FLAG.EHANDLER | c_pe.UNW_FLAG.UHANDLER):
+            self.handler = struct.unpack_from("<I", buf, codes_size)[0]
+            self.handler_data = address + 4 + codes_size + 4
+
+    def __repr__(self) -> str:
+        return f"<UnwindInfo address={self.address:#x} flags={self.flags} codes={len(self.codes)}>"
+
+    @property
+    def chained(self) -> UnwindInfo | None:
+        """The unwind information of the chained runtime function, if any."""
+        if self.chained_function is None:
+            return None
+        return self.directory.unwind_info(self.chained_function[2])
+
+    def chain(self) -> Iterator[UnwindInfo]:
+        """Yield this unwind information, followed by all chained unwind information."""
+        seen = set()
+        info = self
+        while info is not None and info.address not in seen:
+            seen.add(info.address)
+            yield info
+            info = info.chained
+
+
+def _decode_unwind_codes(buf: bytes) -> list[UnwindCode]:
+    """Decode the x64 unwind codes in the given buffer."""
+    slots = array("H", buf)
+    if sys.byteorder == "big":
+        slots.byteswap()
+
+    codes = []
+    idx = 0
+    while idx < len(slots):
+        offset = slots[idx] & 0xFF
+        op = (slots[idx] >> 8) & 0xF
+        info = slots[idx] >> 12
+
+        if op >= len(UNWIND_OP_SLOTS):
+            # Invalid unwind operation, the remaining slots can't be decoded
+            break
+
+        size = UNWIND_OP_SLOTS[op] + (op == c_pe.UWOP.ALLOC_LARGE and info != 0)
+        if idx + size > len(slots):
+            break
+
+        operand = None
+        if op == c_pe.UWOP.ALLOC_SMALL:
+            operand = info * 8 + 8
+        elif op in (c_pe.UWOP.ALLOC_LARGE, c_pe.UWOP.SAVE_NONVOL, c_pe.UWOP.SAVE_XMM128):
+            if size == 2:
+                operand = slots[idx + 1] * (16 if op == c_pe.UWOP.SAVE_XMM128 else 8)
+            else:
+                operand = slots[idx + 1] | (slots[idx + 2] << 16)
+        elif op in (c_pe.UWOP.SAVE_NONVOL_FAR, c_pe.UWOP.SAVE_XMM128_FAR):
+            operand = slots[idx + 1] | (slots[idx + 2] << 16)
+
+        codes.append(UnwindCode(offset, c_pe.UWOP(op), info, operand))
+        idx += size
 
-        return ctype[self.size // len(ctype)](self.pe.vfh)
+    return codes
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
 from functools import cached_property
 from typing import TYPE_CHECKING
 
@@ -13,6 +15,11 @@ if TYPE_CHECKING:
     import datetime
     from collections.abc import Iterator
 
+    from dissect.executable.pe.pe import PE
+
+# The maximum span of export names to read in a single read
+NAME_SPAN = 0x100000
+
 
 class ExportDirectory(DataDirectory):
     """The export directory of a PE file."""
@@ -42,8 +49,7 @@ class ExportDirectory(DataDirectory):
     @cached_property
     def header(self) -> c_pe.IMAGE_EXPORT_DIRECTORY:
         """The export directory header."""
-        self.pe.vfh.seek(self.address)
-        return c_pe.IMAGE_EXPORT_DIRECTORY(self.pe.vfh)
+        return c_pe.IMAGE_EXPORT_DIRECTORY(self.pe.read_at(self.address, len(c_pe.IMAGE_EXPORT_DIRECTORY)))
 
     @property
     def timestamp(self) -> datetime.datetime | None:
@@ -56,8 +62,7 @@ class ExportDirectory(DataDirectory):
     def name(self) -> str | None:
         """The name of the export directory, if available."""
         if self.header.Name:
-            self.pe.vfh.seek(self.header.Name)
-            return c_pe.char[None](self.pe.vfh).decode()
+            return c_pe.char[None](self.pe.open(self.header.Name)).decode()
         return None
 
     @property
@@ -65,33 +70,51 @@ class ExportDirectory(DataDirectory):
         """The base ordinal of the exported functions."""
         return self.header.Base
 
+    @cached_property
+    def table(self) -> ExportTable:
+        """The exported functions, stored column-wise."""
+        num_functions = self.header.NumberOfFunctions
+        num_names = self.header.NumberOfNames
+
+        addresses = _read_array(self.pe, "I", self.header.AddressOfFunctions, num_functions)
+        names = _read_array(self.pe, "I", self.header.AddressOfNames, num_names)
+        ordinals = _read_array(self.pe, "H", self.header.AddressOfNameOrdinals, num_names)
+
+        return ExportTable(self, names, ordinals, addresses)
+
     @cached_property
     def functions(self) -> list[ExportFunction]:
         """List of exported functions."""
-        result = []
+        return [ExportFunction(self, idx) for idx in range(len(self.table))]
 
-        self.pe.vfh.seek(self.header.AddressOfFunctions)
-        addresses = c_pe.ULONG[self.header.NumberOfFunctions](self.pe.vfh)
+    def by_address(self, address: int) -> ExportFunction | None:
+        """Return the exported function at exactly the given relative virtual address (RVA), if any.
 
-        self.pe.vfh.seek(self.header.AddressOfNames)
-        names = c_pe.ULONG[self.header.NumberOfNames](self.pe.vfh)
+        Forwarders are not included, as they don't have an address in this PE file.
 
-        self.pe.vfh.seek(self.header.AddressOfNameOrdinals)
-        ordinals = c_pe.USHORT[self.header.NumberOfNames](self.pe.vfh)
+        Args:
+            address: The RVA to look up.
+        """
+        if (func := self.nearest(address)) is not None and func.address == address:
+            return func
+        return None
 
-        for name_ptr, ordinal in zip(names, ordinals, strict=False):
-            self.pe.vfh.seek(name_ptr)
-            name = c_pe.CHAR[None](self.pe.vfh).decode()
+    def nearest(self, address: int) -> ExportFunction | None:
+        """Return the exported function with the highest address at or before the given relative virtual address (RVA).
 
-            address = addresses[ordinal]
-            forwarder = None
-            if self.address <= address < self.address + self.size:
-                self.pe.vfh.seek(address)
-                forwarder = c_pe.CHAR[None](self.pe.vfh).decode()
+        Export sizes are not known, so this is the export the given RVA most likely belongs to.
+        Forwarders are not included, as they don't have an address in this PE file.
 
-            result.append(ExportFunction(self, ordinal, name, address, forwarder))
+        Args:
+            address: The RVA to look up.
+        """
+        addresses, indices = self.table.address_index
+        if (idx := bisect_right(addresses, address) - 1) < 0:
+            return None
 
-        return result
+        # Multiple names may share the same address, return the first
+        idx = bisect_left(addresses, addresses[idx])
+        return self.functions[indices[idx]]
 
     @cached_property
     def _by_name(self) -> dict[str, ExportFunction]:
@@ -104,25 +127,128 @@ class ExportDirectory(DataDirectory):
         return {func.ordinal: func for func in self.functions}
 
 
-@dataclass
+class ExportTable:
+    """The named exports of an export directory, stored column-wise.
+
+    Names and forwarders are decoded lazily, when first accessed.
+
+    Args:
+        directory: The export directory the exports belong to.
+        names: The relative virtual addresses (RVA) of the export names.
+        ordinals: The unbiased ordinals of the exports.
+        functions: The export address table, indexed by unbiased ordinal.
+    """
+
+    def __init__(self, directory: ExportDirectory, names: array, ordinals: array, functions: array):
+        self.directory = directory
+        self.pe: PE = directory.pe
+
+        self.name_addresses = names
+        self.ordinals = ordinals[: len(names)]
+
+        num_functions = len(functions)
+        self.addresses = array("I", (functions[ordinal] if ordinal < num_functions else 0 for ordinal in self.ordinals))
+
+        # Addresses within the export directory are forwarder strings
+        start, end = directory.address, directory.address + directory.size
+        self.forwarders = array("B", (start <= address < end for address in self.addresses))
+
+        self._names: list[str | None] = [None] * len(self.ordinals)
+
+    def __repr__(self) -> str:
+        return f"<ExportTable exports={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def name(self, index: int) -> str:
+        """Return the name of the export at the given index."""
+        if (name := self._names[index]) is None:
+            address = self.name_addresses[index]
+            start, buf = self._name_buffer
+
+            offset = address - start
+            if offset >= 0 and (end := buf.find(b"\x00", offset)) != -1:
+                name = buf[offset:end].decode()
+            else:
+                # Not (entirely) within the buffer, read it separately
+                name = c_pe.CHAR[None](self.pe.open(address)).decode()
+            self._names[index] = name
+        return name
+
+    def forwarder(self, index: int) -> str | None:
+        """Return the forwarder of the export at the given index, if it is a forwarder."""
+        if not self.forwarders[index]:
+            return None
+        return c_pe.CHAR[None](self.pe.open(self.addresses[index])).decode()
+
+    @cached_property
+    def address_index(self) -> tuple[array, list[int]]:
+        """The addresses of all exports that are not forwarders in ascending order, and their indices."""
+        indices = sorted((idx for idx in range(len(self)) if not self.forwarders[idx]), key=self.addresses.__getitem__)
+        return array("I", (self.addresses[idx] for idx in indices)), indices
+
+    @cached_property
+    def _name_buffer(self) -> tuple[int, bytes]:
+        """A single buffer spanning all export names, if they are close enough together."""
+        if not self.name_addresses:
+            return 0, b""
+
+        start = min(self.name_addresses)
+        span = max(self.name_addresses) - start
+        if span > NAME_SPAN:
+            return 0, b""
+        return start, self.pe.read_at(start, span + 0x200)
+
+
 class ExportFunction:
-    directory: ExportDirectory
-    """The export directory this function belongs to."""
-    unbiased_ordinal: int
-    """The unbiased ordinal of the exported function."""
-    name: str
-    """The name of the exported function."""
-    address: int
-    """The address of the exported function."""
-    forwarder: str | None = None
-    """The forwarder of the exported function, if it is a forwarder."""
+    """A function exported by a PE file.
+
+    This is a view on the :class:`ExportTable` of the export directory it belongs to.
+    """
+
+    __slots__ = ("directory", "index")
+
+    def __init__(self, directory: ExportDirectory, index: int):
+        self.directory = directory
+        self.index = index
 
     def __repr__(self) -> str:
         if self.forwarder:
             return f"<ExportFunction ordinal={self.ordinal} name={self.name!r} forwarder={self.forwarder!r}>"
         return f"<ExportFunction ordinal={self.ordinal} name={self.name!r} address={self.address:#x}>"
 
+    @property
+    def unbiased_ordinal(self) -> int:
+        """The unbiased ordinal of the exported function."""
+        return self.directory.table.ordinals[self.index]
+
     @property
     def ordinal(self) -> int:
         """The unbiased ordinal with the base ordinal added."""
         return self.unbiased_ordinal + self.directory.base
+
+    @property
+    def name(self) -> str:
+        """The name of the exported function."""
+        return self.directory.table.name(self.index)
+
+    @property
+    def address(self) -> int:
+        """The address of the exported function."""
+        return self.directory.table.addresses[self.index]
+
+    @property
+    def forwarder(self) -> str | None:
+        """The forwarder of the exported function, if it is a forwarder."""
+        return self.directory.table.forwarder(self.index)
+
+
+def _read_array(pe: PE, typecode: str, address: int, count: int) -> array:
+    """Read an array of ``count`` little endian integers at the given relative virtual address (RVA)."""
+    result = array(typecode)
+    buf = pe.read_at(address, count * result.itemsize) if count else b""
+    result.frombytes(buf[: len(buf) - (len(buf) % result.itemsize)])
+    if sys.byteorder == "big":
+        result.byteswap()
+    return result
@@ -28,6 +28,6 @@ class IatDirectory(DataDirectory):
     @cached_property
     def entries(self) -> list[int]:
         """List of addresses in the import address table."""
-        self.pe.vfh.seek(self.address)
         ctype = c_pe.ULONGLONG if self.pe.is_64bit() else c_pe.ULONG
-        return ctype[self.size // len(ctype)](self.pe.vfh)
+        count = self.size // len(ctype)
+        return ctype[count](self.pe.view(self.address, count * len(ctype)))
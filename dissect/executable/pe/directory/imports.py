@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import sys
+from array import array
 from functools import cached_property
 from typing import TYPE_CHECKING
 
@@ -17,6 +19,11 @@ if TYPE_CHECKING:
 
     from dissect.executable.pe.pe import PE
 
+# The number of thunks to read at once when reading a null terminated thunk array
+THUNK_CHUNK_SIZE = 0x200
+# The maximum span of hint/name entries to read in a single read
+HINT_NAME_SPAN = 0x100000
+
 
 class ImportDirectory(DataDirectory):
     """The import directory of a PE file."""
@@ -44,8 +51,10 @@ class ImportDirectory(DataDirectory):
     @cached_property
     def modules(self) -> list[ImportModule]:
         """List of imported modules."""
-        self.pe.vfh.seek(self.address)
-        return [ImportModule(self.pe, descriptor) for descriptor in c_pe.IMAGE_IMPORT_DESCRIPTOR[None](self.pe.vfh)]
+        return [
+            ImportModule(self.pe, descriptor)
+            for descriptor in c_pe.IMAGE_IMPORT_DESCRIPTOR[None](self.pe.open(self.address))
+        ]
 
     @cached_property
     def _by_name(self) -> dict[str, ImportModule]:
@@ -92,24 +101,22 @@ class ImportModule:
     @cached_property
     def name(self) -> str:
         """The name of the imported module."""
-        self.pe.vfh.seek(self.descriptor.Name)
-        return c_pe.char[None](self.pe.vfh).decode()
+        return c_pe.char[None](self.pe.open(self.descriptor.Name)).decode()
 
     @cached_property
-    def functions(self) -> list[ImportFunction]:
-        """List of functions imported from this module."""
-        ctype = c_pe.IMAGE_THUNK_DATA64 if self.pe.is_64bit() else c_pe.IMAGE_THUNK_DATA32
+    def thunks(self) -> ThunkTable:
+        """The decoded thunks of this module, stored column-wise."""
+        # Some linkers don't emit a lookup table, in which case the (unbound) address table is used instead
+        lookup_address = self.descriptor.OriginalFirstThunk or self.descriptor.FirstThunk
 
-        self.pe.vfh.seek(self.descriptor.OriginalFirstThunk)
-        lookup_table = ctype[None](self.pe.vfh)
+        lookup = read_thunks(self.pe, lookup_address)
+        addresses = read_thunks(self.pe, self.descriptor.FirstThunk, len(lookup))
+        return ThunkTable(self.pe, lookup, addresses)
 
-        self.pe.vfh.seek(self.descriptor.FirstThunk)
-        address_table = ctype[None](self.pe.vfh)
-
-        return [
-            ImportFunction(self, lookup_thunk, address_thunk)
-            for lookup_thunk, address_thunk in zip(lookup_table, address_table, strict=False)
-        ]
+    @cached_property
+    def functions(self) -> list[ImportFunction]:
+        """List of functions imported from this module."""
+        return [ImportFunction(self, idx) for idx in range(len(self.thunks))]
 
     @cached_property
     def _by_name(self) -> dict[str, ImportFunction]:
@@ -123,29 +130,149 @@ class ImportModule:
 
 
 class ImportFunction:
-    """A function imported from a module."""
-
-    def __init__(
-        self,
-        module: ImportModule,
-        lookup_thunk: c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64,
-        address_thunk: c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64,
-    ):
-        self.module = module
-        self.lookup_thunk = lookup_thunk
-        self.address_thunk = address_thunk
+    """A function imported from a module.
 
-        if lookup_thunk.u1.Ordinal & (c_pe.IMAGE_ORDINAL_FLAG64 if module.pe.is_64bit() else c_pe.IMAGE_ORDINAL_FLAG32):
-            self.ordinal = lookup_thunk.u1.Ordinal & 0xFFFF
-            self.name = None
-        else:
-            self.module.pe.vfh.seek(lookup_thunk.u1.AddressOfData & (c_pe.IMAGE_ORDINAL_FLAG32 - 1))
-            import_by_name = c_pe.IMAGE_IMPORT_BY_NAME(self.module.pe.vfh)
-            self.ordinal = import_by_name.Hint
-            self.name = import_by_name.Name.decode()
+    This is a view on the :class:`ThunkTable` of the module it belongs to.
+    """
 
-        self.address = address_thunk.u1.Function if lookup_thunk.u1.Function != address_thunk.u1.Function else None
+    def __init__(self, module: ImportModule, index: int):
+        self.module = module
+        self.index = index
 
     def __repr__(self) -> str:
         address = hex(self.address) if self.address is not None else "None"
         return f"<ImportFunction name={self.name!r} ordinal={self.ordinal} address={address}>"
+
+    @property
+    def name(self) -> str | None:
+        """The name of the imported function, or ``None`` if it's imported by ordinal."""
+        return self.module.thunks.names[self.index]
+
+    @property
+    def ordinal(self) -> int:
+        """The ordinal of the imported function, or its hint if it's imported by name."""
+        return self.module.thunks.ordinals[self.index]
+
+    @property
+    def address(self) -> int | None:
+        """The bound address of the imported function, or ``None`` if it's not bound."""
+        return self.module.thunks.address(self.index)
+
+    @property
+    def lookup_thunk(self) -> c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64:
+        """The lookup thunk of the imported function."""
+        return self.module.thunks.thunk(self.module.thunks.lookup, self.index)
+
+    @property
+    def address_thunk(self) -> c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64:
+        """The address thunk of the imported function."""
+        return self.module.thunks.thunk(self.module.thunks.addresses, self.index)
+
+
+class ThunkTable:
+    """The decoded thunks of an import lookup table and the accompanying import address table, stored column-wise.
+
+    Ordinals and hint/name entries are resolved in a single pass when the table is created.
+
+    Args:
+        pe: The PE file the thunks belong to.
+        lookup: The raw values of the lookup (or name) thunks.
+        addresses: The raw values of the address thunks.
+    """
+
+    def __init__(self, pe: PE, lookup: array, addresses: array):
+        self.pe = pe
+        self.lookup = lookup
+        self.addresses = addresses
+
+        ordinal_flag = c_pe.IMAGE_ORDINAL_FLAG64 if pe.is_64bit() else c_pe.IMAGE_ORDINAL_FLAG32
+
+        self.ordinals: list[int] = [value & 0xFFFF for value in lookup]
+        self.names: list[str | None] = [None] * len(lookup)
+
+        by_name = [idx for idx, value in enumerate(lookup) if not value & ordinal_flag]
+        hint_names = read_hint_names(pe, [lookup[idx] & (c_pe.IMAGE_ORDINAL_FLAG32 - 1) for idx in by_name])
+        for idx, (hint, name) in zip(by_name, hint_names, strict=True):
+            self.ordinals[idx] = hint
+            self.names[idx] = name
+
+    def __repr__(self) -> str:
+        return f"<ThunkTable thunks={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self.lookup)
+
+    def address(self, index: int) -> int | None:
+        """Return the bound address of the thunk at the given index, or ``None`` if it's not bound."""
+        if index >= len(self.addresses) or (value := self.addresses[index]) == self.lookup[index]:
+            return None
+        return value
+
+    def thunk(self, table: array, index: int) -> c_pe.IMAGE_THUNK_DATA32 | c_pe.IMAGE_THUNK_DATA64:
+        """Return the thunk at the given index of the given table as a structure."""
+        ctype = c_pe.IMAGE_THUNK_DATA64 if self.pe.is_64bit() else c_pe.IMAGE_THUNK_DATA32
+        value = table[index] if index < len(table) else 0
+        return ctype(value.to_bytes(len(ctype), "little"))
+
+
+def read_thunks(pe: PE, address: int, count: int | None = None) -> array:
+    """Read an array of thunks as raw integers.
+
+    Args:
+        pe: The PE file to read from.
+        address: The relative virtual address (RVA) of the thunk array.
+        count: The number of thunks to read, or ``None`` to read up to (and excluding) the terminating null thunk.
+    """
+    typecode, size = ("Q", 8) if pe.is_64bit() else ("I", 4)
+    result = array(typecode)
+    if not address:
+        return result
+
+    while count is None or len(result) < count:
+        read_count = THUNK_CHUNK_SIZE if count is None else count - len(result)
+        buf = pe.read_at(address, read_count * size)
+        if not (buf := buf[: len(buf) - (len(buf) % size)]):
+            break
+
+        chunk = array(typecode, buf)
+        if sys.byteorder == "big":
+            chunk.byteswap()
+
+        if count is None and 0 in chunk:
+            result.extend(chunk[: chunk.index(0)])
+            break
+
+        result.extend(chunk)
+        address += len(buf)
+
+    return result
+
+
+def read_hint_names(pe: PE, addresses: list[int]) -> list[tuple[int, str]]:
+    """Read the hint/name entries at the given addresses.
+
+    Hint/name entries are usually stored close together, so they're read in a single pass over one buffer
+    when possible.
+
+    Args:
+        pe: The PE file to read from.
+        addresses: The relative virtual addresses (RVA) of the ``IMAGE_IMPORT_BY_NAME`` entries.
+    """
+    if not addresses:
+        return []
+
+    start = min(addresses)
+    span = max(addresses) - start
+    buf = pe.read_at(start, span + 0x200) if span <= HINT_NAME_SPAN else b""
+
+    result = []
+    for address in addresses:
+        offset = address - start
+        if (end := buf.find(b"\x00", offset + 2)) != -1:
+            result.append((int.from_bytes(buf[offset : offset + 2], "little"), buf[offset + 2 : end].decode()))
+        else:
+            # Not (entirely) within the buffer, read it separately
+            import_by_name = c_pe.IMAGE_IMPORT_BY_NAME(pe.open(address))
+            result.append((import_by_name.Hint, import_by_name.Name.decode()))
+
+    return result
@@ -18,9 +18,8 @@ class LoadConfigDirectory(DataDirectory):
     @cached_property
     def config(self) -> c_pe.IMAGE_LOAD_CONFIG_DIRECTORY32 | c_pe.IMAGE_LOAD_CONFIG_DIRECTORY64:
         """The load configuration directory header."""
-        self.pe.vfh.seek(self.address)
         ctype = c_pe.IMAGE_LOAD_CONFIG_DIRECTORY64 if self.pe.is_64bit() else c_pe.IMAGE_LOAD_CONFIG_DIRECTORY32
-        return ctype(self.pe.vfh)
+        return ctype(self.pe.open(self.address))
 
     @property
     def timestamp(self) -> datetime.datetime | None:
@@ -48,11 +47,9 @@ class LoadConfigDirectory(DataDirectory):
             return None
 
         rva = self.pe.va_to_rva(self.config.CHPEMetadataPointer)
-        self.pe.vfh.seek(rva)
         if self.pe.machine == c_pe.IMAGE_FILE_MACHINE.ARM64:
-            version = c_pe.ULONG(self.pe.vfh)
-            self.pe.vfh.seek(rva)
+            version = c_pe.ULONG(self.pe.read_at(rva, 4))
             if version == 2:
-                return c_pe.IMAGE_ARM64EC_METADATA_V2(self.pe.vfh)
-            return c_pe.IMAGE_ARM64EC_METADATA(self.pe.vfh)
-        return c_pe.IMAGE_CHPE_METADATA_X86(self.pe.vfh)
+                return c_pe.IMAGE_ARM64EC_METADATA_V2(self.pe.open(rva))
+            return c_pe.IMAGE_ARM64EC_METADATA(self.pe.open(rva))
+        return c_pe.IMAGE_CHPE_METADATA_X86(self.pe.open(rva))
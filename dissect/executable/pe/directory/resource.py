@@ -105,6 +105,52 @@ class ResourceDirectory(DataDirectory):
 
         raise KeyError(f"Resource with type {type.name!r} and name {name!r} not found")
 
+    def lookup(
+        self, type: int | str | c_pe.RT, name: int | str, language: int | str | None = None
+    ) -> ResourceDataEntry | None:
+        """Look up a single resource data entry by type, name and language.
+
+        Args:
+            type: The type of the resource (e.g. ``c_pe.RT.ICON``) or the name of a custom resource type.
+            name: The name of the resource, which can be a string or an integer ID.
+            language: The language of the resource, as LCID or language tag.
+                      If ``None``, the first available language is used.
+        """
+        if isinstance(type, str) and type in c_pe.RT.__members__:
+            type = c_pe.RT[type]
+
+        if language is None:
+            if (type_entry := self.tree.get(type)) is None or (name_entry := type_entry.get(name)) is None:
+                return None
+            return next((entry for _, entry in name_entry.iterdir() if isinstance(entry, ResourceDataEntry)), None)
+
+        if isinstance(language, str):
+            language = TAG_TO_LCID.get(language, language)
+
+        return self.index.get((_key(type), _key(name), _key(language)))
+
+    @cached_property
+    def index(self) -> dict[tuple[int | str, int | str, int | str], ResourceDataEntry]:
+        """A flattened index of all resource data entries, built once on first access.
+
+        Maps ``(type, name, language)`` to the :class:`ResourceDataEntry`. Integer types (including ``c_pe.RT``
+        members), names and languages are stored as plain integers.
+        """
+        result = {}
+        for type, type_entry in self.tree.iterdir():
+            if not isinstance(type_entry, ResourceDirectoryEntry):
+                continue
+
+            for name, name_entry in type_entry.iterdir():
+                if not isinstance(name_entry, ResourceDirectoryEntry):
+                    continue
+
+                for language, entry in name_entry.iterdir():
+                    if isinstance(entry, ResourceDataEntry):
+                        result.setdefault((_key(type), _key(name), _key(language)), entry)
+
+        return result
+
     @cached_property
     def resources(self) -> list[Resource]:
         """Return a list of all resources."""
@@ -498,8 +544,7 @@ class ResourceDataEntry(ResourceEntry):
     @cached_property
     def entry(self) -> c_pe.IMAGE_RESOURCE_DATA_ENTRY:
         """The resource data entry structure."""
-        self.rsrc.pe.vfh.seek(self.address)
-        return c_pe.IMAGE_RESOURCE_DATA_ENTRY(self.rsrc.pe.vfh)
+        return c_pe.IMAGE_RESOURCE_DATA_ENTRY(self.rsrc.pe.read_at(self.address, len(c_pe.IMAGE_RESOURCE_DATA_ENTRY)))
 
     @property
     def offset_to_data(self) -> int:
@@ -519,12 +564,11 @@ class ResourceDataEntry(ResourceEntry):
     @property
     def data(self) -> bytes:
         """The raw resource data."""
-        self.rsrc.pe.vfh.seek(self.offset_to_data)
-        return self.rsrc.pe.vfh.read(self.size)
+        return self.rsrc.pe.read_at(self.offset_to_data, self.size)
 
     def open(self) -> RangeStream:
         """Open the resource data as a stream."""
-        return RangeStream(self.rsrc.pe.vfh, self.offset_to_data, self.size)
+        return RangeStream(self.rsrc.pe.open(), self.offset_to_data, self.size)
 
 
 class ResourceDirectoryEntry(ResourceEntry):
@@ -536,8 +580,7 @@ class ResourceDirectoryEntry(ResourceEntry):
     @cached_property
     def entry(self) -> c_pe.IMAGE_RESOURCE_DIRECTORY:
         """The resource directory entry structure."""
-        self.rsrc.pe.vfh.seek(self.address)
-        return c_pe.IMAGE_RESOURCE_DIRECTORY(self.rsrc.pe.vfh)
+        return c_pe.IMAGE_RESOURCE_DIRECTORY(self.rsrc.pe.read_at(self.address, len(c_pe.IMAGE_RESOURCE_DIRECTORY)))
 
     @property
     def timestamp(self) -> datetime.datetime | None:
@@ -548,26 +591,29 @@ class ResourceDirectoryEntry(ResourceEntry):
 
     def get(self, name: int | str | c_pe.RT) -> ResourceDataEntry | ResourceDirectoryEntry | None:
         """Get a resource entry by name."""
-        for id, entry in self.iterdir():
-            if id == name:
-                return entry
-        return None
+        return self._index.get(_key(name))
 
     def listdir(self) -> dict[int | str, ResourceEntry]:
         """Return a dictionary of the entries in this resource directory."""
-        return dict(self.iterdir())
+        return dict(self.entries)
 
     def iterdir(self) -> Iterator[tuple[int | str, ResourceDataEntry | ResourceDirectoryEntry]]:
         """Iterate over the entries in this resource directory."""
-        vfh = self.rsrc.pe.vfh
+        return iter(self.entries)
+
+    @cached_property
+    def entries(self) -> list[tuple[int | str, ResourceDataEntry | ResourceDirectoryEntry]]:
+        """The entries in this resource directory, parsed once on first access."""
+        count = self.entry.NumberOfNamedEntries + self.entry.NumberOfIdEntries
         offset = self.address + len(c_pe.IMAGE_RESOURCE_DIRECTORY)
-        for _ in range(self.entry.NumberOfNamedEntries + self.entry.NumberOfIdEntries):
-            vfh.seek(offset)
-            entry = c_pe.IMAGE_RESOURCE_DIRECTORY_ENTRY(vfh)
+        buf = self.rsrc.pe.read_at(offset, count * len(c_pe.IMAGE_RESOURCE_DIRECTORY_ENTRY))
 
+        result = []
+        for entry in c_pe.IMAGE_RESOURCE_DIRECTORY_ENTRY[count](buf):
             if entry.NameIsString:
-                vfh.seek(self.rsrc.address + entry.NameOffset)
-                name = c_pe.IMAGE_RESOURCE_DIR_STRING_U(vfh).NameString
+                name = c_pe.IMAGE_RESOURCE_DIR_STRING_U(
+                    self.rsrc.pe.open(self.rsrc.address + entry.NameOffset)
+                ).NameString
             else:
                 name = entry.Id
 
@@ -576,6 +622,19 @@ class ResourceDirectoryEntry(ResourceEntry):
             else:
                 obj = ResourceDataEntry(self.rsrc, self.rsrc.address + entry.OffsetToData)
 
-            yield name, obj
+            result.append((name, obj))
+
+        return result
+
+    @cached_property
+    def _index(self) -> dict[int | str, ResourceDataEntry | ResourceDirectoryEntry]:
+        """A mapping of entry names to their entries. The first entry wins if names are duplicated."""
+        result = {}
+        for name, entry in self.entries:
+            result.setdefault(_key(name), entry)
+        return result
+
 
-            offset += len(c_pe.IMAGE_RESOURCE_DIRECTORY_ENTRY)
+def _key(name: int | str | c_pe.RT) -> int | str:
+    """Return the key of a resource entry name, as enum members don't hash like plain integers."""
+    return int(name) if isinstance(name, int) else name
@@ -3,12 +3,33 @@ from __future__ import annotations
 from functools import cached_property
 from typing import TYPE_CHECKING
 
+from dissect.executable.exception import Error
+from dissect.executable.pe import der
 from dissect.executable.pe.c_pe import c_pe
 from dissect.executable.pe.directory.base import DataDirectory
 
 if TYPE_CHECKING:
+    import datetime
     from collections.abc import Iterator
 
+OID_SIGNED_DATA = "1.2.840.113549.1.7.2"
+OID_SIGNING_TIME = "1.2.840.113549.1.9.5"
+OID_COUNTERSIGNATURE = "1.2.840.113549.1.9.6"
+OID_SPC_INDIRECT_DATA = "1.3.6.1.4.1.311.2.1.4"
+OID_SPC_NESTED_SIGNATURE = "1.3.6.1.4.1.311.2.4.1"
+OID_RFC3161_TIMESTAMP = "1.3.6.1.4.1.311.3.3.1"
+
+# The [0] IMPLICIT SubjectKeyIdentifier choice of a SignerIdentifier
+TAG_SUBJECT_KEY_IDENTIFIER = 0x80
+
+DIGEST_ALGORITHMS = {
+    "1.2.840.113549.2.5": "md5",
+    "1.3.14.3.2.26": "sha1",
+    "2.16.840.1.101.3.4.2.1": "sha256",
+    "2.16.840.1.101.3.4.2.2": "sha384",
+    "2.16.840.1.101.3.4.2.3": "sha512",
+}
+
 
 class SecurityDirectory(DataDirectory):
     """The security directory of a PE file."""
@@ -33,12 +54,12 @@ class SecurityDirectory(DataDirectory):
         offset = self.address
         while offset < self.address + self.size:
             # Note: the offset here is a file offset, not an RVA
-            self.pe.fh.seek(offset)
-
-            certificate = c_pe.WIN_CERTIFICATE(self.pe.fh)
-            if certificate.dwLength == 0:
+            length = c_pe.ULONG(self.pe.source.read_at(offset, 4))
+            if length == 0:
                 break
 
+            certificate = c_pe.WIN_CERTIFICATE(self.pe.source.read_at(offset, length))
+
             result.append(Certificate(certificate))
             offset += certificate.dwLength
             offset += -offset & 7  # Align to 8 bytes
@@ -74,3 +95,162 @@ class Certificate:
     def data(self) -> bytes:
         """The raw data of the certificate."""
         return self.certificate.bCertificate
+
+    @cached_property
+    def signature(self) -> Signature | None:
+        """The Authenticode signature in the certificate, if it contains PKCS#7 signed data."""
+        if self.type != c_pe.WIN_CERT_TYPE.PKCS_SIGNED_DATA:
+            return None
+        return Signature(self.data)
+
+
+class Signature:
+    """An Authenticode signature, a PKCS#7 ``SignedData`` structure.
+
+    The signature is decoded lazily by walking the DER structure, only the parts that are needed for the
+    requested information are decoded. Embedded certificates are skipped entirely. Malformed or truncated
+    structures raise an :class:`~dissect.executable.exception.Error` when the affected information is requested.
+
+    Args:
+        data: The DER encoded PKCS#7 ``ContentInfo``.
+    """
+
+    def __init__(self, data: bytes | memoryview):
+        self.content_info = der.Element(memoryview(data))
+
+    def __repr__(self) -> str:
+        try:
+            digest_algorithm = self.digest_algorithm
+            serial_number = self.serial_number
+        except Error:
+            return f"<Signature size={len(self.content_info.raw)} invalid>"
+
+        serial_number = f"{serial_number:#x}" if serial_number is not None else None
+        return f"<Signature digest_algorithm={digest_algorithm} serial_number={serial_number}>"
+
+    @cached_property
+    def signed_data(self) -> list[der.Element]:
+        """The top level elements of the ``SignedData`` structure."""
+        content_type, content = _fields(self.content_info, "ContentInfo", der.TAG_OID, 0xA0)[:2]
+        if content_type.oid() != OID_SIGNED_DATA:
+            raise Error(f"Unsupported PKCS#7 content type: {content_type.oid()}")
+
+        signed_data = _fields(content, "ContentInfo content", der.TAG_SEQUENCE)[0]
+        return _fields(signed_data, "SignedData", der.TAG_INTEGER, der.TAG_SET, der.TAG_SEQUENCE)
+
+    @cached_property
+    def digest_algorithm(self) -> str:
+        """The digest algorithm of the image digest in the ``SpcIndirectDataContent``, e.g. ``sha256``."""
+        oid = _fields(self._indirect_data_digest[0], "AlgorithmIdentifier", der.TAG_OID)[0].oid()
+        return DIGEST_ALGORITHMS.get(oid, oid)
+
+    @cached_property
+    def digest(self) -> bytes:
+        """The image digest in the ``SpcIndirectDataContent``, to compare with :meth:`PE.authenticode`."""
+        return self._indirect_data_digest[1].value.tobytes()
+
+    @cached_property
+    def issuer(self) -> str | None:
+        """The issuer of the signing certificate, if the signer is identified by issuer and serial number."""
+        if (signer_id := self._signer_id) is None:
+            return None
+        return signer_id[0].name()
+
+    @cached_property
+    def serial_number(self) -> int | None:
+        """The serial number of the signing certificate, if the signer is identified by issuer and serial number."""
+        if (signer_id := self._signer_id) is None:
+            return None
+        return signer_id[1].integer()
+
+    @cached_property
+    def signing_time(self) -> datetime.datetime | None:
+        """The signing time, from the signer itself or from a countersignature or RFC3161 timestamp, if any."""
+        return _signing_time(self._signer_info)
+
+    @cached_property
+    def nested(self) -> list[Signature]:
+        """The nested signatures of this signature."""
+        result = []
+        for oid, values in _attributes(self._signer_info, 0xA1):
+            if oid == OID_SPC_NESTED_SIGNATURE:
+                result.extend(Signature(value.raw) for value in values)
+        return result
+
+    @cached_property
+    def _indirect_data_digest(self) -> list[der.Element]:
+        """The ``DigestInfo`` elements of the ``SpcIndirectDataContent``."""
+        content_type, content = _fields(self.signed_data[2], "ContentInfo", der.TAG_OID, 0xA0)[:2]
+        if content_type.oid() != OID_SPC_INDIRECT_DATA:
+            raise Error(f"Unsupported Authenticode content type: {content_type.oid()}")
+
+        indirect_data = _fields(content, "ContentInfo content", der.TAG_SEQUENCE)[0]
+        digest_info = _fields(indirect_data, "SpcIndirectDataContent", der.TAG_SEQUENCE, der.TAG_SEQUENCE)[1]
+        return _fields(digest_info, "DigestInfo", der.TAG_SEQUENCE, der.TAG_OCTET_STRING)[:2]
+
+    @cached_property
+    def _signer_info(self) -> der.Element:
+        """The first ``SignerInfo`` of the signature."""
+        if (signer_infos := self.signed_data[-1]).tag != der.TAG_SET or not (signers := signer_infos.children()):
+            raise Error("Signature does not contain any signer")
+        if signers[0].tag != der.TAG_SEQUENCE:
+            raise Error(f"Invalid SignerInfo at offset {signers[0].offset:#x}")
+        return signers[0]
+
+    @cached_property
+    def _signer_id(self) -> list[der.Element] | None:
+        """The issuer and serial number of the signing certificate, or ``None`` for a subject key identifier."""
+        signer_id = _fields(self._signer_info, "SignerInfo", der.TAG_INTEGER, None)[1]
+        if signer_id.tag == TAG_SUBJECT_KEY_IDENTIFIER:
+            return None
+        return _fields(signer_id, "IssuerAndSerialNumber", der.TAG_SEQUENCE, der.TAG_INTEGER)[:2]
+
+
+def _fields(element: der.Element, name: str, *tags: int | None) -> list[der.Element]:
+    """Return the children of a structure, checking that the leading children exist and have the expected tags.
+
+    Args:
+        element: The element of the structure.
+        name: The name of the structure, used in the error message.
+        *tags: The expected tags of the leading children, ``None`` to accept any tag.
+    """
+    children = element.children()
+    if (
+        element.tag & 0x20 == 0
+        or len(children) < len(tags)
+        or any(tag not in (None, child.tag) for child, tag in zip(children[: len(tags)], tags, strict=True))
+    ):
+        raise Error(f"Invalid {name} at offset {element.offset:#x}")
+    return children
+
+
+def _attributes(signer_info: der.Element, tag: int) -> Iterator[tuple[str, der.Element]]:
+    """Yield the OID and the set of values of the (un)authenticated attributes of a ``SignerInfo``."""
+    if (attributes := signer_info.find(tag)) is None:
+        return
+
+    for attribute in attributes:
+        type_, values = _fields(attribute, "Attribute", der.TAG_OID, der.TAG_SET)[:2]
+        yield type_.oid(), values
+
+
+def _signing_time(signer_info: der.Element) -> datetime.datetime | None:
+    """Return the signing time of a ``SignerInfo``, following countersignatures and timestamps if necessary."""
+    for oid, values in _attributes(signer_info, 0xA0):
+        if oid == OID_SIGNING_TIME:
+            return _fields(values, "signing time", None)[0].time()
+
+    for oid, values in _attributes(signer_info, 0xA1):
+        if oid == OID_COUNTERSIGNATURE:
+            return _signing_time(_fields(values, "countersignature", der.TAG_SEQUENCE)[0])
+
+        if oid == OID_RFC3161_TIMESTAMP:
+            # The timestamp token is signed data containing a TSTInfo structure, of which the genTime is the 5th field
+            token = Signature(_fields(values, "timestamp", der.TAG_SEQUENCE)[0].raw)
+            content = _fields(token.signed_data[2], "ContentInfo", der.TAG_OID, 0xA0)[1]
+            tst_info = der.Element(_fields(content, "ContentInfo content", der.TAG_OCTET_STRING)[0].value)
+            return _fields(tst_info, "TSTInfo", der.TAG_INTEGER, der.TAG_OID, der.TAG_SEQUENCE, der.TAG_INTEGER, None)[
+                4
+            ].time()
+
+    return None
@@ -28,9 +28,8 @@ class TlsDirectory(DataDirectory):
     @cached_property
     def header(self) -> c_pe.IMAGE_TLS_DIRECTORY32 | c_pe.IMAGE_TLS_DIRECTORY64:
         """The TLS directory header."""
-        self.pe.vfh.seek(self.address)
         ctype = c_pe.IMAGE_TLS_DIRECTORY64 if self.pe.is_64bit() else c_pe.IMAGE_TLS_DIRECTORY32
-        return ctype(self.pe.vfh)
+        return ctype(self.pe.read_at(self.address, len(ctype)))
 
     @cached_property
     def callbacks(self) -> list[int]:
@@ -38,9 +37,8 @@ class TlsDirectory(DataDirectory):
         if not self.header.AddressOfCallBacks:
             return []
 
-        self.pe.vfh.seek(self.pe.va_to_rva(self.header.AddressOfCallBacks))
         ctype = c_pe.ULONGLONG if self.pe.is_64bit() else c_pe.ULONG
         try:
-            return ctype[None](self.pe.vfh)
+            return ctype[None](self.pe.open(self.pe.va_to_rva(self.header.AddressOfCallBacks)))
         except EOFError:
             return []
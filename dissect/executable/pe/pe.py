@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import io
-from bisect import bisect_right
+import struct
+from dataclasses import dataclass
 from functools import cached_property
 from typing import TYPE_CHECKING, BinaryIO
 
-from dissect.util.stream import AlignedStream, BufferedStream, RangeStream
+from dissect.util.stream import AlignedStream, RangeStream
 from dissect.util.ts import from_unix
 
-from dissect.executable.exception import InvalidSignatureError
+from dissect.executable.cache import DEFAULT_PAGE_SIZE, PageCache
+from dissect.executable.entropy import DEFAULT_WINDOW_SIZE, ENTROPY_CHUNK_SIZE, entropy, entropy_curve
+from dissect.executable.exception import Error, InvalidSignatureError
 from dissect.executable.pe.c_pe import c_pe
 from dissect.executable.pe.directory import (
     BaseRelocationDirectory,
@@ -26,27 +30,58 @@ from dissect.executable.pe.directory import (
     SecurityDirectory,
     TlsDirectory,
 )
+from dissect.executable.pe.directory.basereloc import PAGE_SIZE
+from dissect.executable.pe.ordinals import ORDINAL_NAMES
+from dissect.executable.pe.rich import RichHeader
+from dissect.executable.pe.translation import TranslationTable
+from dissect.executable.source import Source, SourceStream
+from dissect.executable.strings import ASCII, DEFAULT_MIN_LENGTH, UTF16LE, String, strings
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 if TYPE_CHECKING:
     import datetime
+    from array import array
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from dissect.executable.pe.directory.delay_import import DelayImportModule
+    from dissect.executable.pe.directory.imports import ImportModule
+
+PEEK_SIZE = 0x1000
+HASH_CHUNK_SIZE = 1024 * 1024
 
 
 class PE:
     """PE file parser.
 
     Args:
-        fh: A file-like object of an executable.
+        fh: A file-like object of an executable, or a :class:`~dissect.executable.source.Source`.
         virtual: Indicate whether to use virtual addressing instead of physical.
                  Use this when the file has already been mapped into memory.
+        cache_size: The maximum number of bytes to keep in the page cache of the virtual address space.
+                    Caching is disabled by default, pass e.g. :data:`~dissect.executable.cache.DEFAULT_CACHE_SIZE`
+                    to enable it. Memory mapped files are never cached.
     """
 
-    def __init__(self, fh: BinaryIO, virtual: bool = False):
-        self.fh = fh
+    def __init__(self, fh: BinaryIO | Source, virtual: bool = False, cache_size: int = 0):
+        self.source = Source.wrap(fh)
+        self.fh = self.source.fh
         self.virtual = virtual
+        self.cache: PageCache | None = None
 
-        self.fh.seek(0)
+        # Use a private stream so we don't touch the position of the file-like object we've been given
+        fh = self.source.open()
 
-        self.mz_header = c_pe.IMAGE_DOS_HEADER(self.fh)
+        self.mz_header = c_pe.IMAGE_DOS_HEADER(fh)
         if self.mz_header.e_magic != c_pe.IMAGE_DOS_SIGNATURE:
             raise InvalidSignatureError(
                 f"File is not a valid PE file, wrong MZ signature: {self.mz_header.e_magic.to_bytes(2, 'little')} "
@@ -57,33 +92,42 @@ class PE:
         self.file_header = None
         self.optional_header = None
         self.sections: list[Section] = []
+        self.translation: TranslationTable | None = None
         self.vfh = None
 
-        self.fh.seek(self.mz_header.e_lfanew)
+        fh.seek(self.mz_header.e_lfanew)
         signature = c_pe.ULONG(fh)
         if (signature & 0xFFFF) == c_pe.IMAGE_OS2_SIGNATURE:
-            self.fh.seek(-4, io.SEEK_CUR)
-            self.os2_header = c_pe.IMAGE_OS2_HEADER(self.fh)
+            fh.seek(-4, io.SEEK_CUR)
+            self.os2_header = c_pe.IMAGE_OS2_HEADER(fh)
 
         elif signature == c_pe.IMAGE_NT_SIGNATURE:
             # No need to correct the offset
-            self.file_header = c_pe.IMAGE_FILE_HEADER(self.fh)
+            self.file_header = c_pe.IMAGE_FILE_HEADER(fh)
 
             if self.file_header.SizeOfOptionalHeader:
-                optional_magic = c_pe.USHORT(self.fh)
-                self.fh.seek(-2, io.SEEK_CUR)
+                optional_magic = c_pe.USHORT(fh)
+                fh.seek(-2, io.SEEK_CUR)
 
                 if optional_magic == c_pe.IMAGE_NT_OPTIONAL_HDR32_MAGIC:
-                    self.optional_header = c_pe.IMAGE_OPTIONAL_HEADER32(self.fh)
+                    self.optional_header = c_pe.IMAGE_OPTIONAL_HEADER32(fh)
                 elif optional_magic == c_pe.IMAGE_NT_OPTIONAL_HDR64_MAGIC:
-                    self.optional_header = c_pe.IMAGE_OPTIONAL_HEADER64(self.fh)
+                    self.optional_header = c_pe.IMAGE_OPTIONAL_HEADER64(fh)
                 else:
                     raise InvalidSignatureError(
                         f"File is not a valid PE file, wrong NT header magic: {optional_magic:#x} "
                         f"(expected {c_pe.IMAGE_NT_OPTIONAL_HDR32_MAGIC:#x} or {c_pe.IMAGE_NT_OPTIONAL_HDR64_MAGIC:#x})"
                     )
 
-            self.sections = [Section.from_fh(self, self.fh) for _ in range(self.file_header.NumberOfSections)]
+            self.sections = [Section.from_fh(self, fh) for _ in range(self.file_header.NumberOfSections)]
+            self.translation = TranslationTable.from_pe(self)
+
+            if cache_size > 0 and not self.source.mapped:
+                # Pages are aligned to the section alignment, so most pages map to (part of) a single section
+                page_size = self.optional_header.SectionAlignment
+                if not (DEFAULT_PAGE_SIZE <= page_size <= 0x10000) or page_size & (page_size - 1):
+                    page_size = DEFAULT_PAGE_SIZE
+                self.cache = PageCache(self._read_uncached, page_size, cache_size)
 
             self.vfh = self.open()
         else:
@@ -93,8 +137,114 @@ class PE:
                 f"or {c_pe.IMAGE_OS2_SIGNATURE.to_bytes(2, 'little')} (OS/2))"
             )
 
-        self.fh.seek(len(self.mz_header))
-        self.dos_stub = self.fh.read(self.mz_header.e_lfanew - len(self.mz_header))
+        self.dos_stub = self.source.read_at(len(self.mz_header), self.mz_header.e_lfanew - len(self.mz_header))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    @classmethod
+    def peek(cls, fh: BinaryIO | Source, size: int = PEEK_SIZE) -> PESummary:
+        """Read a summary of the headers of a PE file, without parsing the rest of the file.
+
+        This reads a single buffer of ``size`` bytes from the start of the file (and a second one only if the
+        NT headers are located past it), which makes it suited for quickly triaging large amounts of files.
+
+        Args:
+            fh: A file-like object of an executable, or a :class:`~dissect.executable.source.Source`.
+            size: The number of bytes to read from the start of the file.
+
+        Raises:
+            InvalidSignatureError: If the file is not a valid NT executable.
+        """
+        source = Source.wrap(fh)
+        buf = source.read_at(0, size)
+
+        if len(buf) < len(c_pe.IMAGE_DOS_HEADER):
+            raise InvalidSignatureError("File is not a valid PE file, file is too small")
+
+        mz_header = c_pe.IMAGE_DOS_HEADER(buf)
+        if mz_header.e_magic != c_pe.IMAGE_DOS_SIGNATURE:
+            raise InvalidSignatureError(
+                f"File is not a valid PE file, wrong MZ signature: {mz_header.e_magic.to_bytes(2, 'little')} "
+                f"(expected {c_pe.IMAGE_DOS_SIGNATURE.to_bytes(2, 'little')})"
+            )
+
+        offset = mz_header.e_lfanew
+        rich_header = RichHeader.parse(buf[:offset])
+
+        nt_size = 4 + len(c_pe.IMAGE_FILE_HEADER) + len(c_pe.IMAGE_OPTIONAL_HEADER64)
+        if offset + nt_size > len(buf):
+            buf = source.read_at(offset, nt_size)
+            offset = 0
+
+        if len(buf) < offset + 4 + len(c_pe.IMAGE_FILE_HEADER):
+            raise InvalidSignatureError("File is not a valid PE file, NT headers are truncated")
+
+        signature = c_pe.ULONG(buf[offset : offset + 4])
+        if signature != c_pe.IMAGE_NT_SIGNATURE:
+            raise InvalidSignatureError(
+                f"File is not a valid NT executable, wrong header signature: {signature.to_bytes(4, 'little')} "
+                f"(expected {c_pe.IMAGE_NT_SIGNATURE.to_bytes(4, 'little')})"
+            )
+        offset += 4
+
+        file_header = c_pe.IMAGE_FILE_HEADER(buf[offset:])
+        offset += len(c_pe.IMAGE_FILE_HEADER)
+
+        optional_header = None
+        if file_header.SizeOfOptionalHeader and len(buf) >= offset + 2:
+            magic = c_pe.USHORT(buf[offset : offset + 2])
+            if magic == c_pe.IMAGE_NT_OPTIONAL_HDR32_MAGIC:
+                optional_header = c_pe.IMAGE_OPTIONAL_HEADER32
+            elif magic == c_pe.IMAGE_NT_OPTIONAL_HDR64_MAGIC:
+                optional_header = c_pe.IMAGE_OPTIONAL_HEADER64
+
+            if optional_header and len(buf) >= offset + len(optional_header):
+                optional_header = optional_header(buf[offset:])
+            else:
+                optional_header = None
+
+        return PESummary(
+            machine=file_header.Machine,
+            time_date_stamp=file_header.TimeDateStamp,
+            characteristics=file_header.Characteristics,
+            number_of_sections=file_header.NumberOfSections,
+            magic=optional_header.Magic if optional_header else None,
+            subsystem=optional_header.Subsystem if optional_header else None,
+            dll_characteristics=optional_header.DllCharacteristics if optional_header else None,
+            image_base=optional_header.ImageBase if optional_header else 0,
+            size_of_image=optional_header.SizeOfImage if optional_header else 0,
+            entry_point=optional_header.AddressOfEntryPoint if optional_header else 0,
+            rich_header=rich_header,
+        )
+
+    @classmethod
+    def from_path(cls, path: str | Path, virtual: bool = False, mmap: bool = False, cache_size: int = 0) -> PE:
+        """Open a PE file by path.
+
+        Args:
+            path: The path of the PE file.
+            virtual: Indicate whether to use virtual addressing instead of physical.
+            mmap: Whether to memory map the file. Reads are then served directly from the mapping,
+                  and views such as :meth:`view` and :attr:`Section.data` do not copy any data.
+            cache_size: The maximum number of bytes to keep in the page cache of the virtual address space.
+                        Caching is disabled by default.
+        """
+        source = Source.from_path(path, mmap=mmap)
+        try:
+            return cls(source, virtual, cache_size)
+        except Exception:
+            source.close()
+            raise
+
+    def close(self) -> None:
+        """Close the underlying file, if it was opened by :meth:`from_path`."""
+        self.source.close()
 
     @property
     def machine(self) -> c_pe.IMAGE_FILE_MACHINE:
@@ -137,6 +287,11 @@ class PE:
         """Return if the PE file is reproducible (i.e. has a REPRO debug entry)."""
         return self.debug is not None and any(entry.type == c_pe.IMAGE_DEBUG_TYPE.REPRO for entry in self.debug.entries)
 
+    @cached_property
+    def rich_header(self) -> RichHeader | None:
+        """The Rich header, if available."""
+        return RichHeader.parse(self.mz_header.dumps() + self.dos_stub)
+
     def pdb_path(self) -> str | None:
         """Return the PDB path, if available."""
         for entry in self.debug.entries if self.debug else []:
@@ -144,6 +299,52 @@ class PE:
                 return entry.pdb
         return None
 
+    def imphash(self, delay_imports: bool = False) -> str | None:
+        """Return the import hash (imphash) of the PE file, or ``None`` if it has no imports.
+
+        The import hash is the MD5 of the comma separated, lowercase ``module.function`` names of all imports, where
+        the extension of the module name is stripped and functions imported by ordinal are named ``ord<ordinal>``
+        (except for a few well known modules).
+
+        Args:
+            delay_imports: Whether to include the delay imports, after the regular imports.
+        """
+        names = self._normalized_imports
+        if delay_imports:
+            names = names + self._normalized_delay_imports
+
+        if not names:
+            return None
+        return hashlib.md5(",".join(names).encode()).hexdigest()
+
+    def exphash(self) -> str | None:
+        """Return the export hash of the PE file, or ``None`` if it has no named exports.
+
+        The export hash is the MD5 of the comma separated, lowercase names of all named exports, in the order of the
+        export name table.
+        """
+        if not (names := self._normalized_exports):
+            return None
+        return hashlib.md5(",".join(names).encode()).hexdigest()
+
+    @cached_property
+    def _normalized_imports(self) -> list[str]:
+        """The normalized ``module.function`` names of the imports, as used for the import hash."""
+        return _normalize_imports(self.imports.modules) if self.imports else []
+
+    @cached_property
+    def _normalized_delay_imports(self) -> list[str]:
+        """The normalized ``module.function`` names of the delay imports, as used for the import hash."""
+        return _normalize_imports(self.delay_import.modules) if self.delay_import else []
+
+    @cached_property
+    def _normalized_exports(self) -> list[str]:
+        """The normalized names of the named exports, as used for the export hash."""
+        if not self.exports:
+            return []
+        table = self.exports.table
+        return [table.name(idx).lower() for idx in range(len(table))]
+
     def _data_directory(self, index: c_pe.IMAGE_DIRECTORY_ENTRY) -> c_pe.IMAGE_DATA_DIRECTORY | None:
         """Return the data directory at the given index."""
         if not self.optional_header or not self.optional_header.DataDirectory:
@@ -291,9 +492,424 @@ class PE:
         """Return the relative virtual address (RVA) of the given virtual address (VA)."""
         return va - self.image_base
 
-    def open(self) -> VirtualStream:
-        """Return a stream of the virtual address space of the PE file."""
-        return VirtualStream(self) if not self.virtual else BufferedStream(self.fh)
+    def rva_to_offset(self, rva: int) -> int | None:
+        """Return the file offset of the given relative virtual address (RVA).
+
+        Returns ``None`` if the RVA is not backed by file data, e.g. if it's in between sections or in the zero filled
+        remainder of a section. If the PE file is already mapped into memory (``virtual=True``), the RVA is returned.
+        """
+        if self.virtual:
+            return rva
+        return self.translation.rva_to_offset(rva) if self.translation else None
+
+    def offset_to_rva(self, offset: int) -> int | None:
+        """Return the relative virtual address (RVA) of the given file offset.
+
+        Returns ``None`` if the file offset is not mapped into the virtual address space, e.g. the overlay.
+        If the PE file is already mapped into memory (``virtual=True``), the offset is returned.
+        """
+        if self.virtual:
+            return offset
+        return self.translation.offset_to_rva(offset) if self.translation else None
+
+    def rvas_to_offsets(self, rvas: Iterable[int]) -> list[int | None] | np.ndarray:
+        """Return the file offsets of many relative virtual addresses (RVA) in one call.
+
+        If NumPy is available and ``rvas`` is a NumPy array, the translation is vectorized and a NumPy array is
+        returned with ``-1`` for RVAs that are not backed by file data. Otherwise a list is returned with ``None``
+        for those RVAs. See also :meth:`rva_to_offset`.
+        """
+        if self.virtual:
+            return rvas.copy() if HAS_NUMPY and isinstance(rvas, np.ndarray) else list(rvas)
+        return self.translation.rvas_to_offsets(rvas)
+
+    def section_for_rva(self, rva: int) -> Section | None:
+        """Return the section containing the given relative virtual address (RVA), if any."""
+        return self.translation.section_for_rva(rva) if self.translation else None
+
+    def open(self, address: int = 0) -> VirtualStream | SourceStream:
+        """Return a new stream of the virtual address space of the PE file.
+
+        Every stream has its own position, so a new stream can be used for parsing without affecting others.
+
+        Args:
+            address: The relative virtual address (RVA) to position the stream at.
+        """
+        fh = VirtualStream(self) if not self.virtual else self.source.open()
+        if address:
+            fh.seek(address)
+        return fh
+
+    def rebase(self, image_base: int, base: int | None = None) -> RebasedStream:
+        """Return a new stream of the virtual address space of the PE file, relocated to the given image base.
+
+        The base relocations are applied per page while reading, so the rebased image is never fully materialized.
+        The ``ImageBase`` field in the optional header is updated as well, like the Windows loader does.
+
+        This can also be used to undo the relocations of a module that was dumped from memory, by passing the
+        preferred image base of the module.
+
+        Args:
+            image_base: The image base to relocate to.
+            base: The image base the PE file is currently relocated to. Defaults to the ``ImageBase`` in the header.
+        """
+        return RebasedStream(self, image_base, base)
+
+    def entropy(self, chunk_size: int = ENTROPY_CHUNK_SIZE) -> float:
+        """Calculate the Shannon entropy of the whole file, in bits per byte.
+
+        Args:
+            chunk_size: The number of bytes to process at a time.
+        """
+        return entropy(self.source.open(), chunk_size)
+
+    def entropy_curve(
+        self, window: int = DEFAULT_WINDOW_SIZE, step: int | None = None, chunk_size: int = ENTROPY_CHUNK_SIZE
+    ) -> np.ndarray | array:
+        """Calculate the Shannon entropy of a sliding window over the whole file.
+
+        Args:
+            window: The size of every window.
+            step: The distance between the start of consecutive windows. Defaults to ``window``.
+            chunk_size: The number of bytes to process at a time.
+        """
+        return entropy_curve(self.source.open(), window, step, chunk_size)
+
+    def strings(
+        self, min_length: int = DEFAULT_MIN_LENGTH, encodings: Iterable[str] = (ASCII, UTF16LE), raw: bool = False
+    ) -> Iterator[String]:
+        """Lazily extract printable ASCII and UTF-16LE strings, tagged with the section containing them.
+
+        By default the sections are scanned as mapped into the virtual address space and the address of every string
+        is its RVA. With ``raw`` the whole file is scanned as stored on disk, including the headers and the overlay,
+        and the address of every string is its file offset.
+
+        Args:
+            min_length: The minimum number of characters of a string.
+            encodings: The encodings to extract, ``"ascii"`` and/or ``"utf-16-le"``.
+            raw: Whether to scan the file instead of the sections.
+        """
+        if not raw:
+            for section in self.sections:
+                yield from section.strings(min_length, encodings)
+            return
+
+        for string in strings(self.source.open(), min_length, encodings):
+            if (rva := self.offset_to_rva(string.address)) is not None:
+                string = string._replace(section=self.section_for_rva(rva))
+            yield string
+
+    @property
+    def overlay_offset(self) -> int | None:
+        """The file offset of the overlay, or ``None`` if there is no overlay.
+
+        The overlay is the data appended after the raw data of the last section, such as the payload of an installer.
+        The certificate table is not part of the overlay. Its location in the security data directory is a file offset
+        rather than an RVA, so it is not covered by any section. If the certificate table directly follows the
+        sections, the overlay starts after it. If it follows the overlay, the overlay ends where it starts.
+        """
+        return self._overlay_range[0] if self._overlay_range else None
+
+    @property
+    def overlay_size(self) -> int:
+        """The size of the overlay, or ``0`` if there is no overlay."""
+        return self._overlay_range[1] - self._overlay_range[0] if self._overlay_range else 0
+
+    @cached_property
+    def _overlay_range(self) -> tuple[int, int] | None:
+        if self.virtual or not self.optional_header:
+            return None
+
+        start = max(
+            [self.optional_header.SizeOfHeaders]
+            + [section.pointer_to_raw_data + section.raw_size for section in self.sections if section.raw_size]
+        )
+        end = self.source.size
+
+        if entry := self._data_directory(c_pe.IMAGE_DIRECTORY_ENTRY.SECURITY):
+            cert_start = entry.VirtualAddress
+            cert_end = cert_start + entry.Size
+            # The certificate table is aligned to 8 bytes, so it may be preceded by some padding
+            if cert_start <= (start + 7) & ~7 and cert_end > start:
+                start = (cert_end + 7) & ~7
+            elif start < cert_start < end:
+                end = cert_start
+
+        return (start, end) if start < end else None
+
+    def open_overlay(self) -> RangeStream | None:
+        """Return a stream of the overlay, or ``None`` if there is no overlay.
+
+        The overlay is not read until the stream is, so large overlays can be hashed or carved in chunks.
+        """
+        if self._overlay_range is None:
+            return None
+        return RangeStream(self.source.open(), self.overlay_offset, self.overlay_size)
+
+    def authenticode(
+        self, algorithms: Iterable[str] = ("md5", "sha1", "sha256"), chunk_size: int = HASH_CHUNK_SIZE
+    ) -> dict[str, bytes]:
+        """Compute the Authenticode digests of the PE file.
+
+        The file is streamed in chunks of ``chunk_size`` bytes and all digests are computed in a single pass, so the
+        file is never read into memory as a whole.
+
+        Args:
+            algorithms: The names of the hash algorithms to use, as accepted by :func:`hashlib.new`.
+            chunk_size: The number of bytes to hash at a time.
+        """
+        if self.virtual or not self.optional_header:
+            raise Error("Authenticode digests can only be computed for PE files in their on-disk layout")
+
+        hashers = {name: hashlib.new(name) for name in algorithms}
+        _hash_ranges(
+            self.source, [(start, end, hashers.values()) for start, end in self.authenticode_ranges()], chunk_size
+        )
+        return {name: hasher.digest() for name, hasher in hashers.items()}
+
+    def digests(
+        self,
+        algorithms: Iterable[str] = ("md5", "sha1", "sha256"),
+        file: bool = True,
+        sections: bool = True,
+        overlay: bool = True,
+        resources: bool = True,
+        chunk_size: int = HASH_CHUNK_SIZE,
+    ) -> PEDigests:
+        """Compute the digests of the file, its sections, the overlay and the resources.
+
+        All requested regions are hashed in a single sequential pass over the file. Every chunk of ``chunk_size``
+        bytes is read once and fed to the hashers of all regions it overlaps, so the number of reads does not depend
+        on the number of regions.
+
+        Args:
+            algorithms: The names of the hash algorithms to use, as accepted by :func:`hashlib.new`.
+            file: Whether to compute the digests of the whole file.
+            sections: Whether to compute the digests of the raw data of every section.
+            overlay: Whether to compute the digests of the overlay, see :attr:`overlay_offset`.
+            resources: Whether to compute the digests of every resource.
+            chunk_size: The number of bytes to read at a time.
+        """
+        algorithms = list(algorithms)
+        ranges = []
+        result = PEDigests()
+
+        def _schedule(start: int, end: int) -> dict[str, hashlib._Hash]:
+            hashers = {name: hashlib.new(name) for name in algorithms}
+            ranges.append((start, end, hashers.values()))
+            return hashers
+
+        file_hashers = _schedule(0, self.source.size) if file else None
+
+        section_hashers = []
+        if sections:
+            for section in self.sections:
+                if self.virtual:
+                    start, size = section.virtual_address, section.virtual_size
+                else:
+                    start, size = section.pointer_to_raw_data, section.raw_size
+                section_hashers.append(_schedule(start, start + size))
+
+        overlay_hashers = None
+        if overlay and self._overlay_range is not None:
+            overlay_hashers = _schedule(*self._overlay_range)
+
+        resource_hashers = {}
+        if resources and self.resources:
+            for key, entry in self.resources.index.items():
+                start = self.rva_to_offset(entry.offset_to_data)
+                end = self.rva_to_offset(entry.offset_to_data + entry.size - 1) if entry.size else start
+                if start is not None and end is not None and end - start == max(0, entry.size - 1):
+                    resource_hashers[key] = _schedule(start, start + entry.size)
+                else:
+                    # The resource is not stored contiguously in the file, read it through the virtual address space
+                    resource_hashers[key] = hashers = {name: hashlib.new(name) for name in algorithms}
+                    data = self.read_at(entry.offset_to_data, entry.size)
+                    for hasher in hashers.values():
+                        hasher.update(data)
+
+        _hash_ranges(self.source, ranges, chunk_size)
+
+        def _digests(hashers: dict[str, hashlib._Hash]) -> dict[str, bytes]:
+            return {name: hasher.digest() for name, hasher in hashers.items()}
+
+        if file_hashers is not None:
+            result.file = _digests(file_hashers)
+        if sections:
+            result.sections = [_digests(hashers) for hashers in section_hashers]
+        if overlay_hashers is not None:
+            result.overlay = _digests(overlay_hashers)
+        if resources:
+            result.resources = {key: _digests(hashers) for key, hashers in resource_hashers.items()}
+        return result
+
+    def authenticode_ranges(self) -> list[tuple[int, int]]:
+        """Return the ranges of file offsets that are covered by the Authenticode digest.
+
+        This is the whole file, except for the ``CheckSum`` field, the security data directory entry and the
+        certificate table.
+        """
+        ctype = c_pe.IMAGE_OPTIONAL_HEADER64 if self.is_64bit() else c_pe.IMAGE_OPTIONAL_HEADER32
+        optional_header_offset = self.mz_header.e_lfanew + 4 + len(c_pe.IMAGE_FILE_HEADER)
+
+        excluded = [(optional_header_offset + ctype.fields["CheckSum"].offset, 4)]
+        if self.optional_header.NumberOfRvaAndSizes > c_pe.IMAGE_DIRECTORY_ENTRY.SECURITY:
+            entry_size = len(c_pe.IMAGE_DATA_DIRECTORY)
+            excluded.append(
+                (
+                    optional_header_offset
+                    + ctype.fields["DataDirectory"].offset
+                    + c_pe.IMAGE_DIRECTORY_ENTRY.SECURITY * entry_size,
+                    entry_size,
+                )
+            )
+
+        # Note: the address of the security directory is a file offset, not an RVA
+        if entry := self._data_directory(c_pe.IMAGE_DIRECTORY_ENTRY.SECURITY):
+            excluded.append((entry.VirtualAddress, entry.Size))
+
+        ranges = []
+        offset = 0
+        for start, size in sorted(excluded):
+            if start > offset:
+                ranges.append((offset, min(start, self.source.size)))
+            offset = max(offset, start + size)
+
+        if offset < self.source.size:
+            ranges.append((offset, self.source.size))
+        return [(start, end) for start, end in ranges if start < end]
+
+    def read_at(self, address: int, size: int) -> bytes:
+        """Read ``size`` bytes at the given relative virtual address (RVA).
+
+        This does not use or modify the position of any stream, so it can safely be used from multiple threads.
+        Small reads are served from the page cache, if enabled.
+
+        Args:
+            address: The RVA to read from.
+            size: The number of bytes to read.
+        """
+        if self.cache is not None:
+            return self.cache.read(address, size)
+        return self._read_uncached(address, size)
+
+    def _read_uncached(self, address: int, size: int) -> bytes:
+        """Read ``size`` bytes at the given relative virtual address (RVA), bypassing the page cache."""
+        if self.virtual:
+            return self.source.read_at(address, size)
+        return b"".join(self._virtual_chunks(address, size))
+
+    def view(self, address: int, size: int) -> memoryview:
+        """Return a view of ``size`` bytes at the given relative virtual address (RVA).
+
+        If the PE file is memory mapped and the requested range is backed by a single contiguous range of the file,
+        the returned view directly references the mapping and no data is copied.
+
+        Args:
+            address: The RVA to read from.
+            size: The number of bytes to read.
+        """
+        if not self.source.mapped:
+            return memoryview(self.read_at(address, size))
+
+        if self.virtual:
+            return self.source.view(address, size)
+
+        chunks = list(self._virtual_chunks(address, size))
+        if len(chunks) == 1:
+            return memoryview(chunks[0])
+        return memoryview(b"".join(chunks))
+
+    def _virtual_chunks(self, address: int, size: int) -> Iterator[memoryview | bytes]:
+        """Yield the chunks of data that make up the given range of the virtual address space."""
+        size = max(0, min(size, self.optional_header.SizeOfImage - address))
+
+        regions = self.translation.regions
+        idx = self.translation.index(address)
+
+        while size > 0:
+            if idx >= 0 and address < (region := regions[idx]).end:
+                # Within a region, either backed by file data or zero filled
+                read_size = min(size, region.end - address)
+                if region.offset is None:
+                    yield b"\x00" * read_size
+                else:
+                    yield self.source.view(region.offset + (address - region.start), read_size)
+            else:
+                # In between regions or after the last region
+                idx += 1
+                read_size = min(size, (regions[idx].start if idx < len(regions) else size + address) - address)
+                if read_size:
+                    yield b"\x00" * read_size
+
+            size -= read_size
+            address += read_size
+
+
+@dataclass
+class PESummary:
+    """A summary of the headers of a PE file, as returned by :meth:`PE.peek`."""
+
+    machine: c_pe.IMAGE_FILE_MACHINE
+    """The machine type of the PE file."""
+    time_date_stamp: int
+    """The raw ``TimeDateStamp`` of the file header."""
+    characteristics: c_pe.IMAGE_FILE
+    """The characteristics of the file header."""
+    number_of_sections: int
+    """The number of sections."""
+    magic: int | None
+    """The magic of the optional header, if available."""
+    subsystem: c_pe.IMAGE_SUBSYSTEM | None
+    """The subsystem, if available."""
+    dll_characteristics: c_pe.IMAGE_DLLCHARACTERISTICS | None
+    """The DLL characteristics, if available."""
+    image_base: int
+    """The image base address, or ``0`` if not available."""
+    size_of_image: int
+    """The size of the image, or ``0`` if not available."""
+    entry_point: int
+    """The relative virtual address (RVA) of the entry point, or ``0`` if not available."""
+    rich_header: RichHeader | None = None
+    """The Rich header, if available."""
+
+    def __repr__(self) -> str:
+        return f"<PESummary machine={self.machine.name} subsystem={self.subsystem.name if self.subsystem else None} characteristics={self.characteristics}>"  # noqa: E501
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """The compilation timestamp of the PE file.
+
+        Unlike :attr:`PE.timestamp`, this does not check whether the PE file is reproducible, in which case the
+        timestamp is a hash instead of an actual timestamp.
+        """
+        return from_unix(self.time_date_stamp)
+
+    def is_64bit(self) -> bool:
+        """Return if the PE file is 64-bit (PE32+)."""
+        return self.magic == c_pe.IMAGE_NT_OPTIONAL_HDR64_MAGIC
+
+    def is_dll(self) -> bool:
+        """Return if the PE file is a DLL."""
+        return bool(self.characteristics & c_pe.IMAGE_FILE.DLL)
+
+
+@dataclass
+class PEDigests:
+    """The digests of the regions of a PE file, as returned by :meth:`PE.digests`.
+
+    Every set of digests maps the name of the hash algorithm to the digest. Regions that were not requested are
+    ``None``.
+    """
+
+    file: dict[str, bytes] | None = None
+    """The digests of the whole file."""
+    sections: list[dict[str, bytes]] | None = None
+    """The digests of the raw data of every section, in the order of :attr:`PE.sections`."""
+    overlay: dict[str, bytes] | None = None
+    """The digests of the overlay, or ``None`` if there is no overlay."""
+    resources: dict[tuple[int | str, int | str, int], dict[str, bytes]] | None = None
+    """The digests of every resource, keyed by ``(type, name, language)`` like :attr:`ResourceDirectory.index`."""
 
 
 class Section:
@@ -321,6 +937,57 @@ class Section:
         """Return a stream for the section data."""
         return SectionStream(self)
 
+    def strings(
+        self, min_length: int = DEFAULT_MIN_LENGTH, encodings: Iterable[str] = (ASCII, UTF16LE)
+    ) -> Iterator[String]:
+        """Lazily extract printable ASCII and UTF-16LE strings from the section, addressed by their RVA.
+
+        Args:
+            min_length: The minimum number of characters of a string.
+            encodings: The encodings to extract, ``"ascii"`` and/or ``"utf-16-le"``.
+        """
+        if self.pe.virtual:
+            fh = RangeStream(self.pe.source.open(), self.virtual_address, self.virtual_size)
+        else:
+            fh = self.open()
+        return strings(fh, min_length, encodings, self.virtual_address, self)
+
+    def entropy(self, chunk_size: int = ENTROPY_CHUNK_SIZE) -> float:
+        """Calculate the Shannon entropy of the data of the section, in bits per byte.
+
+        For a file this is the raw data of the section, for a memory mapped image its virtual size.
+
+        Args:
+            chunk_size: The number of bytes to process at a time.
+        """
+        return entropy(self._source_stream(), chunk_size)
+
+    def entropy_curve(
+        self, window: int = DEFAULT_WINDOW_SIZE, step: int | None = None, chunk_size: int = ENTROPY_CHUNK_SIZE
+    ) -> np.ndarray | array:
+        """Calculate the Shannon entropy of a sliding window over the data of the section.
+
+        Args:
+            window: The size of every window.
+            step: The distance between the start of consecutive windows. Defaults to ``window``.
+            chunk_size: The number of bytes to process at a time.
+        """
+        return entropy_curve(self._source_stream(), window, step, chunk_size)
+
+    def _source_stream(self) -> SourceStream:
+        """Return a stream over the section data as it is stored in the source, without zero padding."""
+        if self.pe.virtual:
+            return self.pe.source.open(self.virtual_address, self.virtual_size)
+        return self.pe.source.open(self.pointer_to_raw_data, self.raw_size)
+
+    @property
+    def data(self) -> memoryview:
+        """Return the raw data of the section, as stored in the file.
+
+        If the PE file is memory mapped, this directly references the mapping and no data is copied.
+        """
+        return self.pe.source.view(self.pointer_to_raw_data, self.raw_size)
+
     @property
     def name(self) -> str:
         """Return the name of the section."""
@@ -368,63 +1035,47 @@ class VirtualStream(AlignedStream):
 
     def __init__(self, pe: PE):
         self.pe = pe
-        self._sections = sorted(pe.sections, key=lambda s: s.virtual_address)
-        self._lookup = [s.virtual_address for s in self._sections]
         super().__init__(pe.optional_header.SizeOfImage, pe.optional_header.SectionAlignment)
 
     def _read(self, offset: int, length: int) -> bytes:
-        result = []
+        return self.pe.read_at(offset, length)
 
-        # Read from the file header
-        if offset < self.pe.optional_header.SizeOfHeaders:
-            self.pe.fh.seek(offset)
-            read_length = min(length, self.pe.optional_header.SizeOfHeaders - offset)
-            result.append(self.pe.fh.read(read_length))
-
-            length -= read_length
-            offset += read_length
-
-        section_idx = bisect_right(self._lookup, offset)
-
-        while length > 0:
-            # Read from the sections or fill in gaps
-            current_section = self._sections[section_idx - 1] if section_idx > 0 else None
-            next_section = self._sections[section_idx] if section_idx < len(self._sections) else None
-
-            if not current_section and not next_section:
-                # What
-                result.append(b"\x00" * length)
-                break
-
-            if not current_section or offset >= current_section.virtual_address + current_section.virtual_size:
-                # In between sections or after the last section
-                read_length = min(length, (next_section.virtual_address if next_section else self.size) - offset)
-                result.append(b"\x00" * read_length)
-
-                length -= read_length
-                offset += read_length
-                section_idx += 1
-                continue
-
-            if (
-                current_section.virtual_address
-                <= offset
-                < current_section.virtual_address + current_section.virtual_size
-            ):
-                # Within the current section
-                offset_in_section = offset - current_section.virtual_address
-                if offset_in_section < current_section.raw_size:
-                    read_length = min(length, current_section.raw_size - offset_in_section)
-
-                    self.pe.fh.seek(current_section.pointer_to_raw_data + offset_in_section)
-                    result.append(self.pe.fh.read(read_length))
-
-                    length -= read_length
-                    offset += read_length
-                    # Stay in the same section
-                    continue
 
-        return b"".join(result)
+class RebasedStream(AlignedStream):
+    """Read from the virtual address space of a PE file, relocated to a different image base.
+
+    Args:
+        pe: The PE file to relocate.
+        image_base: The image base to relocate to.
+        base: The image base the PE file is currently relocated to. Defaults to the ``ImageBase`` in the header.
+    """
+
+    def __init__(self, pe: PE, image_base: int, base: int | None = None):
+        self.pe = pe
+        self.image_base = image_base
+        self.delta = image_base - (pe.image_base if base is None else base)
+
+        if pe.is_64bit():
+            self._image_base_field = (c_pe.IMAGE_OPTIONAL_HEADER64.fields["ImageBase"].offset, "<Q")
+        else:
+            self._image_base_field = (c_pe.IMAGE_OPTIONAL_HEADER32.fields["ImageBase"].offset, "<I")
+
+        super().__init__(pe.optional_header.SizeOfImage, PAGE_SIZE)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        # Relocations may straddle the boundaries of the requested range, so read a little extra on both sides
+        start = max(0, offset - 8)
+        buf = bytearray(self.pe.read_at(start, offset + length + 8 - start))
+
+        if self.delta and self.pe.base_relocations:
+            self.pe.base_relocations.apply(buf, start, self.delta)
+
+        field_offset, fmt = self._image_base_field
+        field_offset += self.pe.mz_header.e_lfanew + 4 + len(c_pe.IMAGE_FILE_HEADER) - start
+        if field_offset >= 0 and field_offset + struct.calcsize(fmt) <= len(buf):
+            struct.pack_into(fmt, buf, field_offset, self.image_base)
+
+        return bytes(buf[offset - start : offset - start + length])
 
 
 class SectionStream(AlignedStream):
@@ -438,11 +1089,75 @@ class SectionStream(AlignedStream):
         result = []
 
         if raw_remaining := min(length, max(0, self.section.raw_size - offset)):
-            self.section.pe.fh.seek(self.section.pointer_to_raw_data + offset)
-            result.append(self.section.pe.fh.read(raw_remaining))
+            result.append(self.section.pe.source.view(self.section.pointer_to_raw_data + offset, raw_remaining))
             length -= raw_remaining
 
         if length:
             result.append(b"\x00" * length)
 
         return b"".join(result)
+
+
+def _normalize_imports(modules: Iterable[ImportModule | DelayImportModule]) -> list[str]:
+    """Return the normalized ``module.function`` names of the functions imported from the given modules.
+
+    This works on the columns of the thunk tables directly, without creating an object per function.
+    """
+    result = []
+    for module in modules:
+        name = module.name.lower()
+        parts = name.rsplit(".", 1)
+        prefix = parts[0] if len(parts) > 1 and parts[1] in ("dll", "ocx", "sys") else name
+
+        ordinal_names = ORDINAL_NAMES.get(name, {})
+        thunks = module.thunks
+        for function, ordinal in zip(thunks.names, thunks.ordinals, strict=True):
+            if function is None:
+                function = ordinal_names.get(ordinal, f"ord{ordinal}")
+            result.append(f"{prefix}.{function.lower()}")
+    return result
+
+
+def _hash_ranges(
+    source: Source, ranges: list[tuple[int, int, Iterable[hashlib._Hash]]], chunk_size: int = HASH_CHUNK_SIZE
+) -> None:
+    """Feed the given ranges of file offsets to their hashers, in a single sequential pass over the source.
+
+    Every chunk is read once and fed to all ranges it overlaps. Parts of the file that are not covered by any
+    range are skipped.
+
+    Args:
+        source: The source to read from.
+        ranges: The ranges to hash, as ``(start, end, hashers)`` tuples.
+        chunk_size: The number of bytes to read at a time.
+    """
+    ranges = sorted(
+        ((start, min(end, source.size), hashers) for start, end, hashers in ranges if start < min(end, source.size)),
+        key=lambda r: r[0],
+    )
+
+    active = []
+    idx = 0
+    offset = 0
+    while idx < len(ranges) or active:
+        if not active:
+            offset = max(offset, ranges[idx][0])
+
+        end = offset + chunk_size
+        while idx < len(ranges) and ranges[idx][0] < end:
+            active.append(ranges[idx])
+            idx += 1
+        end = min(end, max(stop for _, stop, _ in active))
+
+        chunk = source.view(offset, end - offset)
+        remaining = []
+        for start, stop, hashers in active:
+            if max(start, offset) < min(stop, end):
+                data = chunk[max(start, offset) - offset : min(stop, end) - offset]
+                for hasher in hashers:
+                    hasher.update(data)
+            if stop > end:
+                remaining.append((start, stop, hashers))
+
+        active = remaining
+        offset = end
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+RICH_SIGNATURE = b"Rich"
+DANS_SIGNATURE = 0x536E6144  # "DanS"
+
+# The offset of ``e_lfanew`` in the DOS header, which is excluded from the checksum
+E_LFANEW_OFFSET = 0x3C
+
+
+class RichHeader:
+    """The Rich header, an undocumented record of the tools that were used to build a PE file.
+
+    The entries are stored column-wise, decoded in one pass when the header is parsed.
+
+    Args:
+        offset: The file offset of the start of the Rich header (the ``DanS`` marker).
+        key: The XOR key of the Rich header.
+        comp_ids: The raw ``@comp.id`` values of the entries.
+        counts: The usage counts of the entries.
+        checksum: The checksum as calculated over the DOS header, DOS stub and entries.
+        clear_data: The decoded Rich header, from the ``DanS`` marker up to the ``Rich`` marker.
+    """
+
+    def __init__(self, offset: int, key: int, comp_ids: array, counts: array, checksum: int, clear_data: bytes):
+        self.offset = offset
+        self.key = key
+        self.comp_ids = comp_ids
+        self.counts = counts
+        self.checksum = checksum
+        self.clear_data = clear_data
+
+        self.product_ids = array("H", (comp_id >> 16 for comp_id in comp_ids))
+        self.builds = array("H", (comp_id & 0xFFFF for comp_id in comp_ids))
+
+    def __repr__(self) -> str:
+        return f"<RichHeader key={self.key:#010x} entries={len(self)} valid={self.is_valid()}>"
+
+    def __len__(self) -> int:
+        return len(self.comp_ids)
+
+    def __iter__(self) -> Iterator[tuple[int, int, int]]:
+        """Yield the ``(product_id, build, count)`` of every entry."""
+        return zip(self.product_ids, self.builds, self.counts, strict=True)
+
+    @classmethod
+    def parse(cls, buf: bytes) -> RichHeader | None:
+        """Parse the Rich header from the start of a PE file, or return ``None`` if there is no Rich header.
+
+        Args:
+            buf: The start of the file, up to (at least) the end of the Rich header. Typically the DOS header
+                 followed by the DOS stub.
+        """
+        # The Rich header is aligned to 4 bytes
+        end = buf.find(RICH_SIGNATURE)
+        while end != -1 and end & 3:
+            end = buf.find(RICH_SIGNATURE, end + 1)
+
+        if end == -1 or end + 8 > len(buf):
+            return None
+
+        key = struct.unpack_from("<I", buf, end + 4)[0]
+
+        # Walk back to the start marker, every value is XOR'ed with the key
+        values = array("I", buf[:end])
+        if sys.byteorder == "big":
+            values.byteswap()
+
+        start = None
+        for idx in range(len(values) - 1, -1, -1):
+            if values[idx] ^ key == DANS_SIGNATURE:
+                start = idx
+                break
+
+        if start is None:
+            return None
+
+        # The start marker is followed by three padding values, after which the entries follow
+        decoded = array("I", (value ^ key for value in values[start:]))
+        comp_ids = decoded[4::2]
+        counts = decoded[5::2]
+        comp_ids = comp_ids[: len(counts)]
+
+        offset = start * 4
+        clear = decoded.tobytes() if sys.byteorder == "little" else _byteswapped(decoded)
+        return cls(offset, key, comp_ids, counts, _checksum(buf[:offset], offset, comp_ids, counts), clear)
+
+    def is_valid(self) -> bool:
+        """Return whether the checksum of the Rich header matches its XOR key."""
+        return self.checksum == self.key
+
+    def hash(self, algorithm: str = "md5") -> str:
+        """Return the hash of the decoded Rich header, as commonly used to cluster PE files.
+
+        Args:
+            algorithm: The name of the hash algorithm to use, as accepted by :func:`hashlib.new`.
+        """
+        return hashlib.new(algorithm, self.clear_data).hexdigest()
+
+
+def _checksum(buf: bytes, offset: int, comp_ids: array, counts: array) -> int:
+    """Calculate the checksum of a Rich header."""
+    checksum = offset
+    for idx, byte in enumerate(buf):
+        if E_LFANEW_OFFSET <= idx < E_LFANEW_OFFSET + 4:
+            continue
+        checksum += _rol32(byte, idx)
+
+    for comp_id, count in zip(comp_ids, counts, strict=True):
+        checksum += _rol32(comp_id, count)
+
+    return checksum & 0xFFFFFFFF
+
+
+def _rol32(value: int, count: int) -> int:
+    count &= 0x1F
+    return ((value << count) | (value >> (32 - count))) & 0xFFFFFFFF
+
+
+def _byteswapped(values: array) -> bytes:
+    values = array(values.typecode, values)
+    values.byteswap()
+    return values.tobytes()
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, NamedTuple
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from dissect.executable.pe.pe import PE, Section
+
+
+class Region(NamedTuple):
+    """A contiguous range of the virtual address space of a PE file.
+
+    The ``offset`` is the file offset the region starts at, or ``None`` if the region is zero filled
+    (e.g. the remainder of a section whose virtual size exceeds its raw size).
+    """
+
+    start: int
+    end: int
+    offset: int | None
+    section: Section | None
+
+
+class TranslationTable:
+    """An immutable table to translate between relative virtual addresses (RVA) and file offsets.
+
+    The table is built once from the headers and sections of a PE file, after which all lookups are a single binary
+    search. Sections are laid out like the Windows loader does: a section spans its virtual size (or its raw size if
+    the virtual size is zero), of which at most the raw size is backed by file data and the remainder is zero filled.
+    If sections overlap, a section is cut off at the start of the next one. The headers always take precedence.
+
+    Addresses that are not covered by any region, such as gaps between sections, are zero filled.
+
+    Args:
+        regions: The regions of the virtual address space, sorted and not overlapping.
+    """
+
+    def __init__(self, regions: list[Region]):
+        self.regions = regions
+        self._starts = [region.start for region in regions]
+
+        # File offsets may be shared by multiple regions, so build a separate index of disjoint file ranges
+        # The region that starts earliest in the file wins
+        self._file_ranges: list[tuple[int, int, int]] = []
+        covered = 0
+        for region in sorted((r for r in regions if r.offset is not None), key=lambda r: (r.offset, r.start)):
+            start = max(region.offset, covered)
+            end = region.offset + (region.end - region.start)
+            if start < end:
+                self._file_ranges.append((start, end, region.start + (start - region.offset)))
+                covered = end
+        self._file_starts = [start for start, _, _ in self._file_ranges]
+
+        self._arrays = None
+
+    def __repr__(self) -> str:
+        return f"<TranslationTable regions={len(self.regions)}>"
+
+    @classmethod
+    def from_pe(cls, pe: PE) -> TranslationTable:
+        """Build the translation table of the given PE file.
+
+        Args:
+            pe: The PE file to build the translation table of.
+        """
+        size_of_headers = pe.optional_header.SizeOfHeaders
+        regions = [Region(0, size_of_headers, 0, None)] if size_of_headers else []
+
+        sections = sorted(pe.sections, key=lambda s: s.virtual_address)
+        for idx, section in enumerate(sections):
+            start = section.virtual_address
+            end = start + (section.virtual_size or section.raw_size)
+            if idx + 1 < len(sections):
+                end = min(end, sections[idx + 1].virtual_address)
+
+            # The headers take precedence over any section
+            skip = max(0, size_of_headers - start)
+            start += skip
+            if start >= end:
+                continue
+
+            raw_end = section.virtual_address + section.raw_size
+            if start < raw_end:
+                regions.append(
+                    Region(start, min(end, raw_end), section.pointer_to_raw_data + skip, section),
+                )
+            if raw_end < end:
+                regions.append(Region(max(start, raw_end), end, None, section))
+
+        return cls(regions)
+
+    def index(self, rva: int) -> int:
+        """Return the index of the last region starting at or before the given RVA, or ``-1`` if there is none."""
+        return bisect_right(self._starts, rva) - 1
+
+    def region(self, rva: int) -> Region | None:
+        """Return the region containing the given RVA, or ``None`` if it's not covered by any region."""
+        idx = bisect_right(self._starts, rva) - 1
+        if idx < 0 or rva >= (region := self.regions[idx]).end:
+            return None
+        return region
+
+    def rva_to_offset(self, rva: int) -> int | None:
+        """Translate an RVA to a file offset, or ``None`` if the RVA is not backed by file data."""
+        idx = bisect_right(self._starts, rva) - 1
+        if idx < 0:
+            return None
+
+        start, end, offset, _ = self.regions[idx]
+        if rva >= end or offset is None:
+            return None
+        return offset + (rva - start)
+
+    def offset_to_rva(self, offset: int) -> int | None:
+        """Translate a file offset to an RVA, or ``None`` if the file offset is not mapped."""
+        idx = bisect_right(self._file_starts, offset) - 1
+        if idx < 0:
+            return None
+
+        start, end, rva = self._file_ranges[idx]
+        if offset >= end:
+            return None
+        return rva + (offset - start)
+
+    def section_for_rva(self, rva: int) -> Section | None:
+        """Return the section containing the given RVA, or ``None`` if it's not within a section."""
+        if (region := self.region(rva)) is None:
+            return None
+        return region.section
+
+    def rvas_to_offsets(self, rvas: Iterable[int]) -> list[int | None] | np.ndarray:
+        """Translate many RVAs to file offsets in one call.
+
+        If NumPy is available and ``rvas`` is a NumPy array, the translation is vectorized and a NumPy array is
+        returned, with ``-1`` for RVAs that are not backed by file data. Otherwise a list is returned with ``None``
+        for those RVAs.
+
+        Args:
+            rvas: The RVAs to translate.
+        """
+        if HAS_NUMPY and isinstance(rvas, np.ndarray):
+            return self._rvas_to_offsets_numpy(rvas)
+        return [self.rva_to_offset(rva) for rva in rvas]
+
+    def _rvas_to_offsets_numpy(self, rvas: np.ndarray) -> np.ndarray:
+        if self._arrays is None:
+            self._arrays = (
+                np.array(self._starts, dtype=np.int64),
+                np.array([region.end for region in self.regions], dtype=np.int64),
+                np.array([-1 if region.offset is None else region.offset for region in self.regions], dtype=np.int64),
+            )
+        starts, ends, offsets = self._arrays
+
+        rvas = rvas.astype(np.int64, copy=False)
+        if not len(starts):
+            return np.full(rvas.shape, -1, dtype=np.int64)
+
+        idx = np.searchsorted(starts, rvas, side="right") - 1
+        valid = idx >= 0
+        idx[~valid] = 0
+
+        valid &= (rvas < ends[idx]) & (offsets[idx] >= 0)
+        return np.where(valid, offsets[idx] + (rvas - starts[idx]), -1)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from contextlib import suppress
+from functools import cached_property
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO
+
+from dissect.util.stream import AlignedStream
+
+
+class Source:
+    """Positional access to the raw bytes of an executable file.
+
+    Wraps either a regular file-like object or a memory mapped file. Reads from a memory mapped source are served
+    by slicing the mapping, which avoids a ``seek()`` and ``read()`` system call per read and allows handing out
+    zero-copy :class:`memoryview` objects with :meth:`view`.
+
+    All reads are positional and do not depend on a shared file position, so a single source can safely be used
+    from multiple threads. Memory mapped sources are sliced, regular files are read with ``os.pread()`` where
+    available and any other file-like object is read with a ``seek()`` and ``read()`` under a lock.
+
+    Note that a memory mapping can only be unmapped once all views into it have been released.
+
+    Args:
+        fh: A file-like object or a :class:`mmap.mmap` object.
+    """
+
+    def __init__(self, fh: BinaryIO | mmap.mmap):
+        self.fh = fh
+        self.mapping = memoryview(fh) if isinstance(fh, mmap.mmap) else None
+
+        self._fd = _fileno(fh) if self.mapping is None else None
+        self._lock = Lock()
+        self._owned = []
+
+    def __repr__(self) -> str:
+        return f"<Source fh={self.fh!r} mapped={self.mapped}>"
+
+    @classmethod
+    def wrap(cls, fh: BinaryIO | mmap.mmap | Source) -> Source:
+        """Return the given object as a :class:`Source`, wrapping it if necessary."""
+        return fh if isinstance(fh, Source) else cls(fh)
+
+    @classmethod
+    def from_path(cls, path: str | Path, mmap: bool = False) -> Source:
+        """Open a file by path.
+
+        The returned source owns the opened file handles, close them with :meth:`close`.
+
+        Args:
+            path: The path of the file to open.
+            mmap: Whether to memory map the file instead of using regular file I/O.
+        """
+        fh = Path(path).open("rb")  # noqa: SIM115
+        if not mmap:
+            source = cls(fh)
+            source._owned.append(fh)
+            return source
+
+        try:
+            mapping = _map(fh)
+        except Exception:
+            fh.close()
+            raise
+
+        source = cls(mapping)
+        source._owned.extend([mapping, fh])
+        return source
+
+    @property
+    def mapped(self) -> bool:
+        """Return whether this source is memory mapped."""
+        return self.mapping is not None
+
+    @cached_property
+    def size(self) -> int:
+        """The size of the source in bytes."""
+        if self.mapping is not None:
+            return len(self.mapping)
+
+        if self._fd is not None:
+            return os.fstat(self._fd).st_size
+
+        with self._lock:
+            offset = self.fh.tell()
+            size = self.fh.seek(0, io.SEEK_END)
+            self.fh.seek(offset)
+            return size
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        """Read ``size`` bytes at the given offset.
+
+        This does not depend on the file position of the underlying file-like object, but file-like objects that
+        do not support positional reads are still seeked (under a lock).
+
+        Args:
+            offset: The offset to read from.
+            size: The number of bytes to read.
+        """
+        if self.mapping is not None:
+            return self.mapping[offset : offset + size].tobytes()
+
+        if self._fd is not None:
+            return os.pread(self._fd, size, offset)
+
+        with self._lock:
+            self.fh.seek(offset)
+            return self.fh.read(size)
+
+    def view(self, offset: int, size: int) -> memoryview:
+        """Return a view of ``size`` bytes at the given offset.
+
+        For memory mapped sources this directly references the mapping and does not copy any data.
+
+        Args:
+            offset: The offset of the view.
+            size: The size of the view.
+        """
+        if self.mapping is not None:
+            return self.mapping[offset : offset + size]
+        return memoryview(self.read_at(offset, size))
+
+    def open(self, offset: int = 0, size: int | None = None) -> SourceStream:
+        """Return a new stream over (a range of) this source.
+
+        Each stream has its own position, so streams can be used independently of each other.
+
+        Args:
+            offset: The offset in the source the stream should start at.
+            size: The size of the stream. Defaults to the remainder of the source.
+        """
+        return SourceStream(self, offset, size)
+
+    def close(self) -> None:
+        """Close the file handles owned by this source, if it was opened with :meth:`from_path`."""
+        if self.mapping is not None and self._owned:
+            self.mapping.release()
+
+        for obj in self._owned:
+            # If there are still views referencing the mapping, it is unmapped once those are released
+            with suppress(BufferError):
+                obj.close()
+        self._owned = []
+
+
+class SourceStream(AlignedStream):
+    """A stream over a range of a :class:`Source`, using positional reads."""
+
+    def __init__(self, source: Source, offset: int = 0, size: int | None = None):
+        self.source = source
+        self.offset = offset
+        super().__init__(max(0, source.size - offset) if size is None else size)
+
+    def _read(self, offset: int, length: int) -> bytes:
+        return self.source.read_at(self.offset + offset, min(length, self.size - offset))
+
+
+def _map(fh: BinaryIO) -> mmap.mmap:
+    """Memory map the given file handle read-only."""
+    return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _fileno(fh: BinaryIO) -> int | None:
+    """Return the file descriptor of a regular file, if it can be read from with ``os.pread()``."""
+    if not hasattr(os, "pread"):
+        return None
+
+    # Only trust the file descriptor of plain files, wrappers such as ``gzip.GzipFile`` also expose the
+    # file descriptor of the (compressed) file they wrap
+    if not isinstance(getattr(fh, "raw", fh), io.FileIO):
+        return None
+
+    try:
+        return fh.fileno()
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+STRINGS_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MIN_LENGTH = 4
+
+ASCII = "ascii"
+UTF16LE = "utf-16-le"
+
+PRINTABLE = rb"\t\x20-\x7e"
+
+
+class String(NamedTuple):
+    """A printable string found in an executable.
+
+    The ``address`` is the relative virtual address (RVA) or file offset of the string, depending on what was
+    scanned. The ``section`` is the section containing the string, if any.
+    """
+
+    address: int
+    encoding: str
+    value: str
+    section: Any | None = None
+
+
+def strings(
+    data: bytes | memoryview | BinaryIO,
+    min_length: int = DEFAULT_MIN_LENGTH,
+    encodings: Iterable[str] = (ASCII, UTF16LE),
+    base: int = 0,
+    section: Any | None = None,
+    chunk_size: int = STRINGS_CHUNK_SIZE,
+) -> Iterator[String]:
+    """Lazily extract printable ASCII and UTF-16LE strings from the data.
+
+    All requested encodings are matched in a single pass over the data. File-like objects are read in chunks of
+    ``chunk_size`` bytes, and strings that cross the boundary of a chunk are carried over to the next one.
+
+    Args:
+        data: The data to scan, either a buffer or a file-like object.
+        min_length: The minimum number of characters of a string.
+        encodings: The encodings to extract, ``"ascii"`` and/or ``"utf-16-le"``.
+        base: The address of the start of the data, added to the address of every string.
+        section: The section to tag every string with.
+        chunk_size: The number of bytes to read at a time.
+    """
+    if min_length <= 0:
+        raise ValueError(f"Invalid minimum length: {min_length}")
+
+    pattern = _pattern(frozenset(encodings), min_length)
+    # A run of printable characters that is too short to match may still grow into a string in the next chunk
+    margin = 2 * min_length
+
+    if not hasattr(data, "read"):
+        yield from _matches(pattern, data, base, section)
+        return
+
+    buf = b""
+    position = base
+    while chunk := data.read(chunk_size):
+        buf = buf + chunk if buf else chunk
+
+        carry = max(0, len(buf) - margin)
+        for match in pattern.finditer(buf):
+            if match.end() > len(buf) - 2:
+                # The string may continue in the next chunk, including the second byte of a UTF-16 character
+                carry = match.start()
+                break
+
+            yield _string(match, position, section)
+            carry = max(carry, match.end())
+
+        position += carry
+        buf = buf[carry:]
+
+    yield from _matches(pattern, buf, position, section)
+
+
+def _pattern(encodings: frozenset[str], min_length: int) -> re.Pattern:
+    if unknown := encodings - {ASCII, UTF16LE}:
+        raise ValueError(f"Unsupported encoding(s): {', '.join(sorted(unknown))}")
+
+    # UTF-16LE is tried first, as the ASCII alternative can never match a printable character followed by a NUL
+    alternatives = []
+    if UTF16LE in encodings:
+        alternatives.append(rb"(?P<utf16>(?:[%s]\x00){%d,})" % (PRINTABLE, min_length))
+    if ASCII in encodings:
+        alternatives.append(rb"(?P<ascii>[%s]{%d,})" % (PRINTABLE, min_length))
+    return re.compile(b"|".join(alternatives))
+
+
+def _matches(pattern: re.Pattern, buf: bytes | memoryview, base: int, section: Any | None) -> Iterator[String]:
+    for match in pattern.finditer(buf):
+        yield _string(match, base, section)
+
+
+def _string(match: re.Match, base: int, section: Any | None) -> String:
+    if match.lastgroup == "utf16":
+        return String(base + match.start(), UTF16LE, match.group().decode(UTF16LE), section)
+    return String(base + match.start(), ASCII, match.group().decode(ASCII), section)
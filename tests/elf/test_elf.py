@@ -4,8 +4,12 @@ from io import BytesIO
 
 import pytest
 
-from dissect.executable.elf.elf import ELF
+from dissect.executable.elf.c_elf import SHN, SHT, c_common_elf
+from dissect.executable.elf.elf import ELF, GnuHashTable, HashTable, gnu_hash, sysv_hash
+from dissect.executable.entropy import entropy, entropy_curve
 from dissect.executable.exception import InvalidSignatureError
+from dissect.executable.strings import ASCII, String
+from tests._utils import absolute_path
 
 
 def test_elf_invalid_signature() -> None:
@@ -15,3 +19,128 @@ def test_elf_invalid_signature() -> None:
 
 def test_elf_valid_signature() -> None:
     ELF(BytesIO(b"\x7fELF" + b"\x00" * 0x40))
+
+
+def test_elf_mmap() -> None:
+    path = absolute_path("_data/elf/hello_world.out")
+
+    with path.open("rb") as fh:
+        elf = ELF(fh)
+        expected = [(section.name, bytes(section.data)) for section in elf.sections]
+
+    with ELF.from_path(path, mmap=True) as elf:
+        assert elf.source.mapped
+        assert [(section.name, bytes(section.data)) for section in elf.sections] == expected
+        assert isinstance(elf.sections[1].data, memoryview)
+
+
+def test_elf_entropy() -> None:
+    path = absolute_path("_data/elf/hello_world.out")
+
+    with path.open("rb") as fh:
+        elf = ELF(fh)
+
+        for section in elf.sections:
+            assert section.entropy() == pytest.approx(entropy(section.data))
+        for segment in elf.segments:
+            assert segment.entropy() == pytest.approx(entropy(segment.data))
+            assert list(segment.entropy_curve(0x40)) == pytest.approx(list(entropy_curve(segment.data, 0x40)))
+
+        segment = elf.segments[0]
+        segment.patch(b"\x00" * 0x10)
+        assert segment.entropy() == 0.0
+
+
+def test_elf_strings() -> None:
+    path = absolute_path("_data/elf/hello_world.out")
+
+    with path.open("rb") as fh:
+        elf = ELF(fh)
+
+        result = list(elf.strings())
+        string = result[0]
+        assert string == String(0x2A8, ASCII, "/lib64/ld-linux-x86-64.so.2", elf.sections[1])
+        assert string.section.name == ".interp"
+        assert ("puts", ".dynstr") in {(string.value, string.section.name) for string in result}
+
+        assert [(string.address, string.value) for string in elf.strings(raw=True)] == [
+            (string.address, string.value) for string in result
+        ]
+
+
+def test_elf_hash_functions() -> None:
+    assert gnu_hash(b"") == 5381
+    assert gnu_hash(b"printf") == 0x156B2BB8
+    assert sysv_hash(b"") == 0
+    assert sysv_hash(b"printf") == 0x077905A6
+
+
+def test_elf_dynamic_symbol() -> None:
+    path = absolute_path("_data/elf/libhash.out")
+
+    with path.open("rb") as fh:
+        elf = ELF(fh)
+        dynsym = elf.sections.by_type(SHT.DYNSYM)[0]
+        (gnu_hash_table,) = elf.sections.by_type(SHT.GNU_HASH)
+        (hash_table,) = elf.sections.by_type(SHT.HASH)
+        assert isinstance(gnu_hash_table, GnuHashTable)
+        assert isinstance(hash_table, HashTable)
+        assert elf._hash_table is gnu_hash_table
+
+        symbol = elf.dynamic_symbol("func_12")
+        assert (symbol.name, symbol.idx) == ("func_12", 7)
+        # Only the symbols in the hash chain are decoded
+        assert "columns" not in dynsym.__dict__
+        assert sum(item is not None for item in dynsym.items) < 5
+
+        expected = {symbol.name: symbol.idx for symbol in dynsym if symbol.shndx != SHN.UNDEF and symbol.name}
+        assert len(expected) == 42
+
+        for name, idx in expected.items():
+            assert gnu_hash_table.lookup(name).idx == idx
+            assert hash_table.lookup(name).idx == idx
+
+        # Undefined symbols and unknown names are not found
+        for name in ["puts", "__cxa_finalize", "func_40", "nonexistent", ""]:
+            assert gnu_hash_table.lookup(name) is None
+            assert hash_table.lookup(name) is None
+            assert elf.dynamic_symbol(name) is None
+
+        # Without hash tables the dynamic symbol table is indexed by name
+        elf._hash_table = None
+        assert elf.dynamic_symbol("greeting").idx == expected["greeting"]
+        assert elf.dynamic_symbol("puts") is None
+
+
+@pytest.mark.parametrize("stripped", [False, True])
+def test_elf_dynamic_table(stripped: bool) -> None:
+    data = absolute_path("_data/elf/libhash.out").read_bytes()
+    if stripped:
+        # Remove the section headers (e_shoff, e_shnum and e_shstrndx), so only the segments can be used
+        data = data[:0x28] + bytes(8) + data[0x30:0x3C] + bytes(4) + data[0x40:]
+
+    elf = ELF(BytesIO(data))
+    assert (len(elf.sections.by_type(SHT.DYNAMIC)) == 0) == stripped
+
+    table = elf.dynamic_table
+    assert len(table) == 26
+    assert list(table)[:2] == [(c_common_elf.DT_NEEDED, 417), (c_common_elf.DT_SONAME, 427)]
+    assert table.get(c_common_elf.DT_SYMENT) == 24
+    assert table.get(c_common_elf.DT_DEBUG) is None
+
+    assert table.needed == ["libc.so.6"]
+    assert table.soname == "libhash.so.1"
+    assert table.rpath == []
+    assert table.runpath == ["/opt/hash/lib"]
+    assert (table.init, table.fini) == (0x1000, 0x139C)
+    assert table.init_array == [0x1100]
+    assert table.fini_array == [0x10C0]
+    assert table.preinit_array == []
+    assert (table.flags, table.flags_1) == (0, 0)
+
+    assert elf.vaddr_to_offset(0x3DD8) == 0x2DD8
+    assert elf.vaddr_to_offset(0x4018) is None
+
+
+def test_elf_dynamic_table_missing() -> None:
+    assert ELF(BytesIO(b"\x7fELF" + b"\x00" * 0x40)).dynamic_table is None
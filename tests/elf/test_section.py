@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import struct
 from io import BytesIO
 from unittest.mock import Mock, patch
 
 import pytest
 
-from dissect.executable.elf.c_elf import SHN
+from dissect.executable.elf import elf as elf_module
+from dissect.executable.elf.c_elf import SHN, STB, STT, STV, c_common_elf, copy_cstruct, elf_32_def, elf_64_def
 from dissect.executable.elf.elf import (
+    ELF,
     SectionTable,
     StringTable,
     Symbol,
     SymbolTable,
     c_elf_64,
 )
+from dissect.executable.exception import Error
+from dissect.executable.source import Source
+from tests._utils import absolute_path
 
 
 @pytest.fixture
@@ -28,6 +34,7 @@ def mock_section_table(section_data: bytes) -> Mock:
     shdr = c_elf_64.Shdr(sh_offset=len(c_elf_64.Shdr), sh_size=len(section_data), sh_entsize=len(section_data))
     mocked_table = Mock()
     mocked_table.fh = BytesIO(shdr.dumps() + section_data)
+    mocked_table.source = Source(mocked_table.fh)
     mocked_table.offset = 0
     mocked_table.size = 0
     mocked_table.c_elf = c_elf_64
@@ -49,16 +56,33 @@ def test_section_selector(section_table: SectionTable, entries: int) -> None:
         assert list(section_table) == [mocked_section.return_value] * entries
 
 
-def test_string_table() -> None:
-    STRING_TABLE = b"\x00hello\x00world\x00"
+@pytest.mark.parametrize("mapped", [False, True])
+@pytest.mark.parametrize("cache_size", [0, 2, None])
+@pytest.mark.parametrize("split", [False, True])
+def test_string_table(mapped: bool, cache_size: int | None, split: bool) -> None:
+    STRING_TABLE = b"\x00hello\x00world\x00unterminated"
 
     mocked_table = mock_section_table(STRING_TABLE)
 
     string_table = StringTable.from_section_table(mocked_table, 0)
-    assert string_table[0] is None
-    assert string_table[1] == "hello"
-    assert string_table[2] == "ello"
-    assert string_table[7] == "world"
+    if mapped:
+        # Memory mapped data is a memoryview, which is searched without copying
+        string_table.__dict__["data"] = memoryview(STRING_TABLE)
+    string_table.set_cache_size(cache_size)
+    if split:
+        string_table.split()
+
+    for _ in range(2):
+        assert string_table[0] is None
+        assert string_table[1] == "hello"
+        assert string_table[2] == "ello"
+        assert string_table[7] == "world"
+        assert string_table[13] == "unterminated"
+        assert string_table[len(STRING_TABLE)] == ""
+        assert string_table[len(STRING_TABLE) + 1] is None
+
+    info = string_table._get_string.cache_info()
+    assert (info.maxsize, info.currsize) == (cache_size, min(7, cache_size) if cache_size is not None else 7)
 
 
 def test_symboltable() -> None:
@@ -129,3 +153,164 @@ def test_symbol_value_from_shndex(section_index: int, table_offset: int, expecte
     symbol = Symbol(BytesIO(symbol_bytes), 0, c_elf_64)
     mock = [Mock(offset=table_offset)] * (symbol.symbol.st_shndx + 1)
     assert symbol.value_based_on_shndx(mock) == expected_output
+
+
+@pytest.mark.parametrize("bits", [32, 64])
+@pytest.mark.parametrize("endian", ["<", ">"])
+@pytest.mark.parametrize("numpy", [True, False])
+def test_symboltable_columns(bits: int, endian: str, numpy: bool) -> None:
+    if numpy:
+        pytest.importorskip("numpy")
+
+    c_elf = copy_cstruct(c_common_elf).load(elf_32_def if bits == 32 else elf_64_def)
+    c_elf.endian = endian
+
+    def _symbol(name: int, value: int, size: int, info: int, other: int, shndx: int) -> bytes:
+        if bits == 32:
+            buf = struct.pack(f"{endian}IIIBBH", name, value, size, info, other, shndx)
+        else:
+            buf = struct.pack(f"{endian}IBBHQQ", name, info, other, shndx, value, size)
+        # Entries may be larger than the symbol structure
+        return buf.ljust(len(c_elf.Sym) + 8, b"\xff")
+
+    data = b"".join(
+        [
+            _symbol(0, 0, 0, 0, 0, 0),
+            _symbol(1, 0x1000, 0x20, 0x12, 0x02, 14),
+            _symbol(7, 0x2000, 8, 0x21, 0x00, SHN.ABS.value),
+        ]
+    )
+    header = c_elf.Shdr(sh_offset=0, sh_size=len(data), sh_entsize=len(c_elf.Sym) + 8)
+
+    with patch.object(elf_module, "HAS_NUMPY", numpy):
+        symbol_table = SymbolTable(BytesIO(data), 0, c_elf, header)
+        symbol_table._link = StringTable(
+            BytesIO(b"\x00hello\x00world\x00"), 0, c_elf, c_elf.Shdr(sh_offset=0, sh_size=13)
+        )
+
+        columns = symbol_table.columns
+        assert list(columns.name) == [0, 1, 7]
+        assert list(columns.value) == [0, 0x1000, 0x2000]
+        assert list(columns.size) == [0, 0x20, 8]
+        assert list(columns.info) == [0, 0x12, 0x21]
+        assert list(columns.other) == [0, 2, 0]
+        assert list(columns.shndx) == [0, 14, SHN.ABS.value]
+
+    symbol = symbol_table[1]
+    assert (symbol.name, symbol.value, symbol.size) == ("hello", 0x1000, 0x20)
+    assert (symbol.bind, symbol.type, symbol.visibility) == (STB.GLOBAL, STT.FUNC, STV.HIDDEN)
+    assert (symbol.symbol.st_name, symbol.symbol.st_info, symbol.symbol.st_shndx) == (1, b"\x12", 14)
+
+    symbol = symbol_table[2]
+    assert (symbol.name, symbol.value, symbol.bind, symbol.type) == ("world", 0x2000, STB.WEAK, STT.OBJECT)
+
+
+def test_symboltable_columns_invalid() -> None:
+    symbol_table = SymbolTable.from_section_table(mock_section_table(b"hello"), 0)
+    with pytest.raises(Error, match="Invalid symbol table entry size"):
+        _ = symbol_table.columns
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_symboltable_lookup(numpy: bool) -> None:
+    if numpy:
+        np = pytest.importorskip("numpy")
+
+    with patch.object(elf_module, "HAS_NUMPY", numpy), absolute_path("_data/elf/hello_world.out").open("rb") as fh:
+        dynsym, symtab = ELF(fh).symbol_tables
+
+        assert [symbol.idx for symbol in symtab.lookup("main")] == [60]
+        assert [symbol.name for symbol in dynsym.lookup("puts")] == ["puts"]
+        assert symtab.lookup("nonexistent") == []
+
+        main = symtab.lookup("main")[0]
+        assert (main.value, main.size) == (0x1135, 23)
+        assert symtab.symbolize(0x1135) is main
+        assert symtab.symbolize(0x1135 + 22) is main
+        assert symtab.symbolize(0x1135 + 23) is None
+        # Symbols without a size only cover their own address
+        assert symtab.symbolize(0x1130).name == "frame_dummy"
+        assert symtab.symbolize(0x1131) is None
+        assert symtab.symbolize(0) is None
+        # Undefined symbols are not indexed
+        assert dynsym.symbolize(0) is None
+
+        addresses = [0x1135, 0x1050 + 42, 0x1150 + 93, 0x2000, 0]
+        expected = ["main", "_start", None, "_IO_stdin_used", None]
+        assert [symbol.name if symbol else None for symbol in symtab.symbolize_many(addresses)] == expected
+        if numpy:
+            result = symtab.symbolize_many(np.array(addresses, dtype=np.uint64))
+            assert [symbol.name if symbol else None for symbol in result] == expected
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_symboltable_symbolize_nested(numpy: bool) -> None:
+    if numpy:
+        np = pytest.importorskip("numpy")
+
+    names = b"\x00outer\x00label\x00inner\x00wide\x00"
+    symbols = [
+        (0, 0, 0, 0),
+        # name, value, size, info (GLOBAL FUNC or OBJECT)
+        (1, 0x1000, 0x100, 0x12),
+        (7, 0x1010, 0, 0x12),
+        (13, 0x1020, 0x10, 0x11),
+        (19, 0x1000, 0x200, 0x12),
+    ]
+    data = b"".join(
+        struct.pack("<IBBHQQ", name, info, 0, 1 if name else 0, value, size) for name, value, size, info in symbols
+    )
+
+    with patch.object(elf_module, "HAS_NUMPY", numpy):
+        symbol_table = SymbolTable(BytesIO(data), 0, c_elf_64, c_elf_64.Shdr(sh_size=len(data), sh_entsize=24))
+        symbol_table._link = StringTable(BytesIO(names), 0, c_elf_64, c_elf_64.Shdr(sh_size=len(names)))
+
+        addresses = [0xFFF, 0x1000, 0x1010, 0x1011, 0x1025, 0x1030, 0x10FF, 0x1100, 0x11FF, 0x1200]
+        expected = [None, "outer", "label", "outer", "inner", "outer", "outer", "wide", "wide", None]
+
+        assert [symbol.name if symbol else None for symbol in map(symbol_table.symbolize, addresses)] == expected
+        assert [symbol.name if symbol else None for symbol in symbol_table.symbolize_many(addresses)] == expected
+        if numpy:
+            result = symbol_table.symbolize_many(np.array(addresses, dtype=np.uint64))
+            assert [symbol.name if symbol else None for symbol in result] == expected
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_symboltable_symbolize_nested_many(numpy: bool) -> None:
+    if numpy:
+        np = pytest.importorskip("numpy")
+
+    # A wide function around many small symbols with gaps between them, and a deep staircase of nested objects
+    ranges = [(0x10000, 0x10000 + 2000 * 0x20)]
+    ranges += [(0x10000 + idx * 0x20, 0x10000 + idx * 0x20 + 0x10) for idx in range(2000)]
+    ranges += [(0x100000 + idx, 0x100000 + 1000 - idx) for idx in range(500)]
+
+    names = b"\x00" + b"".join(f"s{idx}\x00".encode() for idx in range(len(ranges)))
+    offsets = [names.index(f"\x00s{idx}\x00".encode()) + 1 for idx in range(len(ranges))]
+    data = bytes(24) + b"".join(
+        struct.pack("<IBBHQQ", offset, 0x12 if idx == 0 else 0x11, 0, 1, start, end - start)
+        for idx, (offset, (start, end)) in enumerate(zip(offsets, ranges, strict=True))
+    )
+
+    def expected(address: int) -> str | None:
+        # The innermost symbol is the one with the highest start address, and the lowest end address for equal starts
+        containing = [(start, -end, idx) for idx, (start, end) in enumerate(ranges) if start <= address < end]
+        return f"s{max(containing)[2]}" if containing else None
+
+    addresses = [0xFFFF, 0x10000, 0x10010, 0x1001F, 0x10020, 0x10000 + 1999 * 0x20 + 0x18, 0x10000 + 2000 * 0x20]
+    addresses += [0x100000 + offset for offset in (0, 1, 250, 499, 500, 501, 750, 998, 999, 1000)]
+
+    with patch.object(elf_module, "HAS_NUMPY", numpy):
+        symbol_table = SymbolTable(BytesIO(data), 0, c_elf_64, c_elf_64.Shdr(sh_size=len(data), sh_entsize=24))
+        symbol_table._link = StringTable(BytesIO(names), 0, c_elf_64, c_elf_64.Shdr(sh_size=len(names)))
+
+        result = [symbol.name if symbol else None for symbol in map(symbol_table.symbolize, addresses)]
+        assert result == list(map(expected, addresses))
+        # The lifting tables only need enough levels to climb the deepest chain of enclosing symbols
+        assert len(symbol_table._ancestors) <= (500).bit_length()
+
+        if numpy:
+            result = symbol_table.symbolize_many(np.array(addresses, dtype=np.uint64))
+            assert [symbol.name if symbol else None for symbol in result] == [
+                expected(address) for address in addresses
+            ]
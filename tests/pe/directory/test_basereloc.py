@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import pytest
+
 from dissect.executable.pe.c_pe import c_pe
+from dissect.executable.pe.directory import basereloc
 from dissect.executable.pe.pe import PE
 from tests._utils import absolute_path
 
@@ -17,3 +22,49 @@ def test_basereloc() -> None:
 
         assert pe.base_relocations[0].rva == 0x102C
         assert pe.base_relocations[0].type == c_pe.IMAGE_REL_BASED.MIPS_JMPADDR
+
+
+@pytest.mark.parametrize("numpy", [False, True], ids=["python", "numpy"])
+def test_basereloc_arrays(numpy: bool) -> None:
+    """Test the base relocation arrays and the compact iterator."""
+    if numpy:
+        pytest.importorskip("numpy")
+
+    with (
+        absolute_path("_data/pe/32/PUNZIP.EXE").open("rb") as fh,
+        patch.object(basereloc, "HAS_NUMPY", numpy),
+    ):
+        pe = PE(fh)
+
+        types, rvas = pe.base_relocations.arrays
+        assert len(types) == len(rvas) == 5454
+        assert types[0] == c_pe.IMAGE_REL_BASED.MIPS_JMPADDR
+        assert rvas[0] == 0x102C
+
+        expected = [(entry.type, entry.rva) for entry in pe.base_relocations]
+        assert list(zip(types.tolist(), rvas.tolist(), strict=True)) == expected
+        assert list(pe.base_relocations.iter_entries()) == expected
+
+
+def test_basereloc_apply() -> None:
+    """Test applying the supported base relocation types to a buffer."""
+    with absolute_path("_data/pe/32/PUNZIP.EXE").open("rb") as fh:
+        pe = PE(fh)
+
+    directory = pe.base_relocations
+    directory.pages = {
+        0x1000: [
+            (c_pe.IMAGE_REL_BASED.HIGH, 0x1000),
+            (c_pe.IMAGE_REL_BASED.LOW, 0x1002),
+            (c_pe.IMAGE_REL_BASED.HIGHLOW, 0x1004),
+            (c_pe.IMAGE_REL_BASED.DIR64, 0x1008),
+            (c_pe.IMAGE_REL_BASED.MIPS_JMPADDR, 0x1010),
+            (c_pe.IMAGE_REL_BASED.HIGHLOW, 0x1FFE),
+        ],
+    }
+
+    buf = bytearray(bytes.fromhex("0040 0010 00104000 0010400000000000 01020304") + b"\x00" * 0xFEA + b"\xff\xff")
+    directory.apply(buf, 0x1000, 0x12345678)
+
+    assert buf[:0x14] == bytes.fromhex("3452 7866 78667412 7866741200000000 01020304")
+    assert buf[-2:] == b"\xff\xff"  # Does not fit in the buffer
@@ -1,5 +1,13 @@
 from __future__ import annotations
 
+import struct
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dissect.executable.pe.c_pe import c_pe
+from dissect.executable.pe.directory import exception
+from dissect.executable.pe.directory.exception import ExceptionDirectory
 from dissect.executable.pe.pe import PE
 from tests._utils import absolute_path
 
@@ -16,3 +24,100 @@ def test_exception() -> None:
 
         assert pe.exceptions[0].BeginAddress == 0x11010
         assert pe.exceptions[0].EndAddress == 0x11068
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_exception_lookup(numpy: bool) -> None:
+    """Test the runtime function index of the exception directory."""
+    if numpy:
+        np = pytest.importorskip("numpy")
+
+    with absolute_path("_data/pe/32/PUNZIP.EXE").open("rb") as fh:
+        pe = PE(fh)
+        exceptions = pe.exceptions
+
+        assert [(func.begin_address, func.end_address) for func in exceptions.functions] == [
+            (entry.BeginAddress, entry.EndAddress) for entry in exceptions
+        ]
+
+        assert exceptions.function_at(0x1000) is None
+        assert exceptions.function_at(0x11010).entry is exceptions[0]
+        assert exceptions.function_at(0x11067).index == 0
+        assert exceptions.function_at(0x11068).index == 1
+        assert exceptions.function_at(exceptions[-1].EndAddress) is None
+
+        addresses = [0x1000, 0x11010, 0x11067, 0x11068, exceptions[-1].EndAddress]
+        with patch.object(exception, "HAS_NUMPY", numpy):
+            result = exceptions.functions_at(np.array(addresses) if numpy else addresses)
+        assert result == [exceptions.function_at(address) for address in addresses]
+
+
+def test_exception_arm64() -> None:
+    """Test the function lengths of ARM64 exception entries."""
+    with absolute_path("_data/pe/64/comres.dll").open("rb") as fh:
+        pe = PE(fh)
+
+        # The function length is stored in the .xdata record
+        function = pe.exceptions.functions[0]
+        assert function.begin_address == 0x1000
+        assert function.end_address == 0x1004
+        assert function.unwind_data == 0x3564
+        assert pe.exceptions.function_at(0x1003) is function
+        assert pe.exceptions.function_at(0x1004) is None
+
+
+def test_exception_unwind_info() -> None:
+    """Test the x64 unwind information of runtime functions."""
+    buf = bytearray(0x300)
+    struct.pack_into(
+        "<9I",
+        buf,
+        0x100,
+        *(0x1000, 0x1010, 0x200),
+        *(0x1010, 0x1020, 0x200),
+        *(0x1020, 0x1030, 0x240),
+    )
+
+    # Version 1, exception handler, allocate 0x100 + 0x20 bytes and push RBX
+    buf[0x200:0x204] = bytes([0x1 | (c_pe.UNW_FLAG.EHANDLER << 3), 0x10, 4, 0])
+    buf[0x204:0x20C] = bytes([0x0C, c_pe.UWOP.ALLOC_LARGE, 0x20, 0x00, 0x05, 0x32, 0x01, 0x30])
+    struct.pack_into("<I", buf, 0x20C, 0x3000)
+
+    # Version 1, chained to the unwind information of the first function, save RSI and push RBP
+    buf[0x240:0x244] = bytes([0x1 | (c_pe.UNW_FLAG.CHAININFO << 3), 0x04, 3, 0])
+    buf[0x244:0x24A] = bytes([0x04, 0x64, 0x10, 0x00, 0x01, 0x50])
+    struct.pack_into("<3I", buf, 0x24C, 0x1000, 0x1010, 0x200)
+
+    pe = Mock(machine=c_pe.IMAGE_FILE_MACHINE.AMD64)
+    pe.read_at.side_effect = lambda address, size: bytes(buf[address : address + size])
+    exceptions = ExceptionDirectory(pe, 0x100, 36)
+
+    first, second, third = exceptions.functions
+    assert exceptions.function_at(0x1024) is third
+
+    info = first.unwind_info
+    assert info is second.unwind_info
+    assert info.version == 1
+    assert info.size_of_prolog == 0x10
+    assert info.codes == [
+        (0x0C, c_pe.UWOP.ALLOC_LARGE, 0, 0x100),
+        (0x05, c_pe.UWOP.ALLOC_SMALL, 3, 0x20),
+        (0x01, c_pe.UWOP.PUSH_NONVOL, 3, None),
+    ]
+    assert info.handler == 0x3000
+    assert info.handler_data == 0x210
+    assert info.chained is None
+
+    chained = third.unwind_info
+    assert chained.flags == c_pe.UNW_FLAG.CHAININFO
+    assert chained.codes == [
+        (0x04, c_pe.UWOP.SAVE_NONVOL, 6, 0x80),
+        (0x01, c_pe.UWOP.PUSH_NONVOL, 5, None),
+    ]
+    assert chained.handler is None
+    assert chained.chained_function == (0x1000, 0x1010, 0x200)
+    assert chained.chained is info
+    assert list(chained.chain()) == [chained, info]
+
+    # Every unwind information block is only parsed once
+    assert pe.read_at.call_count == 2 + 2 + 1
@@ -24,3 +24,23 @@ def test_export() -> None:
 
         assert pe.exports["OSDebug4VersionCheck"].ordinal == 1
         assert pe.exports["TLFunc"].ordinal == 2
+
+
+def test_export_table() -> None:
+    """Test the columnar export table and the address lookups."""
+    with absolute_path("_data/pe/64/test.exe").open("rb") as fh:
+        pe = PE(fh)
+
+        table = pe.exports.table
+        assert len(table) == 3
+        assert table.ordinals.tolist() == [func.unbiased_ordinal for func in pe.exports]
+        assert table.addresses.tolist() == [0x2BB2, 0x4921, 0x39F9]
+        assert not any(table.forwarders)
+        assert table.name(1) == "CreateShadowPlayApiInterface"
+
+        assert pe.exports.by_address(0x39F9).name == "ShadowPlayOnSystemStart"
+        assert pe.exports.by_address(0x39FA) is None
+        assert pe.exports.nearest(0x39FA).name == "ShadowPlayOnSystemStart"
+        assert pe.exports.nearest(0x4920).name == "ShadowPlayOnSystemStart"
+        assert pe.exports.nearest(0x10000).name == "CreateShadowPlayApiInterface"
+        assert pe.exports.nearest(0x1000) is None
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
+from dissect.executable.pe.directory import imports
 from dissect.executable.pe.pe import PE
 from tests._utils import absolute_path
 
@@ -23,3 +26,31 @@ def test_import() -> None:
 
         assert pe.imports[0]["_vsnwprintf"] == pe.imports[0].functions[0]
         assert pe.imports[0][1004] == pe.imports[0].functions[0]
+
+
+def test_import_thunks() -> None:
+    """Test the columnar thunk table of an import module."""
+    with absolute_path("_data/pe/32/OLEACCHOOKS.DLL").open("rb") as fh:
+        pe = PE(fh)
+        module = pe.imports[0]
+
+        assert len(module.thunks) == 7
+        assert module.thunks.names[0] == "_vsnwprintf"
+        assert module.thunks.ordinals[0] == 1004
+        assert module.thunks.names == [func.name for func in module.functions]
+
+        func = module.functions[0]
+        assert func.lookup_thunk.u1.AddressOfData == module.thunks.lookup[0]
+        assert func.address_thunk.u1.Function == module.thunks.addresses[0]
+        assert func.address is None
+
+
+def test_import_hint_names_fallback() -> None:
+    """Test that hint/name entries outside of a single buffer are read separately."""
+    with absolute_path("_data/pe/32/PUNZIP.EXE").open("rb") as fh:
+        pe = PE(fh)
+        expected = [(module.name, module.thunks.names, module.thunks.ordinals) for module in pe.imports]
+
+    with absolute_path("_data/pe/32/PUNZIP.EXE").open("rb") as fh, patch.object(imports, "HINT_NAME_SPAN", 0):
+        pe = PE(fh)
+        assert [(module.name, module.thunks.names, module.thunks.ordinals) for module in pe.imports] == expected
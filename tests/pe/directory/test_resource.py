@@ -84,3 +84,28 @@ def test_resource_string_table() -> None:
             58380: "http://ftpm.amd.com/pki/aia",
             59629: "https://ekcert.spserv.microsoft.com/EKCertificate/GetEKCertificate/v1",
         }
+
+
+def test_resource_index() -> None:
+    """Test the cached resource directory lookups and the flattened resource index."""
+    with absolute_path("_data/pe/32/PUNZIP.EXE").open("rb") as fh:
+        pe = PE(fh)
+
+        tree = pe.resources.tree
+        assert tree.entries is tree.entries
+        assert tree.get(c_pe.RT.ICON) is tree.get(3)
+        assert tree.get(c_pe.RT.ICON) is tree.listdir()[3]
+        assert tree.get(1234) is None
+
+        index = pe.resources.index
+        assert len(index) == sum(len(resource.languages()) for resource in pe.resources)
+        for resource in pe.resources:
+            for language, entry in resource.entry.iterdir():
+                assert pe.resources.lookup(resource.type, resource.name, language) is entry
+
+        icon = pe.resources.icon[0]
+        assert index[(3, icon.name, 1033)] is icon[1033]
+        assert pe.resources.lookup("ICON", icon.name) is next(icon.entry.iterdir())[1]
+        assert pe.resources.lookup(c_pe.RT.ICON, icon.name, "en-US") is icon["en-US"]
+        assert pe.resources.lookup(c_pe.RT.ICON, 0xFFFF) is None
+        assert pe.resources.lookup(c_pe.RT.ICON, icon.name, 0xFFFF) is None
@@ -1,11 +1,72 @@
 from __future__ import annotations
 
+import datetime
 import hashlib
 
+import pytest
+
+from dissect.executable.exception import Error
+from dissect.executable.pe.directory.security import Signature
 from dissect.executable.pe.pe import PE
 from tests._utils import absolute_path
 
 
+def _der(tag: int, *contents: bytes) -> bytes:
+    content = b"".join(contents)
+    if len(content) < 0x80:
+        return bytes([tag, len(content)]) + content
+    length = len(content).to_bytes((len(content).bit_length() + 7) // 8, "big")
+    return bytes([tag, 0x80 | len(length)]) + length + content
+
+
+def _oid(value: str) -> bytes:
+    first, second, *parts = map(int, value.split("."))
+    content = bytearray([first * 40 + second])
+    for part in parts:
+        encoded = [part & 0x7F]
+        while part := part >> 7:
+            encoded.append(0x80 | (part & 0x7F))
+        content += bytes(reversed(encoded))
+    return _der(0x06, bytes(content))
+
+
+def _signature(
+    digest: bytes,
+    serial: int,
+    attributes: bytes = b"",
+    unauthenticated: bytes = b"",
+    signer_id: bytes | None = None,
+) -> bytes:
+    if signer_id is None:
+        name = _der(0x30, _der(0x31, _der(0x30, _oid("2.5.4.3"), _der(0x0C, b"Test CA"))))
+        signer_id = _der(0x30, name, _der(0x02, serial.to_bytes(4, "big")))
+
+    signer_info = _der(
+        0x30,
+        _der(0x02, b"\x01"),
+        signer_id,
+        _der(0x30, _oid("2.16.840.1.101.3.4.2.1")),
+        _der(0xA0, attributes) if attributes else b"",
+        _der(0x30, _oid("1.2.840.113549.1.1.1")),
+        _der(0x04, b"signature"),
+        _der(0xA1, unauthenticated) if unauthenticated else b"",
+    )
+    indirect_data = _der(
+        0x30,
+        _oid("1.3.6.1.4.1.311.2.1.4"),
+        _der(0xA0, _der(0x30, _der(0x30), _der(0x30, _der(0x30, _oid("2.16.840.1.101.3.4.2.1")), _der(0x04, digest)))),
+    )
+    signed_data = _der(
+        0x30,
+        _der(0x02, b"\x01"),
+        _der(0x31),
+        indirect_data,
+        _der(0xA0, b"\x30\x00"),
+        _der(0x31, signer_info),
+    )
+    return _der(0x30, _oid("1.2.840.113549.1.7.2"), _der(0xA0, signed_data))
+
+
 def test_security() -> None:
     """Test the security directory."""
     with absolute_path("_data/pe/32/UWPEnum.dll").open("rb") as fh:
@@ -18,3 +79,90 @@ def test_security() -> None:
         assert pe.security[0].revision == 512
         assert pe.security[0].type.name == "PKCS_SIGNED_DATA"
         assert hashlib.sha1(pe.security[0].data).hexdigest() == "933f765d09486cc41091e2bfd305be723e9e4b53"
+
+
+def test_security_signature() -> None:
+    """Test extracting the signer information from an Authenticode signature."""
+    with absolute_path("_data/pe/32/UWPEnum.dll").open("rb") as fh:
+        pe = PE(fh)
+
+        signature = pe.security[0].signature
+        assert signature.digest_algorithm == "sha1"
+        assert signature.digest == pe.authenticode(["sha1"])["sha1"]
+        assert signature.issuer == (
+            "C=US, O=VeriSign, Inc., OU=VeriSign Trust Network, "
+            "OU=Terms of use at https://www.verisign.com/rpa (c)10, CN=VeriSign Class 3 Code Signing 2010 CA"
+        )
+        assert signature.serial_number == 0x14781BC862E8DC503A559346F5DCC518
+        # From the countersignature
+        assert signature.signing_time == datetime.datetime(2017, 11, 27, 8, 13, 10, tzinfo=datetime.timezone.utc)
+        assert signature.nested == []
+
+
+def test_security_signature_nested() -> None:
+    """Test nested signatures and signing times of an Authenticode signature."""
+    signing_time = _der(0x30, _oid("1.2.840.113549.1.9.5"), _der(0x31, _der(0x17, b"240102030405Z")))
+    nested = _signature(b"\x02" * 32, 2, attributes=signing_time)
+    data = _signature(
+        b"\x01" * 32,
+        1,
+        unauthenticated=_der(0x30, _oid("1.3.6.1.4.1.311.2.4.1"), _der(0x31, nested)),
+    )
+
+    signature = Signature(data)
+    assert signature.digest_algorithm == "sha256"
+    assert signature.digest == b"\x01" * 32
+    assert signature.issuer == "CN=Test CA"
+    assert signature.serial_number == 1
+    assert signature.signing_time is None
+
+    assert len(signature.nested) == 1
+    assert signature.nested[0].digest == b"\x02" * 32
+    assert signature.nested[0].serial_number == 2
+    assert signature.nested[0].signing_time == datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    assert signature.nested[0].nested == []
+
+
+def test_security_signature_subject_key_identifier() -> None:
+    """Test a signer that is identified by a subject key identifier instead of an issuer and serial number."""
+    signature = Signature(_signature(b"\x01" * 32, 1, signer_id=_der(0x80, b"\xaa" * 20)))
+
+    assert signature.digest == b"\x01" * 32
+    assert signature.issuer is None
+    assert signature.serial_number is None
+    assert repr(signature) == "<Signature digest_algorithm=sha256 serial_number=None>"
+
+
+@pytest.mark.parametrize(
+    ("data", "attribute"),
+    [
+        # Empty ContentInfo
+        (_der(0x30), "digest"),
+        # SignedData without any content
+        (_der(0x30, _oid("1.2.840.113549.1.7.2"), _der(0xA0)), "digest"),
+        # SignedData without the encapsulated content
+        (_der(0x30, _oid("1.2.840.113549.1.7.2"), _der(0xA0, _der(0x30, _der(0x02, b"\x01"), _der(0x31)))), "digest"),
+        # SignedData that is not a SEQUENCE
+        (_der(0x30, _oid("1.2.840.113549.1.7.2"), _der(0xA0, _der(0x04, b"\x00"))), "digest"),
+        # Signer identifier that is neither an IssuerAndSerialNumber nor a SubjectKeyIdentifier
+        (_signature(b"\x01" * 32, 1, signer_id=_der(0x02, b"\x01")), "serial_number"),
+        # IssuerAndSerialNumber without a serial number
+        (_signature(b"\x01" * 32, 1, signer_id=_der(0x30, _der(0x30))), "issuer"),
+    ],
+)
+def test_security_signature_malformed(data: bytes, attribute: str) -> None:
+    """Test that malformed signatures raise an error instead of failing on unexpected structures."""
+    signature = Signature(data)
+
+    with pytest.raises(Error):
+        getattr(signature, attribute)
+    assert repr(signature) == f"<Signature size={len(data)} invalid>"
+
+
+def test_security_signature_truncated() -> None:
+    """Test that truncated signatures raise an error."""
+    data = _signature(b"\x01" * 32, 1)
+
+    for size in range(len(data)):
+        with pytest.raises(Error):
+            Signature(data[:size])
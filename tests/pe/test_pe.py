@@ -4,12 +4,22 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
+import mmap
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from unittest.mock import patch
 
 import pytest
 
-from dissect.executable.exception import InvalidSignatureError
-from dissect.executable.pe.pe import PE
+from dissect.executable.cache import DEFAULT_CACHE_SIZE
+from dissect.executable.entropy import entropy, entropy_curve
+from dissect.executable.exception import Error, InvalidSignatureError
+from dissect.executable.pe.c_pe import c_pe
+from dissect.executable.pe.pe import PE, Section
+from dissect.executable.pe.translation import TranslationTable
+from dissect.executable.strings import ASCII, String
 from tests._utils import absolute_path
 
 
@@ -54,3 +64,470 @@ def test_pe_os2() -> None:
 
         assert pe.is_os2()
         assert not pe.is_pe()
+
+
+def test_pe_mmap() -> None:
+    """Test that a memory mapped PE file yields the same data as a regular file, without copying."""
+    path = absolute_path("_data/pe/64/test.exe")
+
+    with path.open("rb") as fh:
+        pe = PE(fh)
+        expected_sections = [bytes(section.data) for section in pe.sections]
+        expected_imports = [(module.name, [func.name for func in module]) for module in pe.imports]
+        expected_view = bytes(pe.view(0x1000, 0x2000))
+
+    with PE.from_path(path, mmap=True) as pe:
+        assert pe.source.mapped
+        assert [bytes(section.data) for section in pe.sections] == expected_sections
+        assert [(module.name, [func.name for func in module]) for module in pe.imports] == expected_imports
+        assert bytes(pe.view(0x1000, 0x2000)) == expected_view
+
+        # Views within a single section directly reference the mapping
+        section = pe.sections[1]
+        view = pe.view(section.virtual_address, 0x10)
+        assert isinstance(view.obj, mmap.mmap)
+        assert isinstance(section.data.obj, mmap.mmap)
+        del view, section
+
+
+@pytest.mark.parametrize("cache_size", [0, DEFAULT_CACHE_SIZE], ids=["uncached", "cached"])
+def test_pe_threaded(cache_size: int) -> None:
+    """Test that a single PE object can be shared between threads."""
+    path = absolute_path("_data/pe/32/PUNZIP.EXE")
+
+    def parse(pe: PE) -> list:
+        return [
+            [(module.name, [(func.name, func.ordinal) for func in module]) for module in pe.imports],
+            [(resource.type, resource.name, resource.data()) for resource in pe.resources],
+            [bytes(pe.read_at(section.virtual_address, 0x100)) for section in pe.sections],
+        ]
+
+    with path.open("rb") as fh:
+        expected = parse(PE(fh))
+
+    for src in (BytesIO(path.read_bytes()), path.open("rb")):
+        pe = PE(src, cache_size=cache_size)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: parse(pe), range(32)))  # noqa: B023
+
+        assert all(result == expected for result in results)
+
+
+def test_pe_cache() -> None:
+    """Test that small reads of the virtual address space are served from the page cache."""
+    path = absolute_path("_data/pe/32/PUNZIP.EXE")
+
+    class CountingBytesIO(BytesIO):
+        reads = 0
+
+        def read(self, size: int = -1) -> bytes:
+            self.reads += 1
+            return super().read(size)
+
+    def parse(pe: PE) -> list:
+        return [
+            [(module.name, [(func.name, func.ordinal) for func in module]) for module in pe.imports],
+            [(resource.type, resource.name, resource.data()) for resource in pe.resources],
+            [bytes(pe.read_at(section.virtual_address, 0x100)) for section in pe.sections],
+        ]
+
+    uncached_fh = CountingBytesIO(path.read_bytes())
+    uncached = PE(uncached_fh, cache_size=0)
+    assert uncached.cache is None
+
+    # The page cache is opt-in
+    assert PE(CountingBytesIO(path.read_bytes())).cache is None
+
+    cached_fh = CountingBytesIO(path.read_bytes())
+    cached = PE(cached_fh, cache_size=DEFAULT_CACHE_SIZE)
+    assert cached.cache.page_size == cached.optional_header.SectionAlignment
+
+    assert parse(cached) == parse(uncached)
+    assert cached.cache.hits > cached.cache.misses
+    assert cached_fh.reads * 10 < uncached_fh.reads
+
+    with PE.from_path(path, mmap=True) as pe:
+        assert pe.cache is None
+
+
+def test_pe_translation() -> None:
+    """Test translating between relative virtual addresses and file offsets."""
+    with absolute_path("_data/pe/64/test.exe").open("rb") as fh:
+        pe = PE(fh)
+        text = pe.sections[1]
+
+        assert pe.rva_to_offset(0x10) == 0x10
+        assert pe.rva_to_offset(0x200) is None  # In between the headers and the first section
+        assert pe.rva_to_offset(0x2010) == text.pointer_to_raw_data + 0x10
+        assert pe.rva_to_offset(0x2258) is None  # Past the virtual size of the section
+        assert pe.rva_to_offset(0x10000000) is None
+
+        assert pe.offset_to_rva(0x10) == 0x10
+        assert pe.offset_to_rva(text.pointer_to_raw_data + 0x10) == 0x2010
+        assert pe.offset_to_rva(0x400000) is None
+
+        assert pe.section_for_rva(0x2010) is text
+        assert pe.section_for_rva(0x2300) is None
+        assert pe.section_for_rva(0x10) is None
+
+        rvas = [0x10, 0x200, 0x2010, 0x1DB100, 0x10000000]
+        expected = [0x10, None, text.pointer_to_raw_data + 0x10, pe.sections[3].pointer_to_raw_data + 0x100, None]
+        assert pe.rvas_to_offsets(rvas) == expected
+
+        np = pytest.importorskip("numpy")
+        result = pe.rvas_to_offsets(np.array(rvas, dtype=np.uint32))
+        assert result.tolist() == [-1 if offset is None else offset for offset in expected]
+
+
+def test_pe_translation_overlap() -> None:
+    """Test the translation of sections with a zero virtual size, overlapping sections and zero filled data."""
+    with absolute_path("_data/pe/64/test.exe").open("rb") as fh:
+        pe = PE(fh)
+
+    headers = pe.optional_header.SizeOfHeaders
+
+    def section(name: bytes, virtual_address: int, virtual_size: int, raw_size: int, raw: int) -> Section:
+        header = c_pe.IMAGE_SECTION_HEADER(
+            Name=name,
+            Misc=c_pe.IMAGE_SECTION_HEADER.fields["Misc"].type(VirtualSize=virtual_size),
+            VirtualAddress=virtual_address,
+            SizeOfRawData=raw_size,
+            PointerToRawData=raw,
+        )
+        return Section(pe, header)
+
+    pe.sections = [
+        section(b".a", 0x1000, 0, 0x200, 0x400),  # Virtual size of zero uses the raw size
+        section(b".b", 0x2000, 0x2000, 0x200, 0x600),  # Overlapped by .c
+        section(b".c", 0x3000, 0x1000, 0x1000, 0x800),
+        section(b".d", headers - 0x10, 0x20, 0x20, 0x1800),  # Overlaps the headers
+    ]
+    table = TranslationTable.from_pe(pe)
+
+    assert table.rva_to_offset(0x1100) == 0x500
+    assert table.section_for_rva(0x1100) is pe.sections[0]
+    assert table.rva_to_offset(0x1200) is None
+
+    assert table.rva_to_offset(0x2100) == 0x700
+    assert table.rva_to_offset(0x2200) is None
+    assert table.section_for_rva(0x2200) is pe.sections[1]
+    assert table.rva_to_offset(0x3000) == 0x800
+    assert table.section_for_rva(0x3000) is pe.sections[2]
+
+    assert table.rva_to_offset(headers - 0x8) == headers - 0x8
+    assert table.rva_to_offset(headers) == 0x1810
+    assert table.offset_to_rva(0x1810) == headers
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "_data/pe/64/test.exe",
+        "_data/pe/32/PUNZIP.EXE",
+        "_data/pe/32/Dummy.dll",
+    ],
+)
+def test_pe_peek(path: str) -> None:
+    """Test that peeking at the headers of a PE file matches the full parser."""
+    with absolute_path(path).open("rb") as fh:
+        pe = PE(fh)
+        summary = PE.peek(fh)
+
+        assert summary.machine == pe.machine
+        assert summary.characteristics == pe.file_header.Characteristics
+        assert summary.subsystem == pe.optional_header.Subsystem
+        assert summary.number_of_sections == len(pe.sections)
+        assert summary.image_base == pe.image_base
+        assert summary.is_64bit() == pe.is_64bit()
+        assert summary.is_dll() == path.endswith(".dll")
+        if pe.timestamp:
+            assert summary.timestamp == pe.timestamp
+
+        if pe.rich_header:
+            assert summary.rich_header.hash() == pe.rich_header.hash()
+        else:
+            assert summary.rich_header is None
+
+
+def test_pe_peek_invalid() -> None:
+    with pytest.raises(InvalidSignatureError):
+        PE.peek(BytesIO(b"MZ"))
+
+    with pytest.raises(InvalidSignatureError):
+        PE.peek(BytesIO(b"MZ" + b"\x00" * 400))
+
+    with absolute_path("_data/pe/16/DPMIRES.EXE").open("rb") as fh, pytest.raises(InvalidSignatureError):
+        PE.peek(fh)
+
+
+@pytest.mark.parametrize(
+    ("path", "fmt"),
+    [
+        ("_data/pe/64/test.exe", "<Q"),
+        ("_data/pe/32/NetDbgTLLoc.dll", "<I"),
+    ],
+)
+def test_pe_rebase(path: str, fmt: str) -> None:
+    """Test relocating a PE file to a different image base, and back."""
+    with absolute_path(path).open("rb") as fh:
+        pe = PE(fh)
+        original = pe.open().read()
+
+        new_base = pe.image_base + 0x10000000
+        rebased = pe.rebase(new_base).read()
+        assert len(rebased) == len(original)
+
+        relocated = set()
+        for entry in pe.base_relocations:
+            size = struct.calcsize(fmt)
+            expected = (struct.unpack_from(fmt, original, entry.rva)[0] + 0x10000000) % (1 << (size * 8))
+            assert struct.unpack_from(fmt, rebased, entry.rva)[0] == expected
+            relocated.update(range(entry.rva, entry.rva + size))
+
+        image_base_offset = pe.mz_header.e_lfanew + 4 + len(c_pe.IMAGE_FILE_HEADER) + (24 if pe.is_64bit() else 28)
+        relocated.update(range(image_base_offset, image_base_offset + struct.calcsize(fmt)))
+        assert all(rebased[i] == original[i] for i in range(len(original)) if i not in relocated)
+
+        # Small reads that straddle relocations
+        stream = pe.rebase(new_base)
+        rva = pe.base_relocations[0].rva
+        stream.seek(rva + 1)
+        assert stream.read(2) == rebased[rva + 1 : rva + 3]
+
+        # Undo the relocations of a "memory dump" of the rebased image
+        dumped = PE(BytesIO(rebased), virtual=True)
+        assert dumped.image_base == new_base
+        assert dumped.rebase(pe.image_base).read() == original
+
+
+@pytest.mark.parametrize(
+    ("path", "signed"),
+    [
+        ("_data/pe/32/UWPEnum.dll", True),
+        ("_data/pe/64/test.exe", False),
+    ],
+)
+def test_pe_authenticode(path: str, signed: bool) -> None:
+    """Test computing the Authenticode digests of a PE file."""
+    with absolute_path(path).open("rb") as fh:
+        pe = PE(fh)
+        data = absolute_path(path).read_bytes()
+
+        checksum = pe.mz_header.e_lfanew + 4 + len(c_pe.IMAGE_FILE_HEADER) + 64
+        directory = checksum + (48 if pe.is_64bit() else 32) + 4 * 8
+        expected = data[:checksum] + data[checksum + 4 : directory] + data[directory + 8 :]
+        if signed:
+            expected = expected[: pe.security.address - 12]
+
+        digests = pe.authenticode()
+        assert digests == {name: hashlib.new(name, expected).digest() for name in ("md5", "sha1", "sha256")}
+        assert pe.authenticode(["sha1"], chunk_size=100) == {"sha1": digests["sha1"]}
+
+        if signed:
+            # The signature contains the SHA1 digest of the file
+            assert digests["sha1"] in pe.security[0].data
+
+    with absolute_path(path).open("rb") as fh, pytest.raises(Error):
+        PE(fh, virtual=True).authenticode()
+
+
+def test_pe_digests() -> None:
+    """Test computing the digests of the regions of a PE file in a single pass."""
+    path = absolute_path("_data/pe/32/mingwm10.dll")
+    data = path.read_bytes()
+
+    with path.open("rb") as fh:
+        pe = PE(fh)
+
+        with patch.object(pe.source, "view", wraps=pe.source.view) as view:
+            digests = pe.digests(chunk_size=0x1000)
+        # Every chunk of the file is read exactly once
+        assert view.call_count == (len(data) + 0xFFF) // 0x1000
+
+        def _expected(buf: bytes) -> dict[str, bytes]:
+            return {name: hashlib.new(name, buf).digest() for name in ("md5", "sha1", "sha256")}
+
+        assert digests.file == _expected(data)
+        assert digests.sections == [_expected(section.data.tobytes()) for section in pe.sections]
+        assert digests.overlay == _expected(data[0x2800:])
+        assert digests.resources == {}
+
+        digests = pe.digests(["sha1"], file=False, overlay=False, resources=False)
+        assert digests.file is None
+        assert digests.sections == [{"sha1": hashlib.sha1(section.data).digest()} for section in pe.sections]
+        assert digests.overlay is None
+        assert digests.resources is None
+
+    with absolute_path("_data/pe/32/PUNZIP.EXE").open("rb") as fh:
+        pe = PE(fh)
+
+        digests = pe.digests(["md5"], file=False, sections=False, overlay=False)
+        assert digests.resources == {
+            key: {"md5": hashlib.md5(entry.data).digest()} for key, entry in pe.resources.index.items()
+        }
+
+
+def test_pe_overlay() -> None:
+    """Test locating and streaming the overlay, excluding the certificate table."""
+    path = absolute_path("_data/pe/32/mingwm10.dll")
+    data = path.read_bytes()
+
+    with path.open("rb") as fh:
+        pe = PE(fh)
+        assert pe.overlay_offset == 0x2800
+        assert pe.overlay_size == len(data) - 0x2800
+
+        with patch.object(pe.source, "view", wraps=pe.source.view) as view:
+            fh = pe.open_overlay()
+            # The overlay is not read until the stream is
+            assert view.call_count == 0
+            assert fh.read() == data[0x2800:]
+
+    # The certificate table directly follows the sections and is not part of the overlay
+    data = absolute_path("_data/pe/32/UWPEnum.dll").read_bytes()
+    pe = PE(BytesIO(data))
+    assert pe.overlay_offset is None
+    assert pe.overlay_size == 0
+    assert pe.open_overlay() is None
+
+    # Data appended after the certificate table
+    pe = PE(BytesIO(data + b"payload"))
+    assert pe.overlay_offset == len(data)
+    assert pe.open_overlay().read() == b"payload"
+
+    # Data between the sections and the certificate table
+    security = struct.pack("<II", 1536, 6544)
+    assert data.count(security) == 1
+    buf = data[:1536].replace(security, struct.pack("<II", 1536 + 16, 6544)) + b"payload".ljust(16, b"\0") + data[1536:]
+    pe = PE(BytesIO(buf))
+    assert pe.overlay_offset == 1536
+    assert pe.open_overlay().read() == b"payload".ljust(16, b"\0")
+
+    with path.open("rb") as fh:
+        assert PE(fh, virtual=True).overlay_offset is None
+
+
+def test_pe_entropy() -> None:
+    """Test the entropy of the file and its sections."""
+    path = absolute_path("_data/pe/32/mingwm10.dll")
+    data = path.read_bytes()
+
+    with path.open("rb") as fh:
+        pe = PE(fh)
+
+        assert pe.entropy() == pytest.approx(entropy(data))
+        assert list(pe.entropy_curve(0x400)) == pytest.approx(list(entropy_curve(data, 0x400)))
+
+        text = pe.sections[0]
+        assert text.name == ".text"
+        assert text.entropy() == pytest.approx(entropy(text.data))
+        assert list(text.entropy_curve(0x100, 0x80)) == pytest.approx(list(entropy_curve(text.data, 0x100, 0x80)))
+        assert [section.entropy() for section in pe.sections if section.name == ".bss"] == [0.0]
+
+        # A memory dump of the image, in which the sections are at their virtual address
+        image = pe.open().read()
+
+    dumped = PE(BytesIO(image), virtual=True)
+    for section in dumped.sections:
+        data = image[section.virtual_address : section.virtual_address + section.virtual_size]
+        assert section.entropy() == pytest.approx(entropy(data))
+        assert list(section.entropy_curve(0x100)) == pytest.approx(list(entropy_curve(data, 0x100)))
+
+    text, data = dumped.sections[0], next(section for section in dumped.sections if section.name == ".data")
+    assert text.entropy() == pytest.approx(6.007, abs=1e-3)
+    assert data.entropy() == pytest.approx(2.0, abs=1e-3)
+
+
+def test_pe_imphash_ordinals() -> None:
+    """Test that ordinal imports are named like pefile does, so the import hash matches external tools."""
+    data = bytearray(absolute_path("_data/pe/32/mingwm10.dll").read_bytes())
+
+    # Rename KERNEL32.dll and msvcrt.dll and import their first functions by ordinal instead of by name
+    data[0x2054 : 0x2054 + 12] = b"WS2_32.dll\0\0"
+    data[0x2090 : 0x2090 + 13] = b"OLEAUT32.dll\0"
+    for offsets, ordinals in (((0x1E3C, 0x1E98), (25, 36)), ((0x1E68, 0x1EC4), (94, 9999))):
+        for offset in offsets:
+            for idx, ordinal in enumerate(ordinals):
+                struct.pack_into("<I", data, offset + idx * 4, 0x80000000 | ordinal)
+
+    pe = PE(BytesIO(bytes(data)))
+    assert pe._normalized_imports[:2] == ["ws2_32.freeaddrinfoex", "ws2_32.inetptonw"]
+    assert pe._normalized_imports[10:12] == ["oleaut32.vardatefromstr", "oleaut32.ord9999"]
+    # As calculated by pefile
+    assert pe.imphash() == "c9ddace7c2c83c8f972a027210b45ac8"
+
+
+def test_pe_strings() -> None:
+    """Test extracting strings from the sections and the raw file."""
+    path = absolute_path("_data/pe/32/mingwm10.dll")
+
+    with path.open("rb") as fh:
+        pe = PE(fh)
+
+        result = list(pe.strings())
+        assert all(
+            string.section.virtual_address
+            <= string.address
+            < string.section.virtual_address + string.section.virtual_size
+            for string in result
+        )
+        assert ("mingwm10.dll", ".edata") in {(string.value, string.section.name) for string in result}
+
+        string = next(string for string in result if string.value == "mingwm10.dll")
+        assert pe.read_at(string.address, len(string.value)) == b"mingwm10.dll"
+
+        result = list(pe.strings(min_length=8, raw=True))
+        assert result[0] == String(0x4D, ASCII, "!This program cannot be run in DOS mode.", None)
+        string = next(string for string in result if string.value == "mingwm10.dll")
+        assert string.section.name == ".edata"
+        assert string.address == pe.rva_to_offset(next(s for s in pe.strings() if s.value == "mingwm10.dll").address)
+
+
+def test_pe_imphash() -> None:
+    """Test the import hash and export hash."""
+    with absolute_path("_data/pe/64/test.exe").open("rb") as fh:
+        pe = PE(fh)
+
+        # Ordinals of well known modules are resolved to their names
+        ordinals = {
+            2: "SysAllocString",
+            4: "SysAllocStringLen",
+            6: "SysFreeString",
+            8: "VariantInit",
+            9: "VariantClear",
+            10: "VariantCopy",
+            12: "VariantChangeType",
+            200: "GetErrorInfo",
+            201: "SetErrorInfo",
+            202: "CreateErrorInfo",
+        }
+        expected = []
+        for module in pe.imports.modules:
+            for func in module.functions:
+                name = (func.name or ordinals.get(func.ordinal, f"ord{func.ordinal}")).lower()
+                expected.append(f"{module.name.lower().removesuffix('.dll')}.{name}")
+
+        assert pe._normalized_imports == expected
+
+        assert pe.imphash() == "977f887ba1716db690f3f6cd927adbd9"
+        assert pe.imphash() == pe.imphash(delay_imports=True)
+        assert (
+            pe.exphash()
+            == hashlib.md5(
+                b"createoverlayapiinterface,createshadowplayapiinterface,shadowplayonsystemstart"
+            ).hexdigest()
+        )
+
+    with absolute_path("_data/pe/32/OLEACCHOOKS.DLL").open("rb") as fh:
+        pe = PE(fh)
+
+        assert pe.imphash() == "8e1a600ec830336d52f282819dd1329f"
+        assert pe.imphash(delay_imports=True) == "dd119b6441f714d9e62d2ef6626e4fd3"
+        assert pe.exphash() is None
+        # No function objects are created
+        assert all("functions" not in vars(module) for module in pe.imports.modules)
+
+    with absolute_path("_data/pe/32/Dummy.dll").open("rb") as fh:
+        pe = PE(fh)
+
+        assert pe.imphash() is None
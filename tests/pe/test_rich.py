@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import struct
+
+from dissect.executable.pe.pe import PE
+from dissect.executable.pe.rich import RichHeader
+from tests._utils import absolute_path
+
+
+def test_rich_header() -> None:
+    """Test parsing the Rich header."""
+    with absolute_path("_data/pe/32/NetDbgTLLoc.dll").open("rb") as fh:
+        pe = PE(fh)
+
+        rich = pe.rich_header
+        assert rich.offset == 0x80
+        assert rich.key == 0x4B7154FF
+        assert rich.is_valid()
+        assert len(rich) == 10
+        assert list(rich)[:3] == [(93, 2241, 2), (15, 2241, 3), (95, 2241, 8)]
+        assert rich.product_ids[0] == 93
+        assert rich.builds[0] == 2241
+        assert rich.counts[0] == 2
+        assert rich.comp_ids[0] == (93 << 16) | 2241
+        assert rich.hash() == "0fd74c0a0e6d0991caf4f34f1422834a"
+
+    with absolute_path("_data/pe/32/mingwm10.dll").open("rb") as fh:
+        assert PE(fh).rich_header is None
+
+
+def test_rich_header_checksum() -> None:
+    """Test that a tampered Rich header fails the checksum validation."""
+    with absolute_path("_data/pe/32/Dummy.dll").open("rb") as fh:
+        pe = PE(fh)
+        buf = bytearray(pe.mz_header.dumps() + pe.dos_stub)
+        assert RichHeader.parse(bytes(buf)).is_valid()
+
+        # Change the count of the first entry
+        offset = pe.rich_header.offset + 20
+        struct.pack_into("<I", buf, offset, struct.unpack_from("<I", buf, offset)[0] ^ 2)
+        rich = RichHeader.parse(bytes(buf))
+        assert rich.counts[0] == 3
+        assert not rich.is_valid()
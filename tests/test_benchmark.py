@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import tracemalloc
+from mmap import ACCESS_READ
+from mmap import mmap as mmap_file
+from typing import TYPE_CHECKING, BinaryIO
+
+import pytest
+
+from dissect.executable import ELF, PE
+from dissect.executable.cache import DEFAULT_CACHE_SIZE
+from dissect.executable.source import Source
+from tests._utils import absolute_path
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+class CountingFile:
+    """File-like wrapper that counts the ``read`` and ``seek`` calls that reach the underlying file."""
+
+    def __init__(self, fh: BinaryIO):
+        self.fh = fh
+        self.calls = 0
+
+    def read(self, n: int = -1) -> bytes:
+        self.calls += 1
+        return self.fh.read(n)
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        self.calls += 1
+        return self.fh.seek(pos, whence)
+
+    def tell(self) -> int:
+        return self.fh.tell()
+
+
+def _measure(benchmark: BenchmarkFixture, path: Path, mmap: bool, func: Callable[[Source], None]) -> None:
+    """Run ``func`` once to record the number of file I/O calls and the peak memory allocation, then benchmark it."""
+    with path.open("rb") as fh:
+        counting_fh = CountingFile(fh)
+        source = Source(mmap_file(fh.fileno(), 0, access=ACCESS_READ) if mmap else counting_fh)
+
+        tracemalloc.start()
+        func(source)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        benchmark.extra_info["io_calls"] = counting_fh.calls
+        benchmark.extra_info["peak_allocated"] = peak
+
+        benchmark(func, source)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mmap", [False, True], ids=["file", "mmap"])
+def test_benchmark_pe_sections(benchmark: BenchmarkFixture, mmap: bool) -> None:
+    def run(source: Source) -> None:
+        pe = PE(source)
+        for section in pe.sections:
+            hashlib.sha256(section.data).digest()
+        for module in pe.imports:
+            for function in module:
+                function.name  # noqa: B018
+
+    _measure(benchmark, absolute_path("_data/pe/32/PUNZIP.EXE"), mmap, run)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mmap", [False, True], ids=["file", "mmap"])
+def test_benchmark_elf_sections(benchmark: BenchmarkFixture, mmap: bool) -> None:
+    def run(source: Source) -> None:
+        elf = ELF(source)
+        for section in elf.sections:
+            hashlib.sha256(section.data).digest()
+
+    _measure(benchmark, absolute_path("_data/elf/hello_world.out"), mmap, run)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("cache_size", [0, DEFAULT_CACHE_SIZE], ids=["uncached", "cached"])
+def test_benchmark_pe_page_cache(benchmark: BenchmarkFixture, cache_size: int) -> None:
+    def run(source: Source) -> None:
+        pe = PE(source, cache_size=cache_size)
+        for module in pe.imports:
+            for function in module:
+                function.name  # noqa: B018
+        for resource in pe.resources:
+            resource.data()
+
+    _measure(benchmark, absolute_path("_data/pe/32/PUNZIP.EXE"), False, run)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("peek", [False, True], ids=["full", "peek"])
+def test_benchmark_pe_triage(benchmark: BenchmarkFixture, peek: bool) -> None:
+    paths = [path for bits in ("32", "64") for path in absolute_path(f"_data/pe/{bits}").iterdir()]
+    sources = [Source(io.BytesIO(path.read_bytes())) for path in paths]
+
+    def run() -> None:
+        for source in sources:
+            if peek:
+                summary = PE.peek(source)
+                (summary.machine, summary.timestamp, summary.subsystem, summary.is_64bit())
+            else:
+                pe = PE(source)
+                (pe.machine, pe.timestamp, pe.optional_header.Subsystem, pe.is_64bit())
+
+    benchmark(run)
+    benchmark.extra_info["files_per_second"] = len(sources) / benchmark.stats.stats.mean
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", ["objects", "arrays"])
+def test_benchmark_pe_base_relocations(benchmark: BenchmarkFixture, mode: str) -> None:
+    source = Source(io.BytesIO(absolute_path("_data/pe/32/PUNZIP.EXE").read_bytes()))
+
+    def run() -> None:
+        directory = PE(source).base_relocations
+        if mode == "objects":
+            [(entry.type, entry.rva) for entry in directory.entries]
+        else:
+            directory.arrays  # noqa: B018
+
+    benchmark(run)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dissect.executable.cache import PageCache
+
+
+def test_page_cache() -> None:
+    buf = bytes(range(256)) * 4
+    reads = []
+
+    def load(offset: int, size: int) -> bytes:
+        reads.append((offset, size))
+        return buf[offset : offset + size]
+
+    cache = PageCache(load, 0x10, 0x40)
+    assert cache.max_pages == 4
+
+    assert cache.read(0x4, 0x4) == buf[0x4:0x8]
+    assert cache.read(0x8, 0x4) == buf[0x8:0xC]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert reads == [(0x0, 0x10)]
+
+    # Crossing a page boundary
+    assert cache.read(0xC, 0x8) == buf[0xC:0x14]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Fill the cache and evict the least recently used page (page 1)
+    cache.read(0x0, 1)
+    cache.read(0x20, 1)
+    cache.read(0x30, 1)
+    cache.read(0x40, 1)
+    assert len(cache) == 4
+    reads.clear()
+    cache.read(0x10, 1)
+    assert reads == [(0x10, 0x10)]
+
+    # Large reads bypass the cache
+    reads.clear()
+    assert cache.read(0x0, 0x100) == buf[:0x100]
+    assert reads == [(0x0, 0x100)]
+
+    # Reads past the end return short pages
+    assert cache.read(0x3FC, 0x10) == buf[0x3FC:]
+    assert cache.read(0x400, 0x10) == b""
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
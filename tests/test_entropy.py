@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import math
+import os
+from collections import Counter
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+
+from dissect.executable import entropy as entropy_module
+from dissect.executable.entropy import entropy, entropy_curve, histogram
+
+
+def _entropy(buf: bytes) -> float:
+    return -sum(count / len(buf) * math.log2(count / len(buf)) for count in Counter(buf).values()) if buf else 0.0
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_entropy(numpy: bool) -> None:
+    if numpy:
+        pytest.importorskip("numpy")
+
+    buf = os.urandom(0x1000) + bytes(range(256)) * 8 + b"\x00" * 0x1000
+
+    with patch.object(entropy_module, "HAS_NUMPY", numpy):
+        assert histogram(buf) == [buf.count(value) for value in range(256)]
+        assert entropy(b"") == 0.0
+        assert entropy(b"\x00" * 100) == 0.0
+        assert entropy(bytes(range(256))) == pytest.approx(8.0)
+
+        # Buffers and streams, in chunks that do not divide the data evenly
+        assert entropy(buf, chunk_size=0x333) == pytest.approx(_entropy(buf))
+        assert entropy(BytesIO(buf), chunk_size=0x333) == pytest.approx(_entropy(buf))
+
+        for window, step in [(256, None), (256, 64), (1000, 300)]:
+            expected = [_entropy(buf[idx : idx + window]) for idx in range(0, len(buf) - window + 1, step or window)]
+            assert list(entropy_curve(buf, window, step, chunk_size=0x555)) == pytest.approx(expected)
+            assert list(entropy_curve(BytesIO(buf), window, step, chunk_size=0x555)) == pytest.approx(expected)
+
+        assert len(entropy_curve(b"\x00" * 255)) == 0
+
+        with pytest.raises(ValueError, match="Invalid window size"):
+            entropy_curve(buf, 0)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import mmap
+from io import BytesIO
+
+import pytest
+
+from dissect.executable.source import Source
+from tests._utils import absolute_path
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_source_from_path(use_mmap: bool) -> None:
+    path = absolute_path("_data/pe/32/Dummy.dll")
+    expected = path.read_bytes()
+
+    source = Source.from_path(path, mmap=use_mmap)
+    assert source.mapped == use_mmap
+    assert source.read_at(0, 2) == b"MZ"
+    assert source.read_at(0x40, 0x10) == expected[0x40:0x50]
+    assert bytes(source.view(0x80, 0x20)) == expected[0x80:0xA0]
+    assert isinstance(source.view(0, 2).obj, mmap.mmap) == use_mmap
+
+    source.close()
+    assert source.fh.closed
+
+
+def test_source_wrap() -> None:
+    fh = BytesIO(b"\x00" * 16)
+    source = Source.wrap(fh)
+
+    assert source.fh is fh
+    assert not source.mapped
+    assert Source.wrap(source) is source
+
+
+def test_source_read_at() -> None:
+    fh = BytesIO(bytes(range(256)))
+    fh.seek(10)
+
+    source = Source(fh)
+    assert source.size == 256
+    assert source.read_at(0x80, 4) == b"\x80\x81\x82\x83"
+    assert source.read_at(0xFE, 4) == b"\xfe\xff"
+
+    stream = source.open(0x10, 0x20)
+    assert stream.read(4) == b"\x10\x11\x12\x13"
+    assert source.read_at(0, 2) == b"\x00\x01"
+    assert len(stream.read()) == 0x1C
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+from io import BytesIO
+
+import pytest
+
+from dissect.executable.strings import ASCII, UTF16LE, String, strings
+
+
+def test_strings() -> None:
+    buf = b"\x00abc\x00abcd\x01" + "wide".encode("utf-16-le") + b"\xff\ttab\tbed\x00" + "wid".encode("utf-16-le")
+
+    assert list(strings(buf)) == [
+        String(5, ASCII, "abcd"),
+        String(10, UTF16LE, "wide"),
+        String(19, ASCII, "\ttab\tbed"),
+    ]
+    assert list(strings(buf, min_length=3, encodings=[UTF16LE], base=0x1000, section="section")) == [
+        String(0x100A, UTF16LE, "wide", "section"),
+        # The NUL terminator of the ASCII string doubles as the second byte of a UTF-16 character
+        String(0x101A, UTF16LE, "dwid", "section"),
+    ]
+    assert [string.value for string in strings(buf, encodings=[ASCII])] == ["abcd", "\ttab\tbed"]
+
+    with pytest.raises(ValueError, match="Unsupported encoding"):
+        list(strings(buf, encodings=["utf-8"]))
+
+    with pytest.raises(ValueError, match="Invalid minimum length"):
+        list(strings(buf, min_length=0))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_strings_chunked(chunk_size: int) -> None:
+    """Test that strings crossing the boundary of a chunk are found exactly once."""
+    parts = [os.urandom(16)]
+    for idx in range(50):
+        value = f"string{idx}" * (idx % 5 + 1)
+        parts.append(value.encode("utf-16-le") if idx % 2 else value.encode())
+        parts.append(os.urandom(idx % 7 + 1))
+    buf = b"".join(parts)
+
+    assert list(strings(BytesIO(buf), chunk_size=chunk_size)) == list(strings(buf))